@@ -1,4 +1,19 @@
-"""Create configured argparse's parser."""
+"""
+Create configured argparse's parser.
+
+Modules only some features need, like json, asyncio or the daemon's socket,
+are imported by the functions that use them, so a CLI's startup only imports
+what the called command runs.
+"""
+
+import os
 
 # https://github.com/mateusoliveira43/cly
 __version__ = "1.1.3"  # major.minor.patch
+
+if os.environ.get("CLY_PROFILE_STARTUP") is not None:
+    # Started before the CLI imports cly.config and its commands' modules, so
+    # their imports are profiled too
+    from .profiler import start_profiler
+
+    start_profiler([])
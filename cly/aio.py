@@ -0,0 +1,155 @@
+"""Async commands, run on an event loop managed by CLY?!."""
+
+import asyncio
+import functools
+import sys
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from .hooks import INTERRUPTED_STATUS
+
+LoopFactory = Callable[[], asyncio.AbstractEventLoop]
+Result = TypeVar("Result")
+
+
+def cancel_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Cancel loop's pending tasks, waiting for them to finish.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        Event loop.
+
+    """
+    tasks = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+def run_coroutine(
+    coroutine: Coroutine[Any, Any, Result],
+    loop_factory: Optional[LoopFactory] = None,
+) -> Result:
+    """
+    Run coroutine in a new event loop, like ``asyncio.run``.
+
+    On Ctrl+C, the coroutine is cancelled, so its ``finally`` blocks and
+    context managers run, before the script exits.
+
+    Parameters
+    ----------
+    coroutine : Coroutine[Any, Any, Result]
+        Coroutine returned by an async command.
+    loop_factory : Optional[LoopFactory]
+        Function that creates the event loop, like ``uvloop.new_event_loop``,
+        by default None (asyncio's default event loop).
+
+    Returns
+    -------
+    Result
+        Coroutine's result.
+
+    Raises
+    ------
+    SystemExit
+        With status 130, if interrupted by Ctrl+C.
+
+    """
+    loop = loop_factory() if loop_factory else asyncio.new_event_loop()
+    task = loop.create_task(coroutine)
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(task)
+    except KeyboardInterrupt:
+        if not task.done():
+            task.cancel()
+            try:
+                loop.run_until_complete(task)
+            except asyncio.CancelledError:
+                pass
+        sys.stderr.write("KeyboardInterrupt\n")
+        raise SystemExit(INTERRUPTED_STATUS) from None
+    finally:
+        try:
+            cancel_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+async def gather_limited(
+    awaitables: Iterable[Awaitable[Result]], limit: Optional[int] = None
+) -> List[Result]:
+    """
+    Await concurrently, with at most limit awaitables running at a time.
+
+    Parameters
+    ----------
+    awaitables : Iterable[Awaitable[Result]]
+        Awaitables, like coroutines. Tasks are already running, so the limit
+        only applies to coroutines.
+    limit : Optional[int]
+        Maximum number of awaitables running at a time, by default None (no
+        limit).
+
+    Returns
+    -------
+    List[Result]
+        Awaitables' results, in their order.
+
+    Raises
+    ------
+    ValueError
+        If limit is less than 1.
+
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f"Invalid limit {limit}. It must be at least 1.")
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def run(awaitable: Awaitable[Result]) -> Result:
+        if semaphore is None:
+            return await awaitable
+        async with semaphore:
+            return await awaitable
+
+    return list(await asyncio.gather(*(run(item) for item in awaitables)))
+
+
+async def run_blocking(
+    function: Callable[..., Result], *args: Any, **kwargs: Any
+) -> Result:
+    """
+    Run blocking function in a thread, without blocking the event loop.
+
+    Parameters
+    ----------
+    function : Callable[..., Result]
+        Blocking function, like ``subprocess.run``.
+    *args : Any
+        Function's positional arguments.
+    **kwargs : Any
+        Function's key words arguments.
+
+    Returns
+    -------
+    Result
+        Function's return.
+
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        None, functools.partial(function, *args, **kwargs)
+    )
@@ -0,0 +1,54 @@
+"""Hidden options of CLY?! parsers, handled before argparse parses them."""
+
+from typing import List, Optional, Tuple
+
+
+def pop_option(
+    arguments: List[str], option: str, takes_value: bool = False
+) -> Tuple[Optional[str], List[str]]:
+    """
+    Remove option from arguments, getting its value.
+
+    The value can be passed as ``--option=value``; if passed as ``--option``,
+    its value is an empty string, unless the option takes a value, that can
+    then be passed as ``--option value``. Arguments after ``--`` are left
+    untouched.
+
+    Parameters
+    ----------
+    arguments : List[str]
+        Arguments the script was called with.
+    option : str
+        Option to be removed, like ``--cly-option``.
+    takes_value : bool
+        If the argument after the option is its value, when it is not an
+        option itself, by default False.
+
+    Returns
+    -------
+    Tuple[Optional[str], List[str]]
+        Option's value (None if option was not passed) and remaining
+        arguments.
+
+    """
+    value: Optional[str] = None
+    remaining: List[str] = []
+    index = 0
+    while index < len(arguments):
+        argument = arguments[index]
+        index += 1
+        if argument == "--":
+            remaining.extend(arguments[index - 1 :])
+            break
+        if argument == option:
+            value = ""
+            if takes_value and index < len(arguments):
+                following = arguments[index]
+                if following == "-" or not following.startswith("-"):
+                    value = following
+                    index += 1
+        elif argument.startswith(f"{option}="):
+            value = argument[len(option) + 1 :]
+        else:
+            remaining.append(argument)
+    return value, remaining
@@ -0,0 +1,472 @@
+"""Batch mode: run many argument lines through one CLI process."""
+
+import contextlib
+import io
+import json
+import shlex
+import sys
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    cast,
+)
+
+from .arguments import pop_option
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .config import ConfiguredParser
+
+BATCH_JOBS_OPTION = "--cly-batch-jobs"
+BATCH_POOL_OPTION = "--cly-batch-pool"
+BATCH_FORMAT_OPTION = "--cly-batch-format"
+BATCH_POOLS = ("thread", "process")
+BATCH_FORMATS = ("text", "json")
+COMMENT_START = "#"
+JSON_START = "["
+Runner = Callable[[List[str]], int]
+RUNNER: Optional[Runner] = None
+
+
+class ThreadLocalStream:
+    """Stream that writes to the current thread's capture, if any."""
+
+    stream: TextIO
+    local: threading.local
+
+    def __init__(self, stream: TextIO) -> None:
+        """
+        Create stream that proxies stream.
+
+        Parameters
+        ----------
+        stream : TextIO
+            Stream written to by threads that are not capturing.
+
+        """
+        self.stream = stream
+        self.local = threading.local()
+
+    def get_stream(self) -> TextIO:
+        """
+        Get stream the current thread writes to.
+
+        Returns
+        -------
+        TextIO
+            Current thread's capture, if any; else, the proxied stream.
+
+        """
+        captured: Optional[TextIO] = getattr(self.local, "captured", None)
+        return self.stream if captured is None else captured
+
+    def write(self, text: str) -> int:
+        """
+        Write text to the current thread's stream.
+
+        Parameters
+        ----------
+        text : str
+            Text to be written.
+
+        Returns
+        -------
+        int
+            Number of characters written.
+
+        """
+        return self.get_stream().write(text)
+
+    def flush(self) -> None:
+        """Flush the current thread's stream."""
+        self.get_stream().flush()
+
+    @contextlib.contextmanager
+    def capture(self) -> Iterator[io.StringIO]:
+        """
+        Capture what the current thread writes.
+
+        Yields
+        ------
+        io.StringIO
+            Captured text.
+
+        """
+        self.local.captured = io.StringIO()
+        try:
+            yield self.local.captured
+        finally:
+            self.local.captured = None
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Get attribute of the current thread's stream, like ``isatty``.
+
+        Parameters
+        ----------
+        name : str
+            Attribute's name.
+
+        Returns
+        -------
+        Any
+            Attribute's value.
+
+        """
+        return getattr(self.get_stream(), name)
+
+
+class BatchResult:
+    """Exit status and captured output of a batch line."""
+
+    line: int
+    arguments: List[str]
+    status: int
+    stdout: str
+    stderr: str
+
+    def __init__(
+        self,
+        line: int,
+        arguments: List[str],
+        status: int,
+        stdout: str = "",
+        stderr: str = "",
+    ) -> None:
+        """
+        Create batch line's result.
+
+        Parameters
+        ----------
+        line : int
+            Line's number in the batch input, starting at 1.
+        arguments : List[str]
+            Arguments the CLI was run with.
+        status : int
+            Exit status.
+        stdout : str
+            Captured standard output, by default empty.
+        stderr : str
+            Captured standard error, by default empty.
+
+        """
+        self.line = line
+        self.arguments = arguments
+        self.status = status
+        self.stdout = stdout
+        self.stderr = stderr
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get result as a JSON serializable dict.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Result's data.
+
+        """
+        return {
+            "line": self.line,
+            "arguments": self.arguments,
+            "status": self.status,
+            "stdout": self.stdout,
+            "stderr": self.stderr,
+        }
+
+
+def parse_batch_line(line: str) -> Optional[List[str]]:
+    """
+    Get arguments from a batch line.
+
+    Parameters
+    ----------
+    line : str
+        Shell-quoted arguments, like ``identify --name 'Alfred P.'``, or
+        JSON array of strings, like ``["identify", "--name", "Alfred P."]``.
+
+    Returns
+    -------
+    Optional[List[str]]
+        Arguments, or None if line is empty or a comment.
+
+    Raises
+    ------
+    ValueError
+        If line can not be parsed.
+
+    """
+    line = line.strip()
+    if not line or line.startswith(COMMENT_START):
+        return None
+    if not line.startswith(JSON_START):
+        return shlex.split(line)
+    arguments = json.loads(line)
+    if not all(isinstance(argument, str) for argument in arguments):
+        raise ValueError("JSON arguments must be strings.")
+    return cast(List[str], arguments)
+
+
+@contextlib.contextmanager
+def thread_local_streams() -> Iterator[None]:
+    """
+    Replace ``sys.stdout`` and ``sys.stderr`` by thread local streams.
+
+    Yields
+    ------
+    None
+        While streams are replaced.
+
+    """
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = cast(TextIO, ThreadLocalStream(stdout))
+    sys.stderr = cast(TextIO, ThreadLocalStream(stderr))
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+
+def run_batch_line(item: Tuple[int, str]) -> BatchResult:
+    """
+    Run batch line with the batch's runner, capturing its output.
+
+    It is a module function, so process pools can call it.
+
+    Parameters
+    ----------
+    item : Tuple[int, str]
+        Line's number and text.
+
+    Returns
+    -------
+    BatchResult
+        Line's result.
+
+    Raises
+    ------
+    RuntimeError
+        If it is not called by ``run_batch``.
+
+    """
+    stdout, stderr = sys.stdout, sys.stderr
+    if (
+        RUNNER is None
+        or not isinstance(stdout, ThreadLocalStream)
+        or not isinstance(stderr, ThreadLocalStream)
+    ):
+        raise RuntimeError("Batch lines can only be run by run_batch.")
+    number, line = item
+    arguments: List[str] = []
+    with stdout.capture() as captured_stdout:
+        with stderr.capture() as captured_stderr:
+            try:
+                arguments = parse_batch_line(line) or []
+                status = RUNNER(arguments)
+            except ValueError as error:
+                sys.stderr.write(f"Invalid batch line {number}: {error}\n")
+                status = 2
+    return BatchResult(
+        number,
+        arguments,
+        status,
+        captured_stdout.getvalue(),
+        captured_stderr.getvalue(),
+    )
+
+
+def read_batch_lines(source: str) -> List[Tuple[int, str]]:
+    """
+    Read batch lines that have arguments.
+
+    Parameters
+    ----------
+    source : str
+        Path of the batch file, or ``-`` to read from stdin.
+
+    Returns
+    -------
+    List[Tuple[int, str]]
+        Number and text of each line that is not empty nor a comment.
+
+    """
+    if source == "-":
+        lines = sys.stdin.readlines()
+    else:
+        with open(source, mode="r", encoding="utf-8") as file:
+            lines = file.readlines()
+    return [
+        (number, line)
+        for number, line in enumerate(lines, start=1)
+        if line.strip() and not line.strip().startswith(COMMENT_START)
+    ]
+
+
+def map_batch_lines(
+    items: List[Tuple[int, str]], jobs: int, pool: str
+) -> Iterator[BatchResult]:
+    """
+    Run batch lines, in a pool of workers if more than one job is allowed.
+
+    Parameters
+    ----------
+    items : List[Tuple[int, str]]
+        Number and text of each line.
+    jobs : int
+        Maximum number of lines run at the same time.
+    pool : str
+        Kind of workers: thread or process. Processes are forked, so they
+        share the CLI loaded by the batch's process.
+
+    Yields
+    ------
+    BatchResult
+        Results, in the lines' order, as soon as they are available.
+
+    """
+    if jobs == 1:
+        yield from map(run_batch_line, items)
+        return
+    # pylint: disable=import-outside-toplevel
+    import multiprocessing
+    from concurrent import futures
+
+    executor: futures.Executor = (
+        futures.ThreadPoolExecutor(jobs)
+        if pool == "thread"
+        else futures.ProcessPoolExecutor(
+            jobs, mp_context=multiprocessing.get_context("fork")
+        )
+    )
+    with executor:
+        yield from executor.map(run_batch_line, items)
+
+
+def write_batch_result(result: BatchResult, output_format: str) -> None:
+    """
+    Write batch line's result.
+
+    Parameters
+    ----------
+    result : BatchResult
+        Line's result.
+    output_format : str
+        text, to write captured output as it is, or json, to write a JSON
+        line with the line's number, arguments, status and output.
+
+    """
+    if output_format == "json":
+        sys.stdout.write(f"{json.dumps(result.to_dict())}\n")
+    else:
+        sys.stdout.write(result.stdout)
+        sys.stderr.write(result.stderr)
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+
+def run_batch(
+    run: Runner,
+    source: str,
+    jobs: int = 1,
+    pool: str = "thread",
+    output_format: str = "text",
+) -> int:
+    """
+    Run a CLI with each line of a batch, writing results in lines' order.
+
+    Parameters
+    ----------
+    run : Runner
+        Function that runs the CLI with arguments, returning exit status.
+    source : str
+        Path of the batch file, or ``-`` to read from stdin.
+    jobs : int
+        Maximum number of lines run at the same time, by default 1.
+    pool : str
+        Kind of workers: thread or process, by default thread.
+    output_format : str
+        text or json, by default text.
+
+    Returns
+    -------
+    int
+        0 if every line succeeded; else, 1.
+
+    Raises
+    ------
+    ValueError
+        If jobs, pool or output format are not valid.
+
+    """
+    global RUNNER  # pylint: disable=global-statement
+    if jobs < 1:
+        raise ValueError(f"Invalid batch jobs {jobs}. It must be at least 1.")
+    if pool not in BATCH_POOLS:
+        raise ValueError(
+            f"Invalid batch pool {pool!r}. "
+            f"Valid pools are {', '.join(BATCH_POOLS)}."
+        )
+    if output_format not in BATCH_FORMATS:
+        raise ValueError(
+            f"Invalid batch format {output_format!r}. "
+            f"Valid formats are {', '.join(BATCH_FORMATS)}."
+        )
+    items = read_batch_lines(source)
+    RUNNER = run
+    failed = False
+    try:
+        with thread_local_streams():
+            for result in map_batch_lines(items, jobs, pool):
+                write_batch_result(result, output_format)
+                failed = failed or result.status != 0
+    finally:
+        RUNNER = None
+    return int(failed)
+
+
+def run_batch_option(
+    cli: "ConfiguredParser", source: str, arguments: List[str]
+) -> None:
+    """
+    Run CLI with each line of a batch, as set by ``--cly-batch``.
+
+    Parameters
+    ----------
+    cli : ConfiguredParser
+        CLI to run each line with.
+    source : str
+        Path of the batch file, or ``-`` to read from stdin.
+    arguments : List[str]
+        Remaining arguments, with batch's hidden options:
+        ``--cly-batch-jobs=N``, ``--cly-batch-pool=thread|process`` and
+        ``--cly-batch-format=text|json``.
+
+    Raises
+    ------
+    SystemExit
+        With batch's exit status, or if its options are not valid.
+
+    """
+    jobs, arguments = pop_option(arguments, BATCH_JOBS_OPTION, True)
+    pool, arguments = pop_option(arguments, BATCH_POOL_OPTION, True)
+    output_format, arguments = pop_option(arguments, BATCH_FORMAT_OPTION, True)
+    if arguments:
+        cli.parser.error(f"unrecognized arguments: {' '.join(arguments)}")
+    try:
+        status = run_batch(
+            cli.run_arguments,
+            source or "-",
+            int(jobs or 1),
+            pool or "thread",
+            output_format or "text",
+        )
+    except (OSError, ValueError) as error:
+        cli.parser.error(str(error))
+    raise SystemExit(status)
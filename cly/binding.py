@@ -0,0 +1,158 @@
+"""Binding of parsed arguments to commands' parameters."""
+
+import functools
+import inspect
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+COMMANDS_DEST = "commands"
+
+
+class BindingPlan:
+    """How to call a function with the arguments in argparse's namespace."""
+
+    positional: Tuple[str, ...]
+    keywords: Tuple[str, ...]
+    var_positional: Optional[str]
+    var_keyword: bool
+    consumed: Tuple[str, ...]
+
+    def __init__(self, signature: Optional[inspect.Signature]) -> None:
+        """
+        Compile binding plan from function's signature.
+
+        Parameters
+        ----------
+        signature : Optional[inspect.Signature]
+            Function's signature. If None (signature not available), all
+            arguments are passed as key words arguments.
+
+        """
+        positional: List[str] = []
+        keywords: List[str] = []
+        self.var_positional = None
+        self.var_keyword = signature is None
+        parameters = signature.parameters.values() if signature else ()
+        has_var_positional = any(
+            param.kind == param.VAR_POSITIONAL for param in parameters
+        )
+        for param in parameters:
+            if param.kind == param.POSITIONAL_ONLY or (
+                param.kind == param.POSITIONAL_OR_KEYWORD
+                and has_var_positional
+            ):
+                positional.append(param.name)
+            elif param.kind == param.VAR_POSITIONAL:
+                self.var_positional = param.name
+            elif param.kind == param.VAR_KEYWORD:
+                self.var_keyword = True
+            else:
+                keywords.append(param.name)
+        self.positional = tuple(positional)
+        self.keywords = tuple(keywords)
+        self.consumed = (
+            *positional,
+            *keywords,
+            *((self.var_positional,) if self.var_positional else ()),
+            COMMANDS_DEST,
+        )
+
+    def bind(self, kwargs: Dict[str, Any]) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        Get function's arguments from arguments in argparse's namespace.
+
+        Missing arguments are not passed, so function's defaults are used.
+
+        Parameters
+        ----------
+        kwargs : Dict[str, Any]
+            Arguments in argparse's namespace.
+
+        Returns
+        -------
+        Tuple[List[Any], Dict[str, Any]]
+            Positional and key words arguments to call the function with.
+
+        """
+        args: List[Any] = []
+        for name in self.positional:
+            if name not in kwargs:
+                break
+            args.append(kwargs[name])
+        else:
+            if self.var_positional in kwargs:
+                args.extend(kwargs[self.var_positional])
+        call_kwargs = {
+            name: kwargs[name] for name in self.keywords if name in kwargs
+        }
+        if self.var_keyword:
+            for name, value in kwargs.items():
+                if name not in self.consumed:
+                    call_kwargs[name] = value
+        return args, call_kwargs
+
+    def select(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get arguments in argparse's namespace that function receives.
+
+        Parameters
+        ----------
+        kwargs : Dict[str, Any]
+            Arguments in argparse's namespace.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Arguments function receives, by name.
+
+        """
+        names = self.positional + (
+            (self.var_positional,) if self.var_positional else ()
+        )
+        selected = {name: kwargs[name] for name in names if name in kwargs}
+        selected.update(self.bind(kwargs)[1])
+        return selected
+
+    def call(
+        self, function: Callable[..., Any], kwargs: Dict[str, Any]
+    ) -> Any:
+        """
+        Call function with arguments in argparse's namespace.
+
+        Parameters
+        ----------
+        function : Callable[..., Any]
+            Function to be called.
+        kwargs : Dict[str, Any]
+            Arguments in argparse's namespace.
+
+        Returns
+        -------
+        Any
+            Function's return.
+
+        """
+        args, call_kwargs = self.bind(kwargs)
+        return function(*args, **call_kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_binding(function: Callable[..., Any]) -> BindingPlan:
+    """
+    Compile function's binding plan, only once.
+
+    Parameters
+    ----------
+    function : Callable[..., Any]
+        Function that represents a command.
+
+    Returns
+    -------
+    BindingPlan
+        Function's binding plan.
+
+    """
+    try:
+        signature: Optional[inspect.Signature] = inspect.signature(function)
+    except (TypeError, ValueError):
+        signature = None
+    return BindingPlan(signature)
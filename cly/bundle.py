@@ -0,0 +1,504 @@
+"""
+Bundle a CLI and CLY?! into a single zipapp, with warm caches.
+
+Usage: ``python -m cly.bundle PACKAGE [--main MODULE:CLI] [--output FILE]``.
+
+The bundle has precompiled bytecode, the resolved commands' manifest and the
+rendered help messages, which its startup shim extracts to a cache folder on
+its first run.
+"""
+
+import argparse
+import hashlib
+import os
+import py_compile
+import shutil
+import subprocess  # nosec
+import sys
+import tempfile
+import time
+import zipapp
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .cache import CACHE_DIR_VARIABLE, CACHE_HELP_VARIABLE, read_json
+from .completion import COMPLETION_FILE
+
+CACHE_FOLDER = ".cly-cache"
+DEFAULT_INTERPRETER = "/usr/bin/env python3"
+DEFAULT_MAIN = "{package}.__main__:CLI"
+TIMING_ARGUMENTS = ["--help"]
+IGNORED_FILES = shutil.ignore_patterns("__pycache__", "*.pyc", "*.pyo")
+SHIM = '''\
+"""Start {main}, bundled by cly.bundle."""
+
+import os
+import sys
+
+BUILD = {build!r}
+CACHE_FILES = {cache_files!r}
+
+
+def prepare_cache_dir():
+    """Extract bundled caches on the first run, and make CLY?! use them."""
+    os.environ.setdefault("{help_variable}", "1")
+    if os.environ.get("{dir_variable}"):
+        return
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    cache_dir = os.path.join(root, "cly", BUILD)
+    os.environ["{dir_variable}"] = cache_dir
+    if os.path.isdir(cache_dir):
+        return
+    try:
+        for name in CACHE_FILES:
+            path = os.path.join(cache_dir, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(__loader__.get_data("{cache_folder}/" + name))
+    except OSError:
+        pass
+
+
+prepare_cache_dir()
+CLI = getattr(__import__({module!r}, fromlist=["_"]), {attribute!r})
+# Help messages show the bundle's name, not its path, so the bundled ones are
+# used wherever the bundle is
+CLI.set_prog(os.path.basename(sys.argv[0]))
+CLI()
+'''
+
+
+def parse_main(main: str) -> Tuple[str, str]:
+    """
+    Split CLI's import path in module and attribute.
+
+    Parameters
+    ----------
+    main : str
+        Import path of the CLI's ``ConfiguredParser``, like ``module:CLI``.
+
+    Returns
+    -------
+    Tuple[str, str]
+        Module and attribute.
+
+    Raises
+    ------
+    ValueError
+        If main is not in the ``module:attribute`` format.
+
+    """
+    module, _, attribute = main.partition(":")
+    if not module or not attribute.isidentifier():
+        raise ValueError(
+            f"Invalid main {main!r}. It must be like package.module:CLI."
+        )
+    return module, attribute
+
+
+def iter_files(folder: Path) -> Iterator[Path]:
+    """
+    Iterate over folder's files, recursively, in a stable order.
+
+    Parameters
+    ----------
+    folder : pathlib.Path
+        Folder.
+
+    Yields
+    ------
+    pathlib.Path
+        Files' paths.
+
+    """
+    for path in sorted(folder.rglob("*")):
+        if path.is_file():
+            yield path
+
+
+def get_build_id(folder: Path, name: str) -> str:
+    """
+    Get identifier of a bundle's content.
+
+    Parameters
+    ----------
+    folder : pathlib.Path
+        Folder with the bundle's sources.
+    name : str
+        Bundle's name.
+
+    Returns
+    -------
+    str
+        Bundle's name followed by a hash of its files.
+
+    """
+    content = hashlib.sha256()
+    for path in iter_files(folder):
+        content.update(path.relative_to(folder).as_posix().encode("utf-8"))
+        content.update(path.read_bytes())
+    return f"{name}-{content.hexdigest()[:16]}"
+
+
+def compile_folder(folder: Path) -> None:
+    """
+    Compile folder's modules, next to their sources, like zipimport wants.
+
+    Bytecode is not checked against the sources, so it is loaded without
+    reading them.
+
+    Parameters
+    ----------
+    folder : pathlib.Path
+        Folder with the bundle's sources.
+
+    """
+    invalidation_mode = py_compile.PycInvalidationMode.UNCHECKED_HASH
+    for path in list(iter_files(folder)):
+        if path.suffix == ".py":
+            py_compile.compile(
+                str(path),
+                cfile=str(path.with_suffix(".pyc")),
+                dfile=path.relative_to(folder).as_posix(),
+                doraise=True,
+                invalidation_mode=invalidation_mode,
+            )
+
+
+def write_shim(
+    folder: Path, main: str, build: str, cache_files: List[str]
+) -> None:
+    """
+    Write bundle's ``__main__.py``, that starts the CLI.
+
+    Parameters
+    ----------
+    folder : pathlib.Path
+        Folder with the bundle's sources.
+    main : str
+        Import path of the CLI's ``ConfiguredParser``, like ``module:CLI``.
+    build : str
+        Bundle's identifier, that names its cache folder.
+    cache_files : List[str]
+        Paths of the bundled caches, relative to the cache folder.
+
+    """
+    module, attribute = parse_main(main)
+    (folder / "__main__.py").write_text(
+        SHIM.format(
+            main=main,
+            build=build,
+            cache_files=tuple(cache_files),
+            help_variable=CACHE_HELP_VARIABLE,
+            dir_variable=CACHE_DIR_VARIABLE,
+            cache_folder=CACHE_FOLDER,
+            module=module,
+            attribute=attribute,
+        ),
+        encoding="utf-8",
+    )
+
+
+def get_environment(**variables: str) -> Dict[str, str]:
+    """
+    Get environment to run CLIs, without cache and terminal settings.
+
+    Parameters
+    ----------
+    **variables : str
+        Variables to be set.
+
+    Returns
+    -------
+    Dict[str, str]
+        Environment variables.
+
+    """
+    environment = {
+        name: value
+        for name, value in os.environ.items()
+        if name not in (CACHE_DIR_VARIABLE, CACHE_HELP_VARIABLE, "COLUMNS")
+    }
+    environment.update(variables)
+    return environment
+
+
+def get_command_paths(tree: Dict[str, Any]) -> Iterator[List[str]]:
+    """
+    Iterate over the commands of a completion table.
+
+    Parameters
+    ----------
+    tree : Dict[str, Any]
+        Completion table of a parser.
+
+    Yields
+    ------
+    List[str]
+        Names that call each command, like ``["group", "command"]``.
+
+    """
+    commands = tree.get("commands")
+    for name, table in commands.items() if isinstance(commands, dict) else ():
+        yield [name]
+        for path in get_command_paths(table):
+            yield [name, *path]
+
+
+def warm_caches(archive: Path, cache_dir: Path) -> List[str]:
+    """
+    Run the bundle's help messages, so CLY?! caches the resolved commands.
+
+    Parameters
+    ----------
+    archive : pathlib.Path
+        Bundle's path. It is run with the name it will have, since help
+        messages show it.
+    cache_dir : pathlib.Path
+        Folder the caches are written to.
+
+    Returns
+    -------
+    List[str]
+        Paths of the caches, relative to the cache folder.
+
+    """
+    environment = get_environment(
+        **{CACHE_DIR_VARIABLE: str(cache_dir), CACHE_HELP_VARIABLE: "1"}
+    )
+
+    def run(*arguments: str) -> None:
+        subprocess.run(  # nosec
+            [sys.executable, str(archive), *arguments],
+            env=environment,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+
+    run("--cly-completion=bash")
+    for table_path in cache_dir.rglob(COMPLETION_FILE):
+        tree = read_json(str(table_path)).get("tree", {})
+        for path in get_command_paths(tree):
+            run(*path, "--help")
+        table_path.unlink()
+    run("--help")
+    return [
+        path.relative_to(cache_dir).as_posix()
+        for path in iter_files(cache_dir)
+    ]
+
+
+def measure(
+    command: List[str], environment: Dict[str, str], runs: int
+) -> float:
+    """
+    Measure command's startup time.
+
+    Parameters
+    ----------
+    command : List[str]
+        Command to be run.
+    environment : Dict[str, str]
+        Command's environment variables.
+    runs : int
+        Number of measured runs, after a first run that warms caches.
+
+    Returns
+    -------
+    float
+        Shortest wall time of the runs, in seconds.
+
+    """
+    times = []
+    for _ in range(runs + 1):
+        start = time.perf_counter()
+        subprocess.run(  # nosec
+            command,
+            env=environment,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        times.append(time.perf_counter() - start)
+    return min(times[1:])
+
+
+def measure_startup(
+    archive: Path, package: Path, main: str, runs: int
+) -> Tuple[float, float]:
+    """
+    Measure startup time of the bundle and of the CLI run from source.
+
+    Parameters
+    ----------
+    archive : pathlib.Path
+        Bundle's path.
+    package : pathlib.Path
+        CLI's package folder.
+    main : str
+        Import path of the CLI's ``ConfiguredParser``, like ``module:CLI``.
+    runs : int
+        Number of measured runs of each.
+
+    Returns
+    -------
+    Tuple[float, float]
+        Shortest wall times of the bundle and of the source, in seconds.
+
+    """
+    module, attribute = parse_main(main)
+    with tempfile.TemporaryDirectory() as cache_home:
+        bundle_time = measure(
+            [sys.executable, str(archive), *TIMING_ARGUMENTS],
+            get_environment(XDG_CACHE_HOME=cache_home),
+            runs,
+        )
+    python_path = [
+        str(package.resolve().parent),
+        str(Path(__file__).parents[1]),
+    ]
+    source_time = measure(
+        [
+            sys.executable,
+            "-c",
+            f"import {module}; {module}.{attribute}()",
+            *TIMING_ARGUMENTS,
+        ],
+        get_environment(PYTHONPATH=os.pathsep.join(python_path)),
+        runs,
+    )
+    return bundle_time, source_time
+
+
+def build_bundle(
+    package: Path,
+    output: Path,
+    main: Optional[str] = None,
+    interpreter: str = DEFAULT_INTERPRETER,
+) -> Path:
+    """
+    Bundle CLI's package and CLY?! into a zipapp, with warm caches.
+
+    Parameters
+    ----------
+    package : pathlib.Path
+        CLI's package folder.
+    output : pathlib.Path
+        Bundle's path.
+    main : Optional[str]
+        Import path of the CLI's ``ConfiguredParser``, like ``module:CLI``,
+        by default None (``CLI`` in the package's ``__main__`` module).
+    interpreter : str
+        Interpreter of the bundle's shebang line, by default
+        ``/usr/bin/env python3``.
+
+    Returns
+    -------
+    pathlib.Path
+        Bundle's path.
+
+    Raises
+    ------
+    ValueError
+        If package is not a folder, or main is not valid.
+
+    """
+    if not package.is_dir():
+        raise ValueError(
+            f"Invalid package {str(package)!r}. It must be a folder."
+        )
+    main = main or DEFAULT_MAIN.format(package=package.resolve().name)
+    parse_main(main)
+    with tempfile.TemporaryDirectory() as temporary:
+        folder = Path(temporary) / "bundle"
+        shutil.copytree(
+            package, folder / package.resolve().name, ignore=IGNORED_FILES
+        )
+        shutil.copytree(
+            Path(__file__).parent, folder / "cly", ignore=IGNORED_FILES
+        )
+        build = get_build_id(folder, output.stem)
+        write_shim(folder, main, build, [])
+        compile_folder(folder)
+        zipapp.create_archive(folder, output, interpreter)
+        cache_dir = Path(temporary) / CACHE_FOLDER
+        cache_files = warm_caches(output, cache_dir)
+        shutil.copytree(cache_dir, folder / CACHE_FOLDER)
+        write_shim(folder, main, build, cache_files)
+        compile_folder(folder)
+        zipapp.create_archive(folder, output, interpreter)
+    return output
+
+
+def main(arguments: List[str]) -> int:
+    """
+    Bundle a CLI, and report its startup time.
+
+    Parameters
+    ----------
+    arguments : List[str]
+        Command line arguments.
+
+    Returns
+    -------
+    int
+        Exit status.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m cly.bundle",
+        description="Bundle a CLI and CLY?! into a single zipapp.",
+    )
+    parser.add_argument("package", type=Path, help="CLI's package folder.")
+    parser.add_argument(
+        "-m",
+        "--main",
+        help="CLI's ConfiguredParser, by default PACKAGE.__main__:CLI.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Bundle's path, by default PACKAGE.pyz.",
+    )
+    parser.add_argument(
+        "-p",
+        "--python",
+        default=DEFAULT_INTERPRETER,
+        help=(
+            "Interpreter of the shebang line, by default "
+            f"{DEFAULT_INTERPRETER}."
+        ),
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Runs to measure startup time, by default 5 (0 to skip it).",
+    )
+    options = parser.parse_args(arguments)
+    name = options.package.resolve().name
+    output = options.output or Path(f"{name}.pyz")
+    main_path = options.main or DEFAULT_MAIN.format(package=name)
+    try:
+        build_bundle(options.package, output, main_path, options.python)
+    except (ValueError, py_compile.PyCompileError) as error:
+        parser.error(str(error))
+    print(f"Bundled {options.package} into {output}.")
+    if options.runs > 0:
+        bundle_time, source_time = measure_startup(
+            output, options.package, main_path, options.runs
+        )
+        print(
+            f"Startup time of {' '.join(TIMING_ARGUMENTS)}: "
+            f"{bundle_time * 1000:.1f} ms bundled, "
+            f"{source_time * 1000:.1f} ms from source."
+        )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main(sys.argv[1:]))
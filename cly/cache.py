@@ -0,0 +1,522 @@
+"""On-disk caches to speed up CLI's warm starts."""
+
+import argparse
+import functools
+import os
+import re
+import shutil
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from .loader import DeferredParser, RecordedCalls, get_command_entry
+
+if TYPE_CHECKING:
+    from .config import ConfiguredParser
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_FORMAT = 1
+HELP_FILE = "help.json"
+HELP_FORMAT = 1
+CACHE_DIR_VARIABLE = "CLY_CACHE_DIR"
+CACHE_HELP_VARIABLE = "CLY_CACHE_HELP"
+ACTION_FIELDS = (
+    "option_strings",
+    "dest",
+    "nargs",
+    "const",
+    "default",
+    "type",
+    "choices",
+    "required",
+    "help",
+    "metavar",
+)
+
+
+def read_json(path: str) -> Dict[str, Any]:
+    """
+    Read JSON object from file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the JSON file.
+
+    Returns
+    -------
+    Dict[str, Any]
+        File's content, if it exists and is a valid JSON object; else, an
+        empty dict.
+
+    """
+    import json  # pylint: disable=import-outside-toplevel
+
+    try:
+        with open(path, mode="r", encoding="utf-8") as file:
+            content = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return content if isinstance(content, dict) else {}
+
+
+def write_json(path: str, content: Dict[str, Any]) -> None:
+    """
+    Write JSON object to file atomically.
+
+    Errors are ignored, since caches are optional.
+
+    Parameters
+    ----------
+    path : str
+        Path of the JSON file.
+    content : Dict[str, Any]
+        JSON object to be written.
+
+    """
+    # pylint: disable=import-outside-toplevel
+    import json
+    import tempfile
+
+    try:
+        folder = os.path.dirname(path) or os.curdir
+        os.makedirs(folder, exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(
+            dir=folder, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+        )
+        with os.fdopen(descriptor, mode="w", encoding="utf-8") as file:
+            json.dump(content, file, separators=(",", ":"))
+        os.replace(temporary_path, path)
+    except OSError:
+        return
+
+
+def get_default_cache_dir(name: str) -> Optional[str]:
+    """
+    Get CLI's cache folder from the ``CLY_CACHE_DIR`` environment variable.
+
+    Parameters
+    ----------
+    name : str
+        CLI's name. Each CLI, like command groups, gets its own folder.
+
+    Returns
+    -------
+    Optional[str]
+        CLI's folder in ``CLY_CACHE_DIR``, if it is set; else, None.
+
+    """
+    root = os.environ.get(CACHE_DIR_VARIABLE)
+    if not root:
+        return None
+    return os.path.join(root, re.sub(r"\W+", "-", name).strip("-").lower())
+
+
+def get_default_cache_help() -> bool:
+    """
+    Check if help messages are cached by default.
+
+    Returns
+    -------
+    bool
+        If the ``CLY_CACHE_HELP`` environment variable is set to 1.
+
+    """
+    return os.environ.get(CACHE_HELP_VARIABLE) == "1"
+
+
+def get_modification_time(path: str) -> int:
+    """
+    Get file's modification time.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+
+    Returns
+    -------
+    int
+        Modification time in nanoseconds, if file exists; else, -1.
+
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def describe(value: Any) -> Any:
+    """
+    Describe value with JSON serializable data that is stable between runs.
+
+    Parameters
+    ----------
+    value : Any
+        Value to be described, like parsers, actions and their arguments.
+
+    Returns
+    -------
+    Any
+        Value's description.
+
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [describe(item) for item in value]
+    if isinstance(value, dict):
+        return [[describe(key), describe(item)] for key, item in value.items()]
+    if isinstance(value, functools.partial):
+        return describe([value.func, value.args, value.keywords])
+    if isinstance(value, DeferredParser):
+        return describe([value.kwargs, value.setup, value.calls])
+    if isinstance(value, RecordedCalls):
+        return describe(value.calls)
+    if isinstance(value, argparse._SubParsersAction):
+        return describe(
+            [[action.dest, action.help] for action in value._choices_actions]
+        )
+    if isinstance(value, argparse.Action):
+        return describe(
+            [type(value)] + [getattr(value, field) for field in ACTION_FIELDS]
+        )
+    if isinstance(value, argparse.ArgumentParser):
+        return describe(
+            [
+                value.prog,
+                value.usage,
+                value.description,
+                value.epilog,
+                value.formatter_class,
+                [
+                    [group.title, group.description, group._group_actions]
+                    for group in value._action_groups
+                ],
+            ]
+        )
+    if hasattr(value, "__qualname__"):
+        return f"{getattr(value, '__module__', '')}.{value.__qualname__}"
+    return repr(value)
+
+
+class Manifest:
+    """Cache of the resolved command tree of a CLI."""
+
+    path: str
+    version: str
+    commands: Dict[str, Dict[str, Any]]
+    changed: bool
+
+    def __init__(self, path: str, version: str) -> None:
+        """
+        Load manifest from file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the manifest file.
+        version : str
+            CLI's version. The manifest is discarded if it was created by
+            another version.
+
+        """
+        self.path = path
+        self.version = version
+        content = read_json(path)
+        self.commands = (
+            content.get("commands", {})
+            if content.get("format") == MANIFEST_FORMAT
+            and content.get("version") == version
+            else {}
+        )
+        self.changed = False
+
+    def get_entry(self, name: str, target: str) -> Optional[Dict[str, Any]]:
+        """
+        Get command's entry, if it is still valid.
+
+        An entry is valid if the command still points to the same target and
+        the command's source file was not modified since the entry was created.
+
+        Parameters
+        ----------
+        name : str
+            Command's name.
+        target : str
+            Command's import path.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Command's entry, if valid; else, None.
+
+        """
+        entry = self.commands.get(name)
+        if (
+            entry is None
+            or entry.get("target") != target
+            or get_modification_time(entry.get("source", ""))
+            != entry.get("modification_time")
+        ):
+            return None
+        return entry
+
+    def set_entry(
+        self, name: str, target: str, source: str, **content: Any
+    ) -> Dict[str, Any]:
+        """
+        Create command's entry, replacing any previous one.
+
+        Parameters
+        ----------
+        name : str
+            Command's name.
+        target : str
+            Command's import path.
+        source : str
+            Path of the command's source file.
+        **content : Any
+            Command's resolved data, like summary and parameters' help.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Command's entry.
+
+        """
+        entry = {
+            "target": target,
+            "source": source,
+            "modification_time": get_modification_time(source),
+            **content,
+        }
+        self.commands[name] = entry
+        self.changed = True
+        return entry
+
+    def update_entry(self, name: str, **content: Any) -> None:
+        """
+        Update command's entry with more resolved data.
+
+        Parameters
+        ----------
+        name : str
+            Command's name.
+        **content : Any
+            Command's resolved data, like summary and parameters' help.
+
+        """
+        self.commands[name].update(content)
+        self.changed = True
+
+    def save(self) -> None:
+        """Write manifest to file, if it changed."""
+        if not self.changed:
+            return
+        write_json(
+            self.path,
+            {
+                "format": MANIFEST_FORMAT,
+                "version": self.version,
+                "commands": self.commands,
+            },
+        )
+        self.changed = False
+
+
+class HelpCache:
+    """Cache of the rendered help messages of a CLI."""
+
+    path: str
+    version: str
+    helps: Optional[Dict[str, str]]
+    changed: bool
+
+    def __init__(self, path: str, version: str) -> None:
+        """
+        Initialize help cache, only loading it from file when needed.
+
+        Parameters
+        ----------
+        path : str
+            Path of the help cache file.
+        version : str
+            CLI's version. The cache is discarded if it was created by another
+            version.
+
+        """
+        self.path = path
+        self.version = version
+        self.helps = None
+        self.changed = False
+
+    @staticmethod
+    def get_key(*parts: Any) -> str:
+        """
+        Get key of a help message.
+
+        The key also depends on the terminal width, since help messages are
+        wrapped to fit it.
+
+        Parameters
+        ----------
+        *parts : Any
+            Everything the help message depends on, like the parser.
+
+        Returns
+        -------
+        str
+            Help message's key.
+
+        """
+        # pylint: disable=import-outside-toplevel
+        import hashlib
+        import json
+
+        content = json.dumps(
+            describe(
+                [
+                    shutil.get_terminal_size().columns,
+                    os.environ.get("COLUMNS"),
+                    *parts,
+                ]
+            )
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def load(self) -> Dict[str, str]:
+        """
+        Load help messages from file, only once.
+
+        Returns
+        -------
+        Dict[str, str]
+            Help messages by key.
+
+        """
+        if self.helps is None:
+            content = read_json(self.path)
+            self.helps = (
+                content.get("helps", {})
+                if content.get("format") == HELP_FORMAT
+                and content.get("version") == self.version
+                else {}
+            )
+        return self.helps
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get help message.
+
+        Parameters
+        ----------
+        key : str
+            Help message's key.
+
+        Returns
+        -------
+        Optional[str]
+            Help message, if cached; else, None.
+
+        """
+        return self.load().get(key)
+
+    def set(self, key: str, help_message: str) -> None:
+        """
+        Store help message.
+
+        Parameters
+        ----------
+        key : str
+            Help message's key.
+        help_message : str
+            Rendered help message.
+
+        """
+        self.load()[key] = help_message
+        self.changed = True
+
+    def save(self) -> None:
+        """Write help messages to file, if they changed."""
+        if not self.changed:
+            return
+        write_json(
+            self.path,
+            {
+                "format": HELP_FORMAT,
+                "version": self.version,
+                "helps": self.load(),
+            },
+        )
+        self.changed = False
+
+
+def print_cached_help(
+    help_cache: HelpCache,
+    key: str,
+    get_parser: Callable[[], argparse.ArgumentParser],
+) -> None:
+    """
+    Print help message from cache, rendering and caching it if needed.
+
+    Parameters
+    ----------
+    help_cache : HelpCache
+        Cache of rendered help messages.
+    key : str
+        Help message's key.
+    get_parser : Callable[[], argparse.ArgumentParser]
+        Function to get the parser, only called if help message is not
+        cached.
+
+    Raises
+    ------
+    SystemExit
+        After help message is printed.
+
+    """
+    help_message = help_cache.get(key)
+    if help_message is None:
+        parser = get_parser()
+        help_message = parser.format_help()
+        help_cache.set(key, help_message)
+    from .pager import write_text  # pylint: disable=import-outside-toplevel
+
+    write_text([help_message])
+    raise SystemExit(0)
+
+
+def print_command_help(cli: "ConfiguredParser", name: str) -> None:
+    """
+    Print command's help message from cache, without creating its parser.
+
+    Parameters
+    ----------
+    cli : cly.config.ConfiguredParser
+        CLI the command belongs to.
+    name : str
+        Command's name.
+
+    """
+    if (
+        cli.help_cache is None
+        or cli.subparser is None
+        or not isinstance(cli.commands, dict)
+    ):
+        return
+    choices = cli.subparser.choices
+
+    def get_parser() -> argparse.ArgumentParser:
+        cli.prepare_command(name)
+        parser: argparse.ArgumentParser = choices[name]
+        return parser
+
+    entry = get_command_entry(cli, name, cli.commands[name])
+    print_cached_help(
+        cli.help_cache,
+        cli.help_cache.get_key(
+            name,
+            dict.__getitem__(choices, name),
+            entry.get("modification_time"),
+        ),
+        get_parser,
+    )
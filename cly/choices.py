@@ -0,0 +1,234 @@
+"""Choices of arguments with many values, loaded when first needed."""
+
+import functools
+import itertools
+import os
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+LISTED_CHOICES = 5
+ELLIPSIS = "..."
+ChoicesSource = Union[Iterable[Any], Callable[[], Iterable[Any]]]
+
+
+def read_lines(path: str) -> Iterator[str]:
+    """
+    Read file's non empty lines, one by one.
+
+    Parameters
+    ----------
+    path : str
+        File's path.
+
+    Yields
+    ------
+    str
+        Line, without surrounding whitespace.
+
+    """
+    with open(path, mode="r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                yield line
+
+
+class Choices:
+    """
+    Choices of an argument, backed by a set-like dict.
+
+    Membership is checked in constant time. Values of a function are only
+    loaded when first needed, and values of a file when a value is checked,
+    as help messages only show the first values, streamed from the file.
+    """
+
+    path: Optional[str]
+    listed: int
+    _loader: Optional[Callable[[], Iterable[Any]]]
+    _values: Optional[Dict[Any, None]]
+
+    def __init__(
+        self, source: ChoicesSource, listed: int = LISTED_CHOICES
+    ) -> None:
+        """
+        Initialize choices.
+
+        Parameters
+        ----------
+        source : Union[Iterable[Any], Callable[[], Iterable[Any]]]
+            Values, or function that returns them, only called when they are
+            needed.
+        listed : int, optional
+            Number of values shown in help and error messages, by default
+            ``LISTED_CHOICES``.
+
+        """
+        self.path = None
+        self.listed = listed
+        if callable(source):
+            self._loader = source
+            self._values = None
+        else:
+            self._loader = None
+            self._values = dict.fromkeys(source)
+
+    @classmethod
+    def from_file(
+        cls, path: Union[str, "os.PathLike[str]"], listed: int = LISTED_CHOICES
+    ) -> "Choices":
+        """
+        Create choices from a file's non empty lines.
+
+        Shell completion reads the values from the file too, as they are
+        completed.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            File's path.
+        listed : int, optional
+            Number of values shown in help and error messages, by default
+            ``LISTED_CHOICES``.
+
+        Returns
+        -------
+        Choices
+            Choices, loaded when first needed.
+
+        """
+        resolved_path = os.path.realpath(path)
+        choices = cls(functools.partial(read_lines, resolved_path), listed)
+        choices.path = resolved_path
+        return choices
+
+    def load(self) -> Dict[Any, None]:
+        """
+        Load values, if they were not loaded yet.
+
+        Returns
+        -------
+        Dict[Any, None]
+            Values, as keys in their original order.
+
+        """
+        if self._values is None:
+            assert self._loader is not None  # nosec
+            self._values = dict.fromkeys(self._loader())
+        return self._values
+
+    def iter_values(self) -> Iterator[Any]:
+        """
+        Iterate through values, streaming them if read from a file.
+
+        Values of a function are loaded once, the first time they are needed,
+        as calling the function again could be as slow as the first time.
+
+        Returns
+        -------
+        Iterator[Any]
+            Values.
+
+        """
+        if self._values is None and self.path is not None:
+            return read_lines(self.path)
+        return iter(self.load())
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Check if value is one of the choices.
+
+        Parameters
+        ----------
+        value : Any
+            Argument's value.
+
+        Returns
+        -------
+        bool
+            If value is one of the choices.
+
+        """
+        return value in self.load()
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate through values.
+
+        Returns
+        -------
+        Iterator[Any]
+            Values.
+
+        """
+        return iter(self.load())
+
+    def __len__(self) -> int:
+        """
+        Get number of values.
+
+        Returns
+        -------
+        int
+            Number of values.
+
+        """
+        return len(self.load())
+
+    def __repr__(self) -> str:
+        """
+        Represent choices by their first values, as help messages show them.
+
+        Returns
+        -------
+        str
+            Choices' representation.
+
+        """
+        return f"{type(self).__name__}({self.summarize(repr)})"
+
+    def summarize(
+        self, format_value: Callable[[Any], str] = str, separator: str = ", "
+    ) -> str:
+        """
+        Summarize choices by their first values.
+
+        Parameters
+        ----------
+        format_value : Callable[[Any], str], optional
+            Function to format each value, by default str.
+        separator : str, optional
+            Separator of values, by default ", ".
+
+        Returns
+        -------
+        str
+            First ``listed`` values, followed by an ellipsis if there are more.
+
+        """
+        values = list(itertools.islice(self.iter_values(), self.listed + 1))
+        summary: List[str] = [format_value(value) for value in values]
+        if len(values) > self.listed:
+            summary[self.listed :] = [ELLIPSIS]
+        return separator.join(summary)
+
+    def to_completion(self) -> Any:
+        """
+        Get values for the completion table.
+
+        Returns
+        -------
+        Any
+            Values, or the file to read them from, if they were read from one.
+
+        """
+        if self.path is not None:
+            return {"file": self.path}
+        return [str(value) for value in self]
@@ -0,0 +1,269 @@
+"""Action of the CLI's commands, which prepares only the called command."""
+
+import argparse
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+
+from .loader import DeferredGroup, DeferredParser, ParserMap
+
+MAX_LISTED_COMMANDS = 10
+HELP_ARGUMENTS = (["-h"], ["--help"])
+EXTERNAL_DEST = "cly_external_command"
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .suggest import SuggestionIndex
+    from .trie import PrefixTrie
+
+    _SubParsersAction = argparse._SubParsersAction[argparse.ArgumentParser]
+else:
+    _SubParsersAction = argparse._SubParsersAction
+
+
+class CommandsAction(_SubParsersAction):
+    """Subparser action that prepares only the called command."""
+
+    prepare: Optional[Callable[[str], None]] = None
+    print_help: Optional[Callable[[str], None]] = None
+    suggestions: Optional["SuggestionIndex"] = None
+    resolve_prefixes: bool = False
+    prefixes: Optional["PrefixTrie"] = None
+    choices: ParserMap
+    groups: Set[str]
+    externals: Dict[str, str]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize subparser action with a map of deferrable parsers.
+
+        Parameters
+        ----------
+        *args : Any
+            Positional arguments of argparse's subparser action.
+        **kwargs : Any
+            Key words arguments of argparse's subparser action.
+
+        """
+        super().__init__(*args, **kwargs)
+        self._name_parser_map = self.choices = ParserMap()
+        self.groups = set()
+        self.externals = {}
+
+    def suggest(self, name: str) -> List[str]:
+        """
+        Get the closest commands' names to a mistyped one.
+
+        Commands are indexed on the first mistyped name, and again only if
+        commands were added since then.
+
+        Parameters
+        ----------
+        name : str
+            Mistyped command's name.
+
+        Returns
+        -------
+        List[str]
+            Closest commands' names.
+
+        """
+        if self.suggestions is None or len(self.suggestions) != len(
+            self.choices
+        ):
+            # pylint: disable=import-outside-toplevel
+            from .suggest import SuggestionIndex
+
+            self.suggestions = SuggestionIndex(self.choices)
+        return self.suggestions.suggest(name)
+
+    def resolve(self, name: str) -> str:
+        """
+        Resolve unambiguous prefix of a command's name to the name.
+
+        Only if ``resolve_prefixes`` is set, and name is not a command's name
+        itself. Commands are added to a prefix trie on the first prefix, and
+        again only if commands were added since then.
+
+        Parameters
+        ----------
+        name : str
+            Command's name or prefix of it.
+
+        Returns
+        -------
+        str
+            Command's name, if only one command starts with prefix; else, the
+            name as it is.
+
+        Raises
+        ------
+        argparse.ArgumentError
+            If more than one command starts with prefix.
+
+        """
+        if not self.resolve_prefixes or not name or name in self.choices:
+            return name
+        if self.prefixes is None or len(self.prefixes) != len(self.choices):
+            # pylint: disable=import-outside-toplevel
+            from .trie import PrefixTrie
+
+            self.prefixes = PrefixTrie(self.choices)
+        resolved = self.prefixes.resolve(name)
+        if resolved is not None:
+            return resolved
+        matches = self.prefixes.complete(name)
+        if len(matches) > 1:
+            listed = ", ".join(map(repr, matches[:MAX_LISTED_COMMANDS]))
+            if len(matches) > MAX_LISTED_COMMANDS:
+                listed += f" and {len(matches) - MAX_LISTED_COMMANDS} more"
+            raise argparse.ArgumentError(
+                self, f"ambiguous choice: {name!r} could match {listed}"
+            )
+        return name
+
+    def add_deferred_parser(
+        self,
+        name: str,
+        setup: Callable[[argparse.ArgumentParser], None],
+        **kwargs: Any,
+    ) -> DeferredParser:
+        """
+        Add command without creating its parser.
+
+        The parser is created only when the command is called.
+
+        Parameters
+        ----------
+        name : str
+            Command's name.
+        setup : Callable[[argparse.ArgumentParser], None]
+            Function to configure the parser when it is created.
+        **kwargs : Any
+            Key words arguments to create the parser with.
+
+        Returns
+        -------
+        DeferredParser
+            Parser that records calls to replay them when it is created.
+
+        """
+        if kwargs.get("prog") is None:
+            kwargs["prog"] = f"{self._prog_prefix} {name}"
+        if "help" in kwargs:
+            self._choices_actions.append(
+                self._ChoicesPseudoAction(name, (), kwargs.pop("help"))
+            )
+        parser = DeferredParser(self._parser_class, kwargs, setup)
+        self.choices[name] = parser
+        return parser
+
+    def add_group(
+        self,
+        name: str,
+        load: Callable[[], argparse.ArgumentParser],
+        help_message: str,
+    ) -> None:
+        """
+        Add group of commands without loading it.
+
+        The group is loaded only when it is called.
+
+        Parameters
+        ----------
+        name : str
+            Group's name.
+        load : Callable[[], argparse.ArgumentParser]
+            Function to load the group and get its parser.
+        help_message : str
+            Group's summary.
+
+        """
+        self._choices_actions.append(
+            self._ChoicesPseudoAction(name, (), help_message)
+        )
+        self.choices[name] = DeferredGroup(load)
+        self.groups.add(name)
+
+    def add_external(self, name: str, path: str, help_message: str) -> None:
+        """
+        Add external command, which receives all arguments after its name.
+
+        Parameters
+        ----------
+        name : str
+            Command's name.
+        path : str
+            Path of the command's executable.
+        help_message : str
+            Command's summary.
+
+        """
+        # pylint: disable=import-outside-toplevel
+        from .external import add_external_arguments
+
+        self.add_deferred_parser(
+            name,
+            add_external_arguments,
+            help=help_message,
+            add_help=False,
+        )
+        self.externals[name] = path
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Union[str, Sequence[Any], None],
+        option_string: Optional[str] = None,
+    ) -> None:
+        """
+        Prepare called command before parsing its arguments.
+
+        If only the command's help is requested, and ``print_help`` is set,
+        it is called instead. If a group is called, its command's name is
+        prefixed with the group's name, like ``group command``. If an external
+        command is called, its path and arguments are set in the namespace,
+        without parsing them, to be run after parsing.
+
+        Parameters
+        ----------
+        parser : argparse.ArgumentParser
+            Parser which contains the subparser.
+        namespace : argparse.Namespace
+            Namespace being populated.
+        values : Union[str, Sequence[Any], None]
+            Command name followed by its arguments.
+        option_string : Optional[str]
+            Option string used to call the action, by default None
+
+        """
+        if values and values[0] in self.externals:
+            setattr(namespace, self.dest, values[0])
+            setattr(
+                namespace,
+                EXTERNAL_DEST,
+                [self.externals[values[0]], *values[1:]],
+            )
+            return
+        if values and values[0] in self.groups:
+            super().__call__(parser, namespace, values, option_string)
+            setattr(
+                namespace,
+                self.dest,
+                f"{values[0]} {getattr(namespace, self.dest)}",
+            )
+            return
+        if values and values[0] in self.choices:
+            if self.print_help and list(values[1:]) in HELP_ARGUMENTS:
+                self.print_help(values[0])
+            if self.prepare:
+                self.prepare(values[0])
+        super().__call__(parser, namespace, values, option_string)
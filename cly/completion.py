@@ -0,0 +1,341 @@
+"""
+Shell completion of CLY?! CLIs.
+
+This module answers completion requests from a precomputed completion table,
+so it only imports json, os and sys, and it is run as a script (not as part
+of the cly package) by the generated shell scripts. Functions that write the
+completion table import the rest of CLY?! when they are called.
+"""
+
+import json
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    import argparse
+
+    from .config import ConfiguredParser
+
+COMPLETION_FILE = "completion.json"
+COMPLETION_FORMAT = 1
+SHELLS = ("bash", "zsh", "fish")
+BASH_SCRIPT = """\
+_cly_complete_{function}() {{
+    local IFS=$'\\n'
+    COMPREPLY=($({command} "$COMP_CWORD" "${{COMP_WORDS[@]}}"))
+}}
+complete -o default -F _cly_complete_{function} {prog}
+"""
+ZSH_SCRIPT = """\
+#compdef {prog}
+_cly_complete_{function}() {{
+    local -a candidates
+    candidates=("${{(@f)$({command} $((CURRENT - 1)) "${{words[@]}}")}}")
+    compadd -a candidates
+}}
+compdef _cly_complete_{function} {prog}
+"""
+FISH_SCRIPT = """\
+function __cly_complete_{function}
+    set -l tokens (commandline -opc)
+    {command} (count $tokens) $tokens (commandline -ct)
+end
+complete -c {prog} -f -a '(__cly_complete_{function})'
+"""
+SCRIPTS = dict(zip(SHELLS, (BASH_SCRIPT, ZSH_SCRIPT, FISH_SCRIPT)))
+
+
+def quote(text: str) -> str:
+    """
+    Quote text for shells.
+
+    Parameters
+    ----------
+    text : str
+        Text to be quoted.
+
+    Returns
+    -------
+    str
+        Text in single quotes.
+
+    """
+    return "'" + text.replace("'", "'\\''") + "'"
+
+
+def get_completion_script(shell: str, prog: str, table_path: str) -> str:
+    """
+    Get script that registers CLI's completion in shell.
+
+    Parameters
+    ----------
+    shell : str
+        Shell's name: bash, zsh or fish.
+    prog : str
+        Name the CLI is called with.
+    table_path : str
+        Path of the CLI's completion table.
+
+    Returns
+    -------
+    str
+        Completion script.
+
+    Raises
+    ------
+    ValueError
+        If shell is not supported.
+
+    """
+    if shell not in SCRIPTS:
+        raise ValueError(
+            f"Invalid shell {shell!r}. Valid shells are {', '.join(SHELLS)}."
+        )
+    command = " ".join(
+        quote(part)
+        for part in (
+            sys.executable,
+            "-S",
+            "-E",
+            os.path.abspath(__file__),
+            table_path,
+        )
+    )
+    function = "".join(
+        character if character.isalnum() else "_" for character in prog
+    )
+    return SCRIPTS[shell].format(
+        function=function, prog=quote(prog), command=command
+    )
+
+
+def build_completion_table(
+    parser: "argparse.ArgumentParser",
+) -> Dict[str, Any]:
+    """
+    Build completion table of parser, with its commands' tables.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        Parser to complete the arguments of.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Parser's options, options' values, commands and positional
+        arguments' values.
+
+    """
+    # pylint: disable=import-outside-toplevel
+    import argparse
+
+    from .choices import Choices
+
+    table: Dict[str, Any] = {
+        "options": [],
+        "values": {},
+        "commands": {},
+        "positionals": [],
+    }
+    for action in parser._actions:
+        choices: Any = []
+        if isinstance(action.choices, Choices):
+            choices = action.choices.to_completion()
+        elif action.choices:
+            choices = [str(choice) for choice in action.choices]
+        if action.option_strings:
+            table["options"].extend(action.option_strings)
+            if action.nargs != 0:
+                table["values"].update(
+                    dict.fromkeys(action.option_strings, choices)
+                )
+        elif isinstance(action, argparse._SubParsersAction):
+            table["commands"] = {
+                name: build_completion_table(action.choices[name])
+                for name in action.choices
+            }
+        else:
+            table["positionals"].append(choices)
+    return table
+
+
+def print_completion_script(cli: "ConfiguredParser", shell: str) -> None:
+    """
+    Write CLI's completion table and print shell's completion script.
+
+    Parameters
+    ----------
+    cli : ConfiguredParser
+        CLI to complete.
+    shell : str
+        Shell's name: bash, zsh or fish. If empty, the shell is read from
+        the SHELL environment variable.
+
+    Raises
+    ------
+    SystemExit
+        After the completion script is printed, or if shell is not
+        supported.
+
+    """
+    # pylint: disable=import-outside-toplevel
+    from .cache import write_json
+
+    shell = shell or os.path.basename(os.environ.get("SHELL", "bash"))
+    table_path = cli.get_cli_file_path(COMPLETION_FILE)
+    try:
+        script = get_completion_script(
+            shell, os.path.basename(sys.argv[0]), str(table_path)
+        )
+    except ValueError as error:
+        cli.parser.error(str(error))
+    write_json(
+        table_path,
+        {
+            "format": COMPLETION_FORMAT,
+            "tree": build_completion_table(cli.parser),
+        },
+    )
+    sys.stdout.write(script)
+    raise SystemExit(0)
+
+
+def iter_values(values: Any) -> Iterator[str]:
+    """
+    Iterate through an argument's values, reading them from a file if needed.
+
+    Parameters
+    ----------
+    values : Any
+        Values, or a ``{"file": path}`` reference to a file with a value in
+        each line, read line by line.
+
+    Yields
+    ------
+    str
+        Argument's value.
+
+    """
+    if not isinstance(values, dict):
+        yield from values
+        return
+    try:
+        with open(values["file"], mode="r", encoding="utf-8") as file:
+            for line in file:
+                line = line.strip()
+                if line:
+                    yield line
+    except OSError:
+        return
+
+
+def iter_candidates(node: Dict[str, Any], words: List[str]) -> Iterator[str]:
+    """
+    Iterate through candidates to complete the last word, as they are found.
+
+    Parameters
+    ----------
+    node : Dict[str, Any]
+        Completion table of the CLI's parser.
+    words : List[str]
+        Words typed after the CLI's name, the last one being completed.
+
+    Yields
+    ------
+    str
+        Candidate that starts with the word being completed.
+
+    """
+    *previous, current = words or [""]
+    pending = ""
+    positional = 0
+    for word in previous:
+        if pending:
+            pending = ""
+        elif word.startswith("-"):
+            if word in node["values"]:
+                pending = word
+        elif word in node["commands"]:
+            node = node["commands"][word]
+            positional = 0
+        else:
+            positional += 1
+    sources: List[Iterable[str]]
+    if pending:
+        sources = [iter_values(node["values"][pending])]
+    elif current.startswith("-") and "=" in current:
+        option, _, _ = current.partition("=")
+        sources = [
+            (
+                f"{option}={value}"
+                for value in iter_values(node["values"].get(option, []))
+            )
+        ]
+    elif current.startswith("-"):
+        sources = [node["options"]]
+    else:
+        sources = [node["commands"]]
+        if positional < len(node["positionals"]):
+            sources.append(iter_values(node["positionals"][positional]))
+    for candidates in sources:
+        for candidate in candidates:
+            if candidate.startswith(current):
+                yield candidate
+
+
+def get_candidates(node: Dict[str, Any], words: List[str]) -> List[str]:
+    """
+    Get candidates to complete the last word.
+
+    Parameters
+    ----------
+    node : Dict[str, Any]
+        Completion table of the CLI's parser.
+    words : List[str]
+        Words typed after the CLI's name, the last one being completed.
+
+    Returns
+    -------
+    List[str]
+        Candidates that start with the word being completed.
+
+    """
+    return list(iter_candidates(node, words))
+
+
+def main(arguments: List[str]) -> int:
+    """
+    Print candidates to complete a command line, one per line.
+
+    Parameters
+    ----------
+    arguments : List[str]
+        Completion table's path, index of the word being completed and the
+        command line's words, starting with the CLI's name.
+
+    Returns
+    -------
+    int
+        Exit status: 0 if the completion table could be read; else, 1.
+
+    """
+    if len(arguments) < 2 or not arguments[1].isdigit():
+        return 1
+    table_path, index, *words = arguments
+    try:
+        with open(table_path, mode="r", encoding="utf-8") as file:
+            table = json.load(file)
+    except (OSError, ValueError):
+        return 1
+    if table.get("format") != COMPLETION_FORMAT:
+        return 1
+    words = (words + [""])[1 : int(index) + 1]
+    for candidate in iter_candidates(table["tree"], words):
+        sys.stdout.write(f"{candidate}\n")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main(sys.argv[1:]))
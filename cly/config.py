@@ -3,14 +3,48 @@
 import argparse
 import functools
 import inspect
+import os
 import sys
-import textwrap
-from typing import Any, Callable, Dict, Iterable, Optional
-
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+    cast,
+)
+
+from .arguments import pop_option
+from .cache import (
+    HELP_FILE,
+    MANIFEST_FILE,
+    HelpCache,
+    Manifest,
+    get_default_cache_dir,
+    get_default_cache_help,
+    print_cached_help,
+    print_command_help,
+)
 from .colors import color_text
-from .docstring import get_help_from_docstring, get_param_help_from_docstring
+from .commands import (
+    EXTERNAL_DEST,
+    HELP_ARGUMENTS,
+    MAX_LISTED_COMMANDS,
+    CommandsAction,
+)
+from .formatter import CustomFormatter, get_choices
+from .loader import (
+    DeferredParser,
+    LazyCommand,
+    get_command_entry,
+    get_command_params_help,
+)
+from .profiler import phase, profiled, start_profiler, stop_profiler
 
-USAGE_PREFIX = "Usage:\n  [python|python3] "
 POSITIONALS_TITLE = "Arguments"
 OPTIONALS_TITLE = "Options"
 HELP_MESSAGE = "Show script's help message."
@@ -18,7 +52,16 @@ VERSION_MESSAGE = "Show script's version."
 MAJOR_VERSION = 3
 MINOR_VERSION = 7
 PYTHON_MINIMUM_VERSION = (MAJOR_VERSION, MINOR_VERSION)
-OptionalSubParser = Optional[argparse._SubParsersAction]
+COMPLETION_OPTION = "--cly-completion"
+SERVE_OPTION = "--cly-serve"
+SHELL_OPTION = "--cly-shell"
+BATCH_OPTION = "--cly-batch"
+OptionalSubParser = Optional["CommandsAction"]
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .aio import LoopFactory
+    from .fastpath import FastParser
+    from .hooks import Hook
 
 
 def check_python_minimum_version() -> None:
@@ -47,6 +90,10 @@ def decorate_kwargs(func: Callable[..., Any]) -> Callable[..., Any]:
     """
     Call decorated function only with it's key words arguments.
 
+    The function's binding plan is compiled once, from its signature, so
+    positional only, key words only, ``*args`` and ``**kwargs`` parameters
+    receive the arguments they accept.
+
     Parameters
     ----------
     func : Callable[..., Any]
@@ -58,152 +105,186 @@ def decorate_kwargs(func: Callable[..., Any]) -> Callable[..., Any]:
         Decorated function.
 
     """
+    # pylint: disable=import-outside-toplevel
+    from .binding import compile_binding
+
+    plan = compile_binding(func)
 
     @functools.wraps(func)
     def wrap(**kwargs: Any) -> Any:
-        for kwarg in set(kwargs.keys()) - set(func.__code__.co_varnames):
-            kwargs.pop(kwarg)
-        return func(**kwargs)
+        return plan.call(func, kwargs)
 
     return wrap
 
 
-def iterate_through_params(
-    commands: Dict[str, Callable[..., Any]],
-    choices: Dict[str, argparse.ArgumentParser],
+def set_params_help(
+    parser: argparse.ArgumentParser, params_help: Dict[str, str]
 ) -> None:
     """
-    Iterate through commands' parameters help with docstrings content.
+    Set help of parser's arguments that do not have one.
+
+    Parser's actions are traversed once, looking up each action's dest in the
+    parameters help, instead of traversing them for each parameter.
 
     Parameters
     ----------
-    commands : Dict[str, Callable[..., Any]]
-        Narrowed type ConfiguredParser' commands.
-    choices : Dict[str, argparse.ArgumentParser]
-        Narrowed type argparse's choices.
+    parser : argparse.ArgumentParser
+        Command's parser.
+    params_help : Dict[str, str]
+        Help message of each of the command's parameters.
 
     """
-    for command_name, command in commands.items():
-        for param in inspect.signature(command).parameters.values():
-            for action in choices[command_name]._actions[1:]:
-                if action.dest == param.name and not action.help:
-                    action.help = get_param_help_from_docstring(
-                        param.name, command
-                    )
-                    break
-
+    params_help = dict(params_help)
+    for action in parser._actions[1:]:
+        if not action.help and action.dest in params_help:
+            action.help = params_help.pop(action.dest)
 
-class CustomFormatter(argparse.HelpFormatter):
-    """Custom formatter for argparse's argument parser."""
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Call super class init's."""
-        super().__init__(*args, **kwargs)
+class CustomParser(argparse.ArgumentParser):
+    """Custom argparse's argument parser, which streams its help message."""
 
-    def _format_usage(
-        self,
-        usage: Optional[str],
-        actions: Iterable[argparse.Action],
-        groups: Iterable[argparse._ArgumentGroup],
-        prefix: Optional[str],
-    ) -> str:
+    def iter_help(self) -> Iterator[str]:
         """
-        Format prefix of usage section.
-
-        Parameters
-        ----------
-        usage : Optional[str]
-            usage.
-        actions : Iterable[argparse.Action]
-            argparse actions.
-        groups : Iterable[argparse._ArgumentGroup]
-            argparse groups.
-        prefix : Optional[str]
-            usage prefix.
+        Format help message chunk by chunk, like argparse's ``format_help``.
 
         Returns
         -------
-        str
-            Formatted usage section.
+        Iterator[str]
+            Formatted help message's chunks.
 
         """
-        return super()._format_usage(usage, actions, groups, USAGE_PREFIX)
-
-    def _format_action(self, action: argparse.Action) -> str:
+        formatter = self._get_formatter()
+        formatter.add_usage(
+            self.usage, self._actions, self._mutually_exclusive_groups
+        )
+        formatter.add_text(self.description)
+        for action_group in self._action_groups:
+            formatter.start_section(action_group.title)
+            formatter.add_text(action_group.description)
+            formatter.add_arguments(action_group._group_actions)
+            formatter.end_section()
+        formatter.add_text(self.epilog)
+        if isinstance(formatter, CustomFormatter):
+            return formatter.iter_help()
+        return iter([formatter.format_help()])
+
+    def print_help(self, file: Any = None) -> None:
         """
-        Remove subparser's metavar when listing its parsers.
+        Print help message as it is formatted, paging it if needed.
 
         Parameters
         ----------
-        action : argparse.Action
-            argparse action.
-
-        Returns
-        -------
-        str
-            subparser's section without metavar.
+        file : Any, optional
+            File to print to, by default None (stdout).
 
         """
-        parts = super()._format_action(action)
-        if action.nargs == argparse.PARSER:
-            line_break = "\n"
-            parts = line_break.join(parts.split(line_break)[1:])
-        return parts
+        # pylint: disable=import-outside-toplevel
+        from .pager import write_text
+
+        write_text(self.iter_help(), file)
 
-    def _format_action_invocation(self, action: argparse.Action) -> str:
+    def _get_values(
+        self, action: argparse.Action, arg_strings: List[str]
+    ) -> Any:
         """
-        Add metavar only once to arguments.
+        Get action's values, resolving prefix of command's name first.
 
         Parameters
         ----------
         action : argparse.Action
-            argparse action.
+            Action whose values are converted.
+        arg_strings : List[str]
+            Action's arguments.
 
         Returns
         -------
-        str
-            How to use option with only one metavar.
+        Any
+            Action's values.
 
         """
-        if not action.option_strings or action.nargs == 0:
-            return super()._format_action_invocation(action)
-        metavar = self._format_args(
-            action, self._get_default_metavar_for_optional(action)
-        )
-        comma = ", "
-        return f"{comma.join(action.option_strings)} {metavar}"
+        if isinstance(action, CommandsAction) and arg_strings:
+            arg_strings = [action.resolve(arg_strings[0]), *arg_strings[1:]]
+        return super()._get_values(action, arg_strings)
 
-    def _fill_text(self, text: str, width: int, indent: str) -> str:
+    def _check_value(self, action: argparse.Action, value: Any) -> None:
         """
-        Format text to fit desired width.
+        Check if value is one of action's choices, suggesting close commands.
 
-        Breaks text in paragraphs so it does not exceed the width limit,
-        respecting indentation.
+        For commands, the closest ones to a mistyped name are suggested, and
+        the choices are only listed if there are few of them. CLY?!'s choices
+        are summarized by their first values.
 
         Parameters
         ----------
-        text : str
-            Text to be formatted.
-        width : int
-            Width limit.
-        indent : str
-            Indentation.
+        action : argparse.Action
+            Action whose value is checked.
+        value : Any
+            Argument's value.
 
-        Returns
-        -------
-        str
-            Formatted text.
+        Raises
+        ------
+        argparse.ArgumentError
+            If value is not one of action's choices.
 
         """
-        return "\n\n".join(
-            textwrap.fill(
-                line,
-                width,
-                initial_indent=indent,
-                subsequent_indent=indent,
+        choices = get_choices(action)
+        if choices is not None and value not in choices:
+            summary = choices.summarize(repr)
+            raise argparse.ArgumentError(
+                action, f"invalid choice: {value!r} (choose from {summary})"
             )
-            for line in text.split("\n\n")
-        )
+        if not isinstance(action, CommandsAction) or value in action.choices:
+            super()._check_value(action, value)
+            return
+        suggestions = action.suggest(value)
+        if not suggestions and len(action.choices) <= MAX_LISTED_COMMANDS:
+            super()._check_value(action, value)
+        message = f"invalid choice: {value!r}"
+        if suggestions:
+            message += f" (did you mean {', '.join(map(repr, suggestions))}?)"
+        raise argparse.ArgumentError(action, message)
+
+
+class ParserOptions(NamedTuple):
+    """
+    Optional features of a configured parser.
+
+    Attributes
+    ----------
+    cache_dir : Optional[Union[str, os.PathLike]]
+        Folder to cache the resolved commands' help, so warm starts do not
+        need to inspect the commands, by default None (a folder named after
+        the CLI in the ``CLY_CACHE_DIR`` environment variable, if set; else,
+        no cache).
+    lazy_parsers : bool
+        If commands' parsers should only be created when the command is
+        called, by default False.
+    cache_help : Optional[bool]
+        If rendered help messages should also be cached in ``cache_dir``, by
+        default None (if the ``CLY_CACHE_HELP`` environment variable is set
+        to 1).
+    static_help : bool
+        If help of commands created by import path should be read from their
+        source code, without importing them, by default False.
+    loop_factory : Optional[Callable[[], asyncio.AbstractEventLoop]]
+        Function that creates the event loop async commands run on, like
+        ``uvloop.new_event_loop``, by default None (asyncio's default).
+    fast_parser : bool
+        If common shapes of arguments should be parsed by a fast path parser,
+        falling back to argparse for anything else, by default False.
+    command_prefixes : bool
+        If commands can be called by any unambiguous prefix of their name, by
+        default False.
+
+    """
+
+    cache_dir: Optional[Union[str, "os.PathLike[str]"]] = None
+    lazy_parsers: bool = False
+    cache_help: Optional[bool] = None
+    static_help: bool = False
+    loop_factory: Optional["LoopFactory"] = None
+    fast_parser: bool = False
+    command_prefixes: bool = False
 
 
 # pylint: disable=too-many-instance-attributes
@@ -218,11 +299,20 @@ class ConfiguredParser:
     parser: argparse.ArgumentParser
     subparser: OptionalSubParser
     commands: Optional[Dict[str, Callable[..., Any]]]
+    cache_dir: Optional[str]
+    manifest: Optional[Manifest]
+    help_cache: Optional[HelpCache]
+    fast_parser: Optional["FastParser"]
+    options: ParserOptions
+    hooks: Dict[str, List["Hook"]]
+    groups: Dict[str, Union["ConfiguredParser", LazyCommand]]
+    replace_process: bool
 
     def __init__(
         self,
         config: Dict[str, str],
         add_help: bool = True,
+        options: Optional[ParserOptions] = None,
     ) -> None:
         """
         Initialize parser class.
@@ -235,17 +325,88 @@ class ConfiguredParser:
         add_help : bool, optional
             If parser should call the script help if no arguments are provided,
             by default True.
+        options : Optional[ParserOptions]
+            Optional features of the parser, by default None (all disabled).
+
+        Raises
+        ------
+        ValueError
+            If ``cache_help`` is enabled without ``cache_dir``.
 
         """
+        start_profiler(sys.argv[1:])
         self.name = config["name"]
         self.description = config["description"]
         self.epilog = config["epilog"]
         self.version = config["version"]
         self.add_help = add_help
+        self.options = options or ParserOptions()
+        cache_dir = (
+            os.fspath(self.options.cache_dir)
+            if self.options.cache_dir
+            else get_default_cache_dir(self.name)
+        )
+        self.cache_dir = cache_dir
         self.parser = self.create_parser()
+        self.fast_parser = None
+        if self.options.fast_parser:
+            # pylint: disable=import-outside-toplevel
+            from .fastpath import FastParser
+
+            self.fast_parser = FastParser(self.parser)
         self.subparser: OptionalSubParser = None
         self.commands: Optional[Dict[str, Callable[..., Any]]] = None
+        self.manifest = (
+            Manifest(os.path.join(cache_dir, MANIFEST_FILE), self.version)
+            if cache_dir
+            else None
+        )
+        cache_help = self.options.cache_help
+        if cache_help and not cache_dir:
+            raise ValueError("cache_help requires cache_dir to be set.")
+        if cache_help is None:
+            cache_help = get_default_cache_help()
+        self.help_cache = (
+            HelpCache(os.path.join(cache_dir, HELP_FILE), self.version)
+            if cache_dir and cache_help
+            else None
+        )
+        self.hooks = {}
+        self.groups = {}
+        self.replace_process = True
+
+    def add_hook(self, event: str, hook: "Hook") -> None:
+        """
+        Register function to be called around the called command.
+
+        Parameters
+        ----------
+        event : str
+            When to call the hook: ``before`` the command runs, ``after`` it
+            runs (even if it fails) or on ``error``, when the command raises
+            an exception or exits with a non zero status.
+        hook : Callable[[cly.hooks.DispatchEvent], None]
+            Function that receives the command's name, key words arguments,
+            wall and CPU times and exit status.
+
+        Raises
+        ------
+        ValueError
+            If event is not one of ``before``, ``after`` or ``error``.
+
+        """
+        from .hooks import (  # pylint: disable=import-outside-toplevel
+            HOOK_EVENTS,
+        )
 
+        if event not in HOOK_EVENTS:
+            raise ValueError(
+                f"Invalid hook event {event!r}. Valid events are "
+                f"{', '.join(HOOK_EVENTS)}."
+            )
+        self.hooks.setdefault(event, []).append(hook)
+
+    @profiled("create_parser")
     def create_parser(self) -> argparse.ArgumentParser:
         """
         Create configured parser to create script.
@@ -257,7 +418,7 @@ class ConfiguredParser:
 
         """
         check_python_minimum_version()
-        parser = argparse.ArgumentParser(
+        parser = CustomParser(
             prog=sys.argv[0],
             description=self.description,
             epilog=self.epilog,
@@ -278,37 +439,56 @@ class ConfiguredParser:
 
     def create_subparser(
         self,
-    ) -> "argparse._SubParsersAction[argparse.ArgumentParser]":
+    ) -> CommandsAction:
         """
         Create configured subparser to add commands.
 
         Returns
         -------
-        argparse._SubParsersAction
+        CommandsAction
             Configured argparse's subparser.
 
         """
-        return self.parser.add_subparsers(
-            dest="commands",
-            metavar="command",
-            title="Commands",
-            prog=sys.argv[0],
-            required=True,
+        # pylint: disable=import-outside-toplevel
+        from .binding import COMMANDS_DEST
+
+        subparser = cast(
+            CommandsAction,
+            self.parser.add_subparsers(
+                dest=COMMANDS_DEST,
+                metavar="command",
+                title="Commands",
+                prog=sys.argv[0],
+                required=True,
+                action=CommandsAction,
+            ),
         )
+        subparser.prepare = self.prepare_command
+        subparser.resolve_prefixes = self.options.command_prefixes
+        if self.help_cache:
+            subparser.print_help = functools.partial(print_command_help, self)
+        return subparser
 
+    @profiled("create_command")
     def create_command(
         self,
-        command: Callable[..., Any],
+        command: Union[Callable[..., Any], str],
         alias: Optional[str] = None,
         help_message: Optional[str] = None,
     ) -> argparse.ArgumentParser:
         """
         Create configured command to script.
 
+        The command can be passed as an import path, in the format
+        ``package.module:function``. Then, the command's module is only
+        imported when the command is called or its help is requested, if
+        ``help_message`` is passed; else, it is imported to read the command's
+        docstring, unless ``static_help`` is set.
+
         Parameters
         ----------
-        command : Callable[..., Any]
-            Function that represents the command.
+        command : Union[Callable[..., Any], str]
+            Function that represents the command, or its import path.
         alias : Optional[str]
             Alias to call command, by default None
         help_message : Optional[str]
@@ -317,70 +497,504 @@ class ConfiguredParser:
         Returns
         -------
         argparse.ArgumentParser
-            Configured argparse's parser command.
+            Configured argparse's parser command. If ``lazy_parsers`` is
+            enabled, a :py:class:`cly.loader.DeferredParser` is returned
+            instead, which records the method calls (like ``add_argument``)
+            and the attributes set on their returns, to replay them when the
+            command is called.
 
         """
         self.subparser = self.subparser or self.create_subparser()
         self.commands = self.commands or {}
+        if isinstance(command, str):
+            command = LazyCommand(command, decorator=decorate_kwargs)
+        name = alias if alias else command.__name__
         argparse_help = (
-            help_message if help_message else get_help_from_docstring(command)
+            help_message
+            if help_message
+            else get_command_entry(self, name, command)["description"]
         )
+        self.commands[name] = (
+            command
+            if isinstance(command, LazyCommand)
+            else decorate_kwargs(command)
+        )
+        setup = functools.partial(
+            self.configure_command, description=argparse_help
+        )
+        if self.options.lazy_parsers:
+            return cast(
+                argparse.ArgumentParser,
+                self.subparser.add_deferred_parser(
+                    name,
+                    setup,
+                    help=argparse_help.split("\n", maxsplit=1)[0],
+                ),
+            )
         argparse_command: argparse.ArgumentParser = self.subparser.add_parser(
-            alias if alias else command.__name__,
+            name,
             help=argparse_help.split("\n", maxsplit=1)[0],
         )
-        self.commands[alias if alias else command.__name__] = decorate_kwargs(
-            command
+        setup(argparse_command)
+        return argparse_command
+
+    def add_plugins(self, group: str) -> None:
+        """
+        Create commands registered by other packages as entry points.
+
+        Packages register commands in their metadata, like::
+
+            [project.entry-points."batcomputer.commands"]
+            report = "crime_reports.commands:report"
+
+        Entry points are only scanned when distributions are installed or
+        uninstalled, if ``cache_dir`` is set, and the commands' modules are
+        only imported when they are called. Commands already created are not
+        replaced by plugins with the same name.
+
+        Parameters
+        ----------
+        group : str
+            Entry points group, like ``batcomputer.commands``.
+
+        """
+        # pylint: disable=import-outside-toplevel
+        from .plugins import discover_plugins
+
+        for plugin in discover_plugins(group, self.cache_dir):
+            if plugin["name"] in (self.commands or {}):
+                continue
+            self.create_command(
+                plugin["target"],
+                alias=plugin["name"],
+                help_message=plugin["summary"] or plugin["target"],
+            )
+
+    def add_external_commands(self, prefix: Optional[str] = None) -> None:
+        """
+        Create commands for executables named ``<prefix>-<command>`` on PATH.
+
+        Like ``git``, calling ``script command arguments`` replaces the
+        script's process by ``script-command arguments``; in batch mode, the
+        shell or the daemon, it runs in a child process. PATH's directories
+        are only scanned when they change, if ``cache_dir`` is set. Commands
+        already created are not replaced by external commands.
+
+        Parameters
+        ----------
+        prefix : Optional[str]
+            Executables' prefix, by default None (script's name, without
+            extension).
+
+        """
+        # pylint: disable=import-outside-toplevel
+        from .external import discover_external_commands
+
+        self.subparser = self.subparser or self.create_subparser()
+        self.commands = self.commands or {}
+        prefix = (
+            prefix or os.path.splitext(os.path.basename(self.parser.prog))[0]
         )
+        external_commands = discover_external_commands(prefix, self.cache_dir)
+        for name, path in external_commands.items():
+            if name in self.subparser.choices:
+                continue
+            self.subparser.add_external(
+                name, path, f"Run external command {os.path.basename(path)}."
+            )
+
+    def create_group(
+        self,
+        group: Union["ConfiguredParser", str],
+        alias: str,
+        help_message: Optional[str] = None,
+    ) -> None:
+        """
+        Create group of commands, called like ``script alias command``.
+
+        The group can be passed as the import path of a ConfiguredParser, in
+        the format ``package.module:CLI``. Then, the group's module is only
+        imported when the group is called, if ``help_message`` is passed;
+        else, it is imported to read the group's description. Groups can be
+        nested, and only the groups called are loaded.
+
+        Parameters
+        ----------
+        group : Union[ConfiguredParser, str]
+            ConfiguredParser with the group's commands, or its import path.
+        alias : str
+            Name to call the group.
+        help_message : Optional[str]
+            Help message of the group, by default None (group's description)
+
+        """
+        # pylint: disable=import-outside-toplevel
+        from .groups import get_group, load_group
+
+        self.subparser = self.subparser or self.create_subparser()
+        self.commands = self.commands or {}
+        self.groups[alias] = (
+            LazyCommand(group) if isinstance(group, str) else group
+        )
+        argparse_help = help_message or get_group(self, alias).description
+        self.subparser.add_group(
+            alias,
+            functools.partial(load_group, self, alias),
+            argparse_help.split("\n", maxsplit=1)[0],
+        )
+
+    def set_prog(self, prog: str) -> None:
+        """
+        Set prefix of commands' usage, when used as a group.
+
+        Parameters
+        ----------
+        prog : str
+            Script name, followed by the groups' names.
+
+        """
+        self.parser.prog = prog
+        if self.subparser is None:
+            return
+        self.subparser._prog_prefix = prog
+        for name, parser in dict.items(self.subparser.choices):
+            if isinstance(parser, DeferredParser):
+                parser.kwargs["prog"] = f"{prog} {name}"
+            elif isinstance(parser, argparse.ArgumentParser):
+                parser.prog = f"{prog} {name}"
+        for name, group in self.groups.items():
+            if isinstance(group, ConfiguredParser):
+                group.set_prog(f"{prog} {name}")
+
+    def get_command(self, name: str) -> Callable[..., Any]:
+        """
+        Get command, looking it up in groups if needed.
+
+        Parameters
+        ----------
+        name : str
+            Name the command was called with, prefixed by its groups' names,
+            like ``group command``.
+
+        Returns
+        -------
+        Callable[..., Any]
+            Function that represents the command.
+
+        """
+        group_name, _, command_name = name.partition(" ")
+        if command_name and group_name in self.groups:
+            # pylint: disable=import-outside-toplevel
+            from .groups import get_group
+
+            return get_group(self, group_name).get_command(command_name)
+        return (self.commands or {})[name]
+
+    def save_caches(self) -> None:
+        """Write caches of this parser and of the loaded groups to file."""
+        if self.manifest:
+            self.manifest.save()
+        if self.help_cache:
+            self.help_cache.save()
+        for group in self.groups.values():
+            if isinstance(group, ConfiguredParser):
+                group.save_caches()
+
+    def configure_command(
+        self, argparse_command: argparse.ArgumentParser, description: str
+    ) -> None:
+        """
+        Pass parser's configuration to command's parser.
+
+        Parameters
+        ----------
+        argparse_command : argparse.ArgumentParser
+            Command's parser.
+        description : str
+            Command's description.
+
+        """
         argparse_command.formatter_class = CustomFormatter
         argparse_command._positionals.title = POSITIONALS_TITLE
         argparse_command._optionals.title = OPTIONALS_TITLE
         argparse_command._actions[0].help = "Show command's help message."
-        argparse_command.description = argparse_help
+        argparse_command.description = description
         argparse_command.epilog = self.epilog
-        return argparse_command
 
+    @profiled("parse_args")
     def get_arguments(self) -> argparse.Namespace:
         """
         Get arguments the script was called with.
 
+        CLY?! hidden options, like ``--cly-profile-startup``,
+        ``--cly-completion``, ``--cly-serve``, ``--cly-shell`` and
+        ``--cly-batch``, are removed before argparse parses the arguments.
+
         Returns
         -------
         argparse.Namespace
             Arguments in argparse's namespace.
 
         """
-        return self.parser.parse_args(
-            sys.argv[1:] or ["--help"] if self.add_help else sys.argv[1:]
-        )
+        arguments = start_profiler(sys.argv[1:])
+        shell, arguments = pop_option(arguments, COMPLETION_OPTION)
+        if shell is not None:
+            # pylint: disable=import-outside-toplevel
+            from .completion import print_completion_script
+
+            print_completion_script(self, shell)
+        socket_path, arguments = pop_option(arguments, SERVE_OPTION)
+        if socket_path is not None:
+            self.serve(socket_path)
+        shell, arguments = pop_option(arguments, SHELL_OPTION)
+        if shell is not None:
+            self.run_shell()
+        source, arguments = pop_option(arguments, BATCH_OPTION, True)
+        if source is not None:
+            # pylint: disable=import-outside-toplevel
+            from .batch import run_batch_option
+
+            run_batch_option(self, source, arguments)
+        arguments = arguments or ["--help"] if self.add_help else arguments
+        if self.help_cache and arguments in HELP_ARGUMENTS:
+            print_cached_help(
+                self.help_cache,
+                self.help_cache.get_key(self.parser),
+                lambda: self.parser,
+            )
+        return self.parse_arguments(arguments)
 
-    def populate_commands_param_help(
-        self,
-        commands: Dict[str, Callable[..., Any]],
+    def parse_arguments(self, arguments: List[str]) -> argparse.Namespace:
+        """
+        Parse arguments, with the fast path parser if it is enabled.
+
+        Parameters
+        ----------
+        arguments : List[str]
+            Arguments to be parsed.
+
+        Returns
+        -------
+        argparse.Namespace
+            Arguments in argparse's namespace.
+
+        """
+        if self.fast_parser:
+            namespace = self.fast_parser.parse_args(arguments)
+            if namespace is not None:
+                return namespace
+        return self.parser.parse_args(arguments)
+
+    def get_cli_file_path(self, name: str) -> str:
+        """
+        Get path of a file CLY?! writes for the CLI, like its completion table.
+
+        Parameters
+        ----------
+        name : str
+            File's name, like ``completion.json``.
+
+        Returns
+        -------
+        str
+            File in ``cache_dir``, if set; else, a hidden file next to the
+            script, prefixed by the script's name.
+
+        """
+        if self.cache_dir:
+            return os.path.join(self.cache_dir, name)
+        folder, script = os.path.split(os.path.realpath(sys.argv[0]))
+        return os.path.join(folder, f".{os.path.splitext(script)[0]}-{name}")
+
+    def serve(
+        self, socket_path: str = "", idle_timeout: Optional[float] = None
     ) -> None:
         """
-        Populate commands' parameters help with docstrings content.
+        Run CLI's requests in a resident daemon, until it is idle.
+
+        The daemon listens on a UNIX socket and it is restarted when a loaded
+        module's file changes. The command to call the CLI through it is
+        printed to stderr.
 
         Parameters
         ----------
-        commands : Dict[str, Callable[..., Any]]
-            Narrowed type self.commands.
+        socket_path : str
+            Path of the daemon's UNIX socket. If empty, ``daemon.sock`` in
+            ``cache_dir`` or a hidden file next to the script.
+        idle_timeout : Optional[float]
+            Seconds without requests before the daemon stops, by default None
+            (600 seconds).
+
+        Raises
+        ------
+        SystemExit
+            When the daemon stops.
+
+        """
+        from .daemon import serve  # pylint: disable=import-outside-toplevel
+
+        serve(self, socket_path, idle_timeout)
 
+    def run_arguments(self, arguments: List[str]) -> int:
         """
-        subparsers = self.parser._subparsers
-        if isinstance(subparsers, argparse._ArgumentGroup):
-            choices = subparsers._group_actions[0].choices
-            if isinstance(choices, dict):
-                iterate_through_params(commands, choices)
+        Run CLI with arguments, instead of the ones the script was called with.
+
+        External commands run in a child process, as the script keeps running,
+        like in batch mode or the shell.
+
+        Parameters
+        ----------
+        arguments : List[str]
+            Arguments to run the CLI with.
+
+        Returns
+        -------
+        int
+            Exit status.
+
+        """
+        arguments = arguments or ["--help"] if self.add_help else arguments
+        try:
+            namespace = self.parse_arguments(arguments)
+            external = getattr(namespace, EXTERNAL_DEST, None)
+            if external:
+                # pylint: disable=import-outside-toplevel
+                from .external import call_external_command
+
+                return call_external_command(external[0], external[1:])
+            if isinstance(self.commands, dict) and namespace.commands:
+                self.dispatch_command(
+                    namespace.commands, dict(namespace._get_kwargs())
+                )
+        except SystemExit as error:
+            # pylint: disable=import-outside-toplevel
+            from .hooks import get_exit_status
+
+            return get_exit_status(error.code)
+        except Exception:  # pylint: disable=broad-except
+            import traceback  # pylint: disable=import-outside-toplevel
+
+            traceback.print_exc()
+            return 1
+        return 0
+
+    def run_shell(self, timing: bool = True, **kwargs: Any) -> None:
+        """
+        Run an interactive shell, that runs each line as the CLI's arguments.
+
+        The CLI is only loaded once, errors do not stop the shell, and lines
+        are completed from the commands' tree and kept in a history file.
+
+        Parameters
+        ----------
+        timing : bool
+            If each command's wall time and exit status should be written to
+            stderr, by default True.
+        **kwargs : Any
+            ``cmd.Cmd`` arguments, like ``stdin`` and ``stdout``.
+
+        Raises
+        ------
+        SystemExit
+            When the shell is exited.
+
+        """
+        from .shell import run_shell  # pylint: disable=import-outside-toplevel
+
+        run_shell(self, timing, **kwargs)
+
+    @profiled("prepare_command")
+    def prepare_command(self, name: str) -> None:
+        """
+        Populate called command's parameters help with docstring content.
+
+        Only the called command is prepared, so lazy commands that are not
+        called are never imported.
+
+        Parameters
+        ----------
+        name : str
+            Name the command was called with.
+
+        """
+        if (
+            isinstance(self.commands, dict)
+            and name in self.commands
+            and self.subparser
+        ):
+            set_params_help(
+                self.subparser.choices[name],
+                get_command_params_help(self, name, self.commands[name]),
+            )
+
+    def call_command(
+        self, command: Callable[..., Any], kwargs: Dict[str, Any]
+    ) -> None:
+        """
+        Call command, running it on an event loop if it is async.
+
+        Parameters
+        ----------
+        command : Callable[..., Any]
+            Registered command, lazy or not.
+        kwargs : Dict[str, Any]
+            Arguments the script was called with, in argparse's namespace.
+
+        """
+        result = command(**kwargs)
+        if inspect.iscoroutine(result):
+            from .aio import (  # pylint: disable=import-outside-toplevel
+                run_coroutine,
+            )
+
+            run_coroutine(result, self.options.loop_factory)
+
+    def dispatch_command(self, name: str, kwargs: Dict[str, Any]) -> None:
+        """
+        Call command, and the hooks registered around it.
+
+        Parameters
+        ----------
+        name : str
+            Name the command was called with, prefixed by its groups' names.
+        kwargs : Dict[str, Any]
+            Arguments the script was called with, in argparse's namespace.
+
+        """
+        command = self.get_command(name)
+        if not any(self.hooks.values()):
+            self.call_command(command, kwargs)
+            return
+        # pylint: disable=import-outside-toplevel
+        from .hooks import call_with_hooks
+
+        call_with_hooks(
+            self.hooks,
+            name,
+            command,
+            kwargs,
+            functools.partial(self.call_command, command, kwargs),
+        )
 
     def __call__(self) -> None:
         """Initialize the CLI parser."""
-        if isinstance(self.commands, dict):
-            self.populate_commands_param_help(self.commands)
-            namespace = self.get_arguments()
-            if namespace.commands:
-                self.commands[namespace.commands](
-                    **dict(namespace._get_kwargs())
-                )
-        else:
-            self.get_arguments()
+        start_profiler(sys.argv[1:])
+        try:
+            if isinstance(self.commands, dict):
+                namespace = self.get_arguments()
+                external = getattr(namespace, EXTERNAL_DEST, None)
+                if external:
+                    # pylint: disable=import-outside-toplevel
+                    from .external import run_external_command
+
+                    run_external_command(self, external)
+                elif namespace.commands:
+                    with phase("command"):
+                        self.dispatch_command(
+                            namespace.commands, dict(namespace._get_kwargs())
+                        )
+            else:
+                self.get_arguments()
+        finally:
+            self.save_caches()
+            stop_profiler()
@@ -0,0 +1,487 @@
+"""
+Resident daemon of CLY?! CLIs, with a thin client.
+
+The server keeps the CLI's parser and commands' modules imported, and runs
+each request in-process, one at a time, with the client's arguments,
+environment, working directory and standard streams. The client only
+imports array, json, os, socket and sys, and it is run as a script (not as
+part of the cly package), so calling the CLI through it skips the CLI's
+imports. The server's functions only import the rest of CLY?! when called.
+"""
+
+import array
+import json
+import os
+import socket
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .config import ConfiguredParser
+
+DAEMON_FILE = "daemon.sock"
+DAEMON_IDLE_TIMEOUT = 600.0
+STDIO = (0, 1, 2)
+BUFFER_SIZE = 65536
+CLIENT_PATH = os.path.abspath(__file__)
+
+
+def get_sources_key() -> Dict[str, float]:
+    """
+    Get modification time of loaded modules' files.
+
+    Returns
+    -------
+    Dict[str, float]
+        Modification time of each loaded module's file, by path.
+
+    """
+    key: Dict[str, float] = {}
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if path and path not in key:
+            try:
+                key[path] = os.stat(path).st_mtime
+            except OSError:
+                continue
+    return key
+
+
+def receive_all(connection: socket.socket, data: bytes = b"") -> bytes:
+    """
+    Receive data until the other side stops sending.
+
+    Parameters
+    ----------
+    connection : socket.socket
+        Connected socket.
+    data : bytes
+        Data already received, by default empty.
+
+    Returns
+    -------
+    bytes
+        All data received.
+
+    """
+    chunks = [data]
+    chunk = connection.recv(BUFFER_SIZE)
+    while chunk:
+        chunks.append(chunk)
+        chunk = connection.recv(BUFFER_SIZE)
+    return b"".join(chunks)
+
+
+def send_request(
+    connection: socket.socket, request: Dict[str, Any], fds: Sequence[int]
+) -> None:
+    """
+    Send request with file descriptors of standard streams.
+
+    Parameters
+    ----------
+    connection : socket.socket
+        Socket connected to the server.
+    request : Dict[str, Any]
+        Arguments, environment and working directory.
+    fds : Sequence[int]
+        File descriptors of stdin, stdout and stderr.
+
+    """
+    data = json.dumps(request).encode("utf-8")
+    connection.sendmsg(
+        [data[:1]],
+        [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))],
+    )
+    connection.sendall(data[1:])
+    connection.shutdown(socket.SHUT_WR)
+
+
+def receive_request(
+    connection: socket.socket,
+) -> Tuple[Dict[str, Any], List[int]]:
+    """
+    Receive request with file descriptors of standard streams.
+
+    Parameters
+    ----------
+    connection : socket.socket
+        Socket connected to the client.
+
+    Returns
+    -------
+    Tuple[Dict[str, Any], List[int]]
+        Request and received file descriptors, that must be closed.
+
+    """
+    fds = array.array("i")
+    data, ancillary_data, _, _ = connection.recvmsg(
+        BUFFER_SIZE, socket.CMSG_SPACE(len(STDIO) * fds.itemsize)
+    )
+    for level, kind, fds_data in ancillary_data:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(
+                fds_data[: len(fds_data) - len(fds_data) % fds.itemsize]
+            )
+    request: Dict[str, Any] = json.loads(
+        receive_all(connection, data).decode("utf-8")
+    )
+    return request, list(fds)
+
+
+class DaemonServer:
+    """Server that runs a CLI's requests in-process, one at a time."""
+
+    path: str
+    handle: Callable[[], int]
+    idle_timeout: float
+    sources: Dict[str, float]
+
+    def __init__(
+        self,
+        path: str,
+        handle: Callable[[], int],
+        idle_timeout: float = DAEMON_IDLE_TIMEOUT,
+    ) -> None:
+        """
+        Create daemon server.
+
+        Parameters
+        ----------
+        path : str
+            Path of the UNIX socket to listen on.
+        handle : Callable[[], int]
+            Function that runs the CLI with ``sys.argv``, returning its exit
+            status.
+        idle_timeout : float
+            Seconds without requests before the server stops, by default
+            600.
+
+        """
+        self.path = path
+        self.handle = handle
+        self.idle_timeout = idle_timeout
+        self.sources = get_sources_key()
+
+    def sources_changed(self) -> bool:
+        """
+        Check if a loaded module's file changed since it was loaded.
+
+        Returns
+        -------
+        bool
+            If a file was modified or removed.
+
+        """
+        for path, modification_time in self.sources.items():
+            try:
+                if os.stat(path).st_mtime != modification_time:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def serve(self) -> bool:
+        """
+        Listen on the socket and run requests, until idle or outdated.
+
+        Returns
+        -------
+        bool
+            True if the server stopped because a loaded module's file
+            changed, so it must be restarted; False if it was idle.
+
+        """
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(self.path)
+            server.listen()
+            server.settimeout(self.idle_timeout)
+            while True:
+                try:
+                    connection, _ = server.accept()
+                except socket.timeout:
+                    return False
+                with connection:
+                    connection.settimeout(None)
+                    if not self.handle_connection(connection):
+                        return True
+        finally:
+            server.close()
+            os.unlink(self.path)
+
+    def handle_connection(self, connection: socket.socket) -> bool:
+        """
+        Run client's request, sending back its exit status.
+
+        If a loaded module's file changed, the request is not run, so the
+        client runs the CLI itself.
+
+        Parameters
+        ----------
+        connection : socket.socket
+            Socket connected to the client.
+
+        Returns
+        -------
+        bool
+            If the request was run.
+
+        """
+        request, fds = receive_request(connection)
+        reply: Dict[str, int] = {}
+        try:
+            if not self.sources_changed():
+                reply["status"] = (
+                    self.run_request(request, fds)
+                    if len(fds) == len(STDIO)
+                    else 1
+                )
+        finally:
+            for fd in fds:
+                os.close(fd)
+        connection.sendall(json.dumps(reply).encode("utf-8"))
+        for path, modification_time in get_sources_key().items():
+            self.sources.setdefault(path, modification_time)
+        return bool(reply)
+
+    def run_request(self, request: Dict[str, Any], fds: List[int]) -> int:
+        """
+        Run request with client's process state, restoring server's one.
+
+        Parameters
+        ----------
+        request : Dict[str, Any]
+            Arguments, environment and working directory.
+        fds : List[int]
+            File descriptors of client's stdin, stdout and stderr.
+
+        Returns
+        -------
+        int
+            Exit status.
+
+        """
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved_fds = [os.dup(fd) for fd in STDIO]
+        argv, cwd, environ = sys.argv, os.getcwd(), dict(os.environ)
+        try:
+            for fd, received_fd in zip(STDIO, fds):
+                os.dup2(received_fd, fd)
+            os.environ.clear()
+            os.environ.update(request["environ"])
+            os.chdir(request["cwd"])
+            sys.argv = request["argv"]
+            return self.handle()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            sys.argv = argv
+            os.chdir(cwd)
+            os.environ.clear()
+            os.environ.update(environ)
+            for fd, saved_fd in zip(STDIO, saved_fds):
+                os.dup2(saved_fd, fd)
+                os.close(saved_fd)
+
+
+def run_client(
+    path: str, arguments: List[str], fds: Sequence[int] = STDIO
+) -> Optional[int]:
+    """
+    Run CLI in the daemon listening on the socket.
+
+    Parameters
+    ----------
+    path : str
+        Path of the daemon's UNIX socket.
+    arguments : List[str]
+        Arguments, starting with the CLI's script.
+    fds : Sequence[int]
+        File descriptors of stdin, stdout and stderr, by default the
+        process' ones.
+
+    Returns
+    -------
+    Optional[int]
+        Exit status, or None if the daemon did not run the request, because
+        it is not running or it must be restarted.
+
+    """
+    request = {
+        "argv": arguments,
+        "environ": dict(os.environ),
+        "cwd": os.getcwd(),
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(path)
+            send_request(connection, request, fds)
+        except OSError:
+            return None
+        try:
+            reply = json.loads(receive_all(connection).decode("utf-8"))
+        except (OSError, ValueError):
+            return 1
+    if "status" not in reply:
+        return None
+    status: int = reply["status"]
+    return status
+
+
+def get_client_command(socket_path: str) -> str:
+    """
+    Get shell command that calls the CLI through its daemon.
+
+    The client runs with ``python -S -E`` and, if the daemon is not
+    running, it runs the script itself.
+
+    Parameters
+    ----------
+    socket_path : str
+        Path of the daemon's UNIX socket.
+
+    Returns
+    -------
+    str
+        Client's command, to be followed by the CLI's arguments.
+
+    """
+    from .completion import quote  # pylint: disable=import-outside-toplevel
+
+    return " ".join(
+        quote(part)
+        for part in (
+            sys.executable,
+            "-S",
+            "-E",
+            CLIENT_PATH,
+            socket_path,
+            os.path.realpath(sys.argv[0]),
+        )
+    )
+
+
+def run_request(cli: "ConfiguredParser") -> int:
+    """
+    Run CLI with the daemon client's arguments.
+
+    Parameters
+    ----------
+    cli : ConfiguredParser
+        CLI to run.
+
+    Returns
+    -------
+    int
+        Exit status.
+
+    """
+    # pylint: disable=import-outside-toplevel
+    import traceback
+
+    from .hooks import get_exit_status
+
+    try:
+        cli()
+    except SystemExit as error:
+        return get_exit_status(error.code)
+    except Exception:  # pylint: disable=broad-except
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def serve(
+    cli: "ConfiguredParser",
+    socket_path: str = "",
+    idle_timeout: Optional[float] = None,
+) -> None:
+    """
+    Run CLI's requests in a resident daemon, as set by ``--cly-serve``.
+
+    The daemon is restarted, running the script again, when a loaded
+    module's file changes. External commands run in a child process, so they
+    do not replace the daemon's process.
+
+    Parameters
+    ----------
+    cli : ConfiguredParser
+        CLI to run the requests with.
+    socket_path : str
+        Path of the daemon's UNIX socket. If empty, ``daemon.sock`` in
+        CLI's ``cache_dir`` or a hidden file next to the script.
+    idle_timeout : Optional[float]
+        Seconds without requests before the daemon stops, by default None
+        (``DAEMON_IDLE_TIMEOUT``).
+
+    Raises
+    ------
+    SystemExit
+        When the daemon stops.
+
+    """
+    # pylint: disable=import-outside-toplevel
+    from .profiler import stop_profiler
+
+    path = socket_path or str(cli.get_cli_file_path(DAEMON_FILE))
+    argv = list(sys.argv)
+    cli.replace_process = False
+    sys.stderr.write(
+        f"Serving {cli.name} on {path}. Call it with:\n"
+        f"  {get_client_command(path)}\n"
+    )
+    sys.stderr.flush()
+    server = DaemonServer(
+        path,
+        lambda: run_request(cli),
+        DAEMON_IDLE_TIMEOUT if idle_timeout is None else idle_timeout,
+    )
+    if server.serve():
+        cli.save_caches()
+        stop_profiler()
+        os.execv(sys.executable, [sys.executable, *argv])  # nosec
+    raise SystemExit(0)
+
+
+def main(arguments: List[str]) -> int:
+    """
+    Run CLI in its daemon, or in this process if the daemon is not running.
+
+    Parameters
+    ----------
+    arguments : List[str]
+        Daemon's socket path, CLI's script path and the CLI's arguments.
+
+    Returns
+    -------
+    int
+        Exit status.
+
+    """
+    if len(arguments) < 2:
+        sys.stderr.write("Usage: daemon.py SOCKET SCRIPT [ARGUMENTS...]\n")
+        return 2
+    path, *argv = arguments
+    status = run_client(path, argv)
+    if status is None:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(sys.executable, [sys.executable, *argv])  # nosec
+    return status
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main(sys.argv[1:]))
@@ -1,7 +1,8 @@
 """Docstring parser."""
 
+import functools
 import inspect
-from typing import Any, Callable, List, Tuple
+from typing import Any, Callable, Dict, List, Optional
 
 # https://numpydoc.readthedocs.io/en/latest/format.html
 NUMPY = "NUMPY"
@@ -14,6 +15,10 @@ GOOGLE_PARAMS = "Args:"
 SPHINX_PARAM = ":param"
 SPHINX_RETURNS = ":returns"
 SPHINX_RAISES = ":raises"
+NUMPY_DEFAULT = ", by default"
+GOOGLE_DEFAULT = " Defaults to"
+SPHINX_DEFAULT = ", defaults to"
+DOCSTRING_CACHE_SIZE = 512
 DOCSTRING_SECTIONS = {
     # ".. deprecated::": True,
     NUMPY_PARAMS: True,
@@ -35,73 +40,119 @@ DOCSTRING_SECTIONS = {
     "Raises:": True,
     "Attributes:": True,
 }
-DOCSTRING_STYLES_PARAMS = {
-    NUMPY: NUMPY_PARAMS,
-    GOOGLE: GOOGLE_PARAMS,
-}
 
 
-def get_help_from_docstring(command: Callable[..., Any]) -> str:
+class ParsedDocstring:
+    """Docstring of a callable object, parsed in a single pass."""
+
+    summary: str
+    description: str
+    params: Dict[str, str]
+    style: str
+
+    def __init__(
+        self,
+        summary: str = "",
+        description: str = "",
+        params: Optional[Dict[str, str]] = None,
+        style: str = "",
+    ) -> None:
+        """
+        Initialize parsed docstring.
+
+        Parameters
+        ----------
+        summary : str, optional
+            First line of the docstring, by default ""
+        description : str, optional
+            Docstring content before its first section, by default ""
+        params : Optional[Dict[str, str]]
+            Help message of each parameter, by default None (no parameters)
+        style : str, optional
+            Docstring style (NUMPY, GOOGLE or SPHINX), by default "" (no
+            style detected)
+
+        """
+        self.summary = summary
+        self.description = description
+        self.params = params or {}
+        self.style = style
+
+
+def format_param_help(lines: List[str], default_separator: str) -> str:
     """
-    Get help message from callable object.
+    Format parameter help message from its description lines.
 
     Parameters
     ----------
-    command : Callable[..., Any]
-        Callable object (command, callback, ...).
+    lines : List[str]
+        Stripped lines of the parameter's description.
+    default_separator : str
+        Text that introduces the parameter's default value, which is removed.
 
     Returns
     -------
     str
-        Docstring summary, if exists.
+        Parameter help message, ending with a period.
 
     """
-    docstring = inspect.getdoc(command)
-    if not docstring:
-        return ""
-    docstring_lines = docstring.strip().splitlines(keepends=True)
-    help_message = ""
-    for line in docstring_lines:
-        if DOCSTRING_SECTIONS.get(line.strip()) or line.strip().startswith(
-            (SPHINX_PARAM, SPHINX_RETURNS, SPHINX_RAISES)
-        ):
-            break
-        help_message += line
+    help_message = " ".join(line for line in lines if line)
+    help_message = help_message.split(default_separator)[0].strip()
+    if help_message and help_message[-1] != ".":
+        help_message += "."
     return help_message
 
 
-def get_index_of_sphinx_param_section(
-    docstring_lines: List[str],
-) -> Tuple[int, str]:
+def get_params_from_numpy_docstring(
+    docstring_lines: List[str], index_param_section: int
+) -> Dict[str, str]:
     """
-    Get list index of Sphinx parameters section in docstring lines.
+    Get parameters help messages from Numpy style docstring.
 
     Parameters
     ----------
     docstring_lines : List[str]
         Lines of the docstring.
+    index_param_section : int
+        List index of the parameters section in the lines of the docstring.
 
     Returns
     -------
-    Tuple[int, str]
-        Index and docstring style.
+    Dict[str, str]
+        Help message of each parameter.
 
     """
-    index_param_section = 0
-    docstring_style = ""
-    for index, line in enumerate(docstring_lines):
-        if line.strip().startswith(SPHINX_PARAM):
-            index_param_section = index - 1
-            docstring_style = SPHINX
+    params: Dict[str, str] = {}
+    names: List[str] = []
+    description: List[str] = []
+    for line in docstring_lines[index_param_section + 1 :]:
+        stripped = line.strip()
+        if DOCSTRING_SECTIONS.get(stripped):
             break
-    return index_param_section, docstring_style
+        if not stripped or not stripped.strip("-"):
+            continue
+        if line[0].isspace():
+            description.append(stripped)
+            continue
+        params.update(
+            dict.fromkeys(names, format_param_help(description, NUMPY_DEFAULT))
+        )
+        names = [
+            name.strip().lstrip("*")
+            for name in line.split(":", maxsplit=1)[0].split(",")
+        ]
+        description = []
+    params.update(
+        dict.fromkeys(names, format_param_help(description, NUMPY_DEFAULT))
+    )
+    return params
 
 
-def get_param_help_from_numpy_docstring(
-    docstring_lines: List[str], index_param_section: int, param_name: str
-) -> str:
+def get_params_from_google_docstring(
+    docstring_lines: List[str], index_param_section: int
+) -> Dict[str, str]:
     """
-    Get parameter help message from Numpy style docstring.
+    Get parameters help messages from Google style docstring.
 
     Parameters
     ----------
@@ -109,91 +160,170 @@ def get_param_help_from_numpy_docstring(
         Lines of the docstring.
     index_param_section : int
         List index of the parameters section in the lines of the docstring.
-    param_name : str
-        Name of the parameter.
 
     Returns
     -------
-    str
-        Parameter help message, if any.
+    Dict[str, str]
+        Help message of each parameter.
 
     """
-    index_param_section += 1
-    help_message = ""
-    for index, line in enumerate(docstring_lines[index_param_section:]):
-        if line.strip().startswith(param_name):
-            help_message = docstring_lines[index + index_param_section + 1]
-            help_message = help_message.split(", by default")[0]
-            if help_message[-1] != ".":
-                help_message += "."
+    params: Dict[str, str] = {}
+    name = ""
+    description: List[str] = []
+    entry_indent = 0
+    for line in docstring_lines[index_param_section + 1 :]:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        indent = len(line) - len(line.lstrip())
+        if not indent:
             break
-    return help_message.strip()
-
-
-def get_param_help_from_google_docstring(
-    docstring_lines: List[str], index_param_section: int, param_name: str
-) -> str:
+        if entry_indent and indent > entry_indent:
+            description.append(stripped)
+            continue
+        if name:
+            params[name] = format_param_help(description, GOOGLE_DEFAULT)
+        entry_indent = indent
+        entry, _, text = stripped.partition(":")
+        name = entry.split("(", maxsplit=1)[0].strip().lstrip("*")
+        description = [text.strip()]
+    if name:
+        params[name] = format_param_help(description, GOOGLE_DEFAULT)
+    return params
+
+
+def get_params_from_sphinx_docstring(
+    docstring_lines: List[str], index_param_section: int
+) -> Dict[str, str]:
     """
-    Get parameter help message from Google style docstring.
+    Get parameters help messages from Sphinx style docstring.
 
     Parameters
     ----------
     docstring_lines : List[str]
         Lines of the docstring.
     index_param_section : int
-        List index of the parameters section in the lines of the docstring.
-    param_name : str
-        Name of the parameter.
+        List index of the first parameter in the lines of the docstring.
 
     Returns
     -------
-    str
-        Parameter help message, if any.
+    Dict[str, str]
+        Help message of each parameter.
 
     """
-    help_message = ""
-    for index, line in enumerate(docstring_lines[index_param_section:]):
-        if line.strip().startswith(param_name):
-            help_message = docstring_lines[index + index_param_section]
-            help_message = help_message.split(":", maxsplit=2)[1]
-            help_message = help_message.split(" Defaults to", maxsplit=2)[0]
-            if help_message[-1] != ".":
-                help_message += "."
+    params: Dict[str, str] = {}
+    name = ""
+    description: List[str] = []
+    for line in docstring_lines[index_param_section:]:
+        stripped = line.strip()
+        if stripped and not stripped.startswith(":"):
+            description.append(stripped)
+            continue
+        if name:
+            params[name] = format_param_help(description, SPHINX_DEFAULT)
+        name = ""
+        if stripped.startswith(f"{SPHINX_PARAM} "):
+            field, _, text = stripped[1:].partition(":")
+            name = field.split()[-1].lstrip("*")
+            description = [text.strip()]
+    if name:
+        params[name] = format_param_help(description, SPHINX_DEFAULT)
+    return params
+
+
+@functools.lru_cache(maxsize=DOCSTRING_CACHE_SIZE)
+def parse_docstring(docstring: str) -> ParsedDocstring:
+    """
+    Parse docstring, only once for each docstring content.
+
+    Parameters
+    ----------
+    docstring : str
+        Cleaned docstring, as returned by ``inspect.getdoc``.
+
+    Returns
+    -------
+    ParsedDocstring
+        Docstring's summary, description, parameters and style.
+
+    """
+    docstring_lines = docstring.strip().splitlines()
+    if not docstring_lines:
+        return ParsedDocstring()
+    description_end = len(docstring_lines)
+    sections_indexes: Dict[str, int] = {}
+    for index, line in enumerate(docstring_lines):
+        stripped = line.strip()
+        is_sphinx_field = stripped.startswith(
+            (SPHINX_PARAM, SPHINX_RETURNS, SPHINX_RAISES)
+        )
+        if description_end == len(docstring_lines) and (
+            DOCSTRING_SECTIONS.get(stripped) or is_sphinx_field
+        ):
+            description_end = index
+        if index and line in (NUMPY_PARAMS, GOOGLE_PARAMS):
+            sections_indexes.setdefault(line, index)
+        elif stripped.startswith(SPHINX_PARAM):
+            sections_indexes.setdefault(SPHINX_PARAM, index)
+    description = "\n".join(docstring_lines[:description_end])
+    if description_end < len(docstring_lines):
+        description += "\n"
+    style = ""
+    params: Dict[str, str] = {}
+    for section, section_style, get_params in (
+        (NUMPY_PARAMS, NUMPY, get_params_from_numpy_docstring),
+        (GOOGLE_PARAMS, GOOGLE, get_params_from_google_docstring),
+        (SPHINX_PARAM, SPHINX, get_params_from_sphinx_docstring),
+    ):
+        if section in sections_indexes:
+            style = section_style
+            params = get_params(docstring_lines, sections_indexes[section])
             break
-    return help_message.strip()
+    return ParsedDocstring(
+        summary=docstring_lines[0].strip(),
+        description=description,
+        params=params,
+        style=style,
+    )
 
 
-def get_param_help_from_sphinx_docstring(
-    docstring_lines: List[str], index_param_section: int, param_name: str
-) -> str:
+def get_parsed_docstring(command: Callable[..., Any]) -> ParsedDocstring:
     """
-    Get parameter help message from Sphinx style docstring.
+    Get parsed docstring of callable object.
+
+    Parsed docstrings are cached by their content, so a command's docstring is
+    parsed once, no matter how many parameters the command has.
 
     Parameters
     ----------
-    docstring_lines : List[str]
-        Lines of the docstring.
-    index_param_section : int
-        List index of the parameters section in the lines of the docstring.
-    param_name : str
-        Name of the parameter.
+    command : Callable[..., Any]
+        Callable object (command, callback, ...).
+
+    Returns
+    -------
+    ParsedDocstring
+        Docstring's summary, description, parameters and style.
+
+    """
+    return parse_docstring(inspect.getdoc(command) or "")
+
+
+def get_help_from_docstring(command: Callable[..., Any]) -> str:
+    """
+    Get help message from callable object.
+
+    Parameters
+    ----------
+    command : Callable[..., Any]
+        Callable object (command, callback, ...).
 
     Returns
     -------
     str
-        Parameter help message, if any.
+        Docstring summary, if exists.
 
     """
-    help_message = ""
-    for index, line in enumerate(docstring_lines[index_param_section:]):
-        if line.strip().startswith(f"{SPHINX_PARAM} {param_name}"):
-            help_message = docstring_lines[index + index_param_section]
-            help_message = help_message.split(":", maxsplit=3)[2]
-            help_message = help_message.split(", defaults to", maxsplit=2)[0]
-            if help_message[-1] != ".":
-                help_message += "."
-            break
-    return help_message.strip()
+    return get_parsed_docstring(command).description
 
 
 def get_param_help_from_docstring(
@@ -215,35 +345,4 @@ def get_param_help_from_docstring(
         Parameter help message, if any.
 
     """
-    docstring = inspect.getdoc(command)
-    if not docstring:
-        return ""
-    docstring_lines = docstring.strip().splitlines()
-    index_param_section = 0
-    docstring_style = ""
-    for style, param_section in DOCSTRING_STYLES_PARAMS.items():
-        try:
-            index_param_section = docstring_lines.index(param_section)
-            if index_param_section:
-                docstring_style = style
-                break
-        except ValueError:
-            continue
-    if not docstring_style:
-        (
-            index_param_section,
-            docstring_style,
-        ) = get_index_of_sphinx_param_section(docstring_lines)
-    if not docstring_style:
-        return ""
-
-    get_help_message = {
-        NUMPY: get_param_help_from_numpy_docstring,
-        GOOGLE: get_param_help_from_google_docstring,
-        SPHINX: get_param_help_from_sphinx_docstring,
-    }
-    return get_help_message[docstring_style](
-        docstring_lines=docstring_lines,
-        index_param_section=index_param_section,
-        param_name=param_name,
-    )
+    return get_parsed_docstring(command).params.get(param_name, "")
@@ -0,0 +1,214 @@
+"""Discovery of external commands, executables named ``<prefix>-<command>``."""
+
+import argparse
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .cache import get_modification_time, read_json, write_json
+from .profiler import stop_profiler
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .config import ConfiguredParser
+
+EXTERNAL_FILE = "external.json"
+EXTERNAL_FORMAT = 1
+
+
+def get_path_directories() -> List[str]:
+    """
+    Get directories of the PATH environment variable.
+
+    Returns
+    -------
+    List[str]
+        PATH's directories, in order.
+
+    """
+    return [
+        directory
+        for directory in os.environ.get("PATH", os.defpath).split(os.pathsep)
+        if directory
+    ]
+
+
+def find_external_commands(
+    prefix: str, directories: List[str]
+) -> Dict[str, str]:
+    """
+    Find executables named ``<prefix>-<command>`` in directories.
+
+    Parameters
+    ----------
+    prefix : str
+        Executables' prefix, like the CLI's name.
+    directories : List[str]
+        Directories to search in. If an executable is found in more than one
+        directory, the first one is used, like in PATH.
+
+    Returns
+    -------
+    Dict[str, str]
+        Path of each command's executable.
+
+    """
+    start = f"{prefix}-"
+    commands: Dict[str, str] = {}
+    for directory in directories:
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            name = entry.name[len(start) :]
+            if (
+                entry.name.startswith(start)
+                and name
+                and name not in commands
+                and entry.is_file()
+                and os.access(entry.path, os.X_OK)
+            ):
+                commands[name] = entry.path
+    return commands
+
+
+def discover_external_commands(
+    prefix: str, cache_dir: Optional[str] = None
+) -> Dict[str, str]:
+    """
+    Discover external commands on PATH.
+
+    If ``cache_dir`` is passed, discovered commands are stored in an index
+    file, only refreshed when PATH or its directories change.
+
+    Parameters
+    ----------
+    prefix : str
+        Executables' prefix, like the CLI's name.
+    cache_dir : Optional[str]
+        Folder to store the index file in, by default None (no index).
+
+    Returns
+    -------
+    Dict[str, str]
+        Path of each command's executable.
+
+    """
+    directories = get_path_directories()
+    key: List[Any] = [
+        prefix,
+        [
+            [directory, get_modification_time(directory)]
+            for directory in directories
+        ],
+    ]
+    path = os.path.join(cache_dir, EXTERNAL_FILE) if cache_dir else None
+    content = read_json(path) if path else {}
+    if content.get("format") == EXTERNAL_FORMAT and content.get("key") == key:
+        commands: Dict[str, str] = content["commands"]
+        return commands
+    commands = find_external_commands(prefix, directories)
+    if path:
+        write_json(
+            path,
+            {"format": EXTERNAL_FORMAT, "key": key, "commands": commands},
+        )
+    return commands
+
+
+def add_external_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Configure external command's parser to accept any arguments.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        External command's parser.
+
+    """
+    parser.add_argument("arguments", nargs=argparse.REMAINDER)
+
+
+def exec_external_command(path: str, arguments: List[str]) -> None:
+    """
+    Replace the current process by the external command.
+
+    Parameters
+    ----------
+    path : str
+        Path of the command's executable.
+    arguments : List[str]
+        Arguments to call the command with.
+
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execvp(path, [path, *arguments])  # nosec
+
+
+def call_external_command(path: str, arguments: List[str]) -> int:
+    """
+    Run the external command in a child process, writing its output.
+
+    Used by runners that keep the process, like batch mode, the shell or the
+    daemon. The command's output is written to ``sys.stdout`` and
+    ``sys.stderr`` when it finishes, so runners that capture them, like batch
+    mode, capture it too.
+
+    Parameters
+    ----------
+    path : str
+        Path of the command's executable.
+    arguments : List[str]
+        Arguments to call the command with.
+
+    Returns
+    -------
+    int
+        Command's exit status.
+
+    """
+    # pylint: disable=import-outside-toplevel
+    import subprocess  # nosec
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    result = subprocess.run(  # nosec
+        [path, *arguments],
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+    sys.stdout.write(result.stdout)
+    sys.stderr.write(result.stderr)
+    return result.returncode
+
+
+def run_external_command(cli: "ConfiguredParser", command: List[str]) -> None:
+    """
+    Run the external command, replacing the script's process if allowed.
+
+    Caches are saved and the profiler's report is written before the process
+    is replaced, since the script does not finish normally. If
+    ``replace_process`` is not set, like in the daemon, the command runs in a
+    child process instead, and the script exits with its status.
+
+    Parameters
+    ----------
+    cli : cly.config.ConfiguredParser
+        CLI the command was called from.
+    command : List[str]
+        Path of the command's executable, followed by its arguments.
+
+    Raises
+    ------
+    SystemExit
+        With the command's exit status, if it runs in a child process.
+
+    """
+    path, *arguments = command
+    if not cli.replace_process:
+        raise SystemExit(call_external_command(path, arguments))
+    cli.save_caches()
+    stop_profiler()
+    exec_external_command(path, arguments)
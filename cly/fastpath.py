@@ -0,0 +1,449 @@
+"""
+Fast path parser for common shapes of arguments, with argparse fallback.
+
+It handles flags, ``store`` options, positionals with one or ``+`` values
+and commands with table lookups. Anything else, including errors, falls back
+to argparse, so argparse's behavior and messages are kept.
+"""
+
+import argparse
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, cast
+
+OPTION_PREFIX = "-"
+LONG_OPTION_PREFIX = "--"
+VALUE_SEPARATOR = "="
+SAFE_TYPES = (None, str, int, float, Path)
+FLAG_ACTIONS = (
+    argparse._StoreTrueAction,
+    argparse._StoreFalseAction,
+    argparse._StoreConstAction,
+)
+FALLBACK_ACTIONS = (argparse._HelpAction, argparse._VersionAction)
+
+
+class FallbackError(Exception):
+    """Arguments must be parsed by argparse."""
+
+
+class ParserPlan:
+    """Lookup tables of a parser's actions."""
+
+    options: Dict[str, argparse.Action]
+    positionals: List[argparse.Action]
+    commands: Optional[argparse._SubParsersAction]  # type: ignore[type-arg]
+
+    def __init__(self, parser: argparse.ArgumentParser) -> None:
+        """
+        Compile parser's lookup tables.
+
+        Parameters
+        ----------
+        parser : argparse.ArgumentParser
+            Parser to be compiled.
+
+        Raises
+        ------
+        FallbackError
+            If parser has features the fast path does not handle.
+
+        """
+        if (
+            parser.prefix_chars != OPTION_PREFIX
+            or parser.fromfile_prefix_chars
+            or parser._mutually_exclusive_groups
+        ):
+            raise FallbackError("Parser is not supported.")
+        self.options = {}
+        self.positionals = []
+        self.commands = None
+        for action in parser._actions:
+            if not is_supported(action):
+                raise FallbackError(f"Action {action} is not supported.")
+            if isinstance(action, argparse._SubParsersAction):
+                self.commands = action
+            elif not action.option_strings:
+                self.positionals.append(action)
+            for option_string in action.option_strings:
+                self.options[option_string] = action
+        if self.commands and self.positionals:
+            raise FallbackError("Commands with positionals are not supported.")
+        if sum(action.nargs == "+" for action in self.positionals) > 1:
+            raise FallbackError("Positionals are ambiguous.")
+
+
+def is_supported(action: argparse.Action) -> bool:
+    """
+    Check if the fast path handles the action.
+
+    Parameters
+    ----------
+    action : argparse.Action
+        Parser's action.
+
+    Returns
+    -------
+    bool
+        If action is a flag, a ``store`` action with one value (or ``+``
+        values, if positional) and a safe type, commands, or help and
+        version (which always fall back when used).
+
+    """
+    if isinstance(action, argparse._SubParsersAction):
+        return True
+    action_class = type(action)
+    if action_class in FLAG_ACTIONS or action_class in FALLBACK_ACTIONS:
+        return True
+    return (
+        action_class is argparse._StoreAction
+        and action.type in SAFE_TYPES
+        and (
+            action.nargs is None
+            or (action.nargs == "+" and not action.option_strings)
+        )
+    )
+
+
+def get_value(action: argparse.Action, text: str) -> Any:
+    """
+    Convert argument to action's type, checking action's choices.
+
+    Parameters
+    ----------
+    action : argparse.Action
+        Parser's action.
+    text : str
+        Argument.
+
+    Returns
+    -------
+    Any
+        Converted value.
+
+    Raises
+    ------
+    FallbackError
+        If value is not one of action's choices.
+
+    """
+    value = cast(Callable[[str], Any], action.type or str)(text)
+    if action.choices is not None and value not in action.choices:
+        raise FallbackError(f"Invalid choice {value!r}.")
+    return value
+
+
+def is_option(argument: str) -> bool:
+    """
+    Check if argument looks like an option, for argparse.
+
+    Parameters
+    ----------
+    argument : str
+        Argument.
+
+    Returns
+    -------
+    bool
+        If argument starts with ``-``, and is not just ``-``.
+
+    """
+    return argument.startswith(OPTION_PREFIX) and argument != OPTION_PREFIX
+
+
+class FastParser:
+    """Parser that handles common shapes of arguments with table lookups."""
+
+    plans: Dict[int, Tuple[int, Optional[ParserPlan]]]
+    parser: argparse.ArgumentParser
+
+    def __init__(self, parser: argparse.ArgumentParser) -> None:
+        """
+        Create fast path parser of a parsers' tree.
+
+        Parameters
+        ----------
+        parser : argparse.ArgumentParser
+            Tree's root parser.
+
+        """
+        self.parser = parser
+        self.plans = {}
+
+    def get_plan(self, parser: argparse.ArgumentParser) -> ParserPlan:
+        """
+        Get parser's lookup tables, compiled once.
+
+        Plans are compiled again if actions are added to the parser.
+
+        Parameters
+        ----------
+        parser : argparse.ArgumentParser
+            Parser of the tree.
+
+        Returns
+        -------
+        ParserPlan
+            Parser's lookup tables.
+
+        Raises
+        ------
+        FallbackError
+            If parser has features the fast path does not handle.
+
+        """
+        actions, plan = self.plans.get(id(parser), (-1, None))
+        if actions != len(parser._actions):
+            try:
+                plan = ParserPlan(parser)
+            except FallbackError:
+                plan = None
+            self.plans[id(parser)] = (len(parser._actions), plan)
+        if plan is None:
+            raise FallbackError("Parser is not supported.")
+        return plan
+
+    def parse_args(self, arguments: List[str]) -> Optional[argparse.Namespace]:
+        """
+        Parse arguments, like ``argparse.ArgumentParser.parse_args``.
+
+        Parameters
+        ----------
+        arguments : List[str]
+            Arguments to be parsed.
+
+        Returns
+        -------
+        Optional[argparse.Namespace]
+            Arguments in argparse's namespace, or None if arguments must be
+            parsed by argparse.
+
+        """
+        try:
+            return self.parse_parser_args(self.parser, arguments)
+        except Exception:  # pylint: disable=broad-except
+            # argparse parses them again, to report errors as usual
+            return None
+
+    def parse_parser_args(
+        self, parser: argparse.ArgumentParser, arguments: List[str]
+    ) -> argparse.Namespace:
+        """
+        Parse arguments of a parser of the tree.
+
+        Parameters
+        ----------
+        parser : argparse.ArgumentParser
+            Parser of the tree.
+        arguments : List[str]
+            Arguments to be parsed.
+
+        Returns
+        -------
+        argparse.Namespace
+            Arguments in argparse's namespace.
+
+        Raises
+        ------
+        FallbackError
+            If arguments must be parsed by argparse.
+
+        """
+        plan = self.get_plan(parser)
+        namespace = argparse.Namespace()
+        for action in parser._actions:
+            if (
+                action.dest != argparse.SUPPRESS
+                and action.default != argparse.SUPPRESS
+                and not hasattr(namespace, action.dest)
+            ):
+                setattr(namespace, action.dest, action.default)
+        for dest, value in parser._defaults.items():
+            if not hasattr(namespace, dest):
+                setattr(namespace, dest, value)
+        seen: Set[argparse.Action] = set()
+        positionals: List[str] = []
+        last_positional = -1
+        index = 0
+        while index < len(arguments):
+            if not is_option(arguments[index]):
+                index += 1
+                if plan.commands:
+                    self.call_command(
+                        plan.commands, namespace, arguments[index - 1 :]
+                    )
+                    seen.add(plan.commands)
+                    break
+                if positionals and last_positional != index - 2:
+                    raise FallbackError("Positionals are not contiguous.")
+                positionals.append(arguments[index - 1])
+                last_positional = index - 1
+                continue
+            index = self.set_option(plan, namespace, arguments, index, seen)
+        self.set_positionals(plan, namespace, positionals, seen)
+        for action in parser._actions:
+            if action in seen:
+                continue
+            if action.required:
+                raise FallbackError(f"Action {action.dest} is required.")
+            if (
+                isinstance(action.default, str)
+                and hasattr(namespace, action.dest)
+                and action.default is getattr(namespace, action.dest)
+            ):
+                setattr(
+                    namespace, action.dest, get_value(action, action.default)
+                )
+        return namespace
+
+    def set_option(
+        self,
+        plan: ParserPlan,
+        namespace: argparse.Namespace,
+        arguments: List[str],
+        index: int,
+        seen: Set[argparse.Action],
+    ) -> int:
+        """
+        Set option's value, like ``--option value`` or ``--option=value``.
+
+        Parameters
+        ----------
+        plan : ParserPlan
+            Parser's lookup tables.
+        namespace : argparse.Namespace
+            Namespace being populated.
+        arguments : List[str]
+            Arguments being parsed.
+        index : int
+            Index of the option in arguments.
+        seen : Set[argparse.Action]
+            Actions that were set, updated with the option's action.
+
+        Returns
+        -------
+        int
+            Index of the argument after the option and its value.
+
+        Raises
+        ------
+        FallbackError
+            If the option is unknown, abbreviated, help or version, or its
+            value is missing or not valid.
+
+        """
+        option, value = arguments[index], None
+        if option.startswith(LONG_OPTION_PREFIX) and VALUE_SEPARATOR in option:
+            option, value = option.split(VALUE_SEPARATOR, 1)
+        index += 1
+        action = plan.options.get(option)
+        if action is None or isinstance(action, FALLBACK_ACTIONS):
+            raise FallbackError(f"Option {option} is not handled.")
+        if action.nargs == 0:
+            if value is not None:
+                raise FallbackError(f"Flag {option} has a value.")
+            setattr(namespace, action.dest, action.const)
+        else:
+            if value is None:
+                if index >= len(arguments) or is_option(arguments[index]):
+                    raise FallbackError(f"Option {option} has no value.")
+                value = arguments[index]
+                index += 1
+            setattr(namespace, action.dest, get_value(action, value))
+        seen.add(action)
+        return index
+
+    def set_positionals(
+        self,
+        plan: ParserPlan,
+        namespace: argparse.Namespace,
+        arguments: List[str],
+        seen: Set[argparse.Action],
+    ) -> None:
+        """
+        Set positionals' values, with ``+`` positional taking the extra ones.
+
+        Parameters
+        ----------
+        plan : ParserPlan
+            Parser's lookup tables.
+        namespace : argparse.Namespace
+            Namespace being populated.
+        arguments : List[str]
+            Positional arguments, in order.
+        seen : Set[argparse.Action]
+            Actions that were set, updated with the positionals.
+
+        Raises
+        ------
+        FallbackError
+            If the number of arguments does not match the positionals.
+
+        """
+        if plan.commands:
+            return
+        extra = len(arguments) - len(plan.positionals)
+        if extra < 0 or (
+            extra and all(action.nargs != "+" for action in plan.positionals)
+        ):
+            raise FallbackError("Wrong number of positionals.")
+        index = 0
+        for action in plan.positionals:
+            if action.nargs == "+":
+                values = arguments[index : index + extra + 1]
+                setattr(
+                    namespace,
+                    action.dest,
+                    [get_value(action, value) for value in values],
+                )
+                index += extra + 1
+            else:
+                setattr(
+                    namespace, action.dest, get_value(action, arguments[index])
+                )
+                index += 1
+            seen.add(action)
+
+    def call_command(
+        self,
+        action: argparse._SubParsersAction,  # type: ignore[type-arg]
+        namespace: argparse.Namespace,
+        arguments: List[str],
+    ) -> None:
+        """
+        Parse command's arguments, like argparse's and CLY?!'s subparsers.
+
+        Parameters
+        ----------
+        action : argparse._SubParsersAction
+            Subparser action.
+        namespace : argparse.Namespace
+            Namespace being populated.
+        arguments : List[str]
+            Command's name, followed by its arguments.
+
+        Raises
+        ------
+        FallbackError
+            If command is not found, is external, or its arguments must be
+            parsed by argparse.
+
+        """
+        name, *command_arguments = arguments
+        if (
+            name in getattr(action, "externals", {})
+            or name not in action.choices
+        ):
+            raise FallbackError(f"Command {name} is not handled.")
+        if action.dest != argparse.SUPPRESS:
+            setattr(namespace, action.dest, name)
+        command_namespace = self.parse_parser_args(
+            action.choices[name], command_arguments
+        )
+        for key, value in vars(command_namespace).items():
+            setattr(namespace, key, value)
+        if name in getattr(action, "groups", set()):
+            setattr(
+                namespace,
+                action.dest,
+                f"{name} {getattr(namespace, action.dest)}",
+            )
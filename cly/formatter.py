@@ -0,0 +1,553 @@
+"""Help formatter, which wraps usages in linear time and streams help."""
+
+import argparse
+import functools
+import re
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .choices import Choices
+
+USAGE_PREFIX = "Usage:\n  [python|python3] "
+USAGE_PART = re.compile(r"\(.*?\)+(?=\s|$)|\[.*?\]+(?=\s|$)|\S+")
+CLEANED_USAGE = ("[ ", "( ", " ]", " )", "[]", "[)", "(]", "()")
+PROG_USAGE_RATIO = 0.75
+CHOICES_METAVAR = "{...}"
+FILLED_TEXTS_CACHE_SIZE = 1024
+CHOICES_MODULE = f"{__package__}.choices"
+
+
+def get_choices(action: argparse.Action) -> Optional["Choices"]:
+    """
+    Get action's choices, if they are CLY?!'s choices.
+
+    ``cly.choices`` is not imported to check it, since an action can only
+    have CLY?!'s choices if their module was imported to create them.
+
+    Parameters
+    ----------
+    action : argparse.Action
+        argparse action.
+
+    Returns
+    -------
+    Optional[cly.choices.Choices]
+        Action's choices, if they are CLY?!'s choices; else, None.
+
+    """
+    module = sys.modules.get(CHOICES_MODULE)
+    if module is not None and isinstance(action.choices, module.Choices):
+        choices: "Choices" = action.choices
+        return choices
+    return None
+
+
+def is_clean_usage_part(part: str) -> bool:
+    """
+    Check if argparse would keep action's usage as it is.
+
+    argparse cleans up the joined usages, like removing empty brackets, so
+    a usage is kept if nothing in it, or at its edges, would be cleaned up.
+
+    Parameters
+    ----------
+    part : str
+        Usage of an action.
+
+    Returns
+    -------
+    bool
+        If usage is not empty, is printable, does not start or end with
+        spaces, closing or opening brackets, and has no empty or padded
+        brackets.
+
+    """
+    return (
+        part.isprintable()
+        and part[:1] not in ("", " ", "]", ")")
+        and part[-1] not in (" ", "[", "(")
+        and not any(cleaned in part for cleaned in CLEANED_USAGE)
+    )
+
+
+def split_usage_parts(parts: List[str]) -> List[str]:
+    """
+    Split actions' usages in the parts usage lines can be wrapped at.
+
+    Parameters
+    ----------
+    parts : List[str]
+        Usage of each action, like ``[-n NAME]`` or ``aliases [aliases ...]``.
+
+    Returns
+    -------
+    List[str]
+        Bracketed usages, or words, like argparse's wrapping.
+
+    """
+    wrappables = []
+    for part in parts:
+        if " " not in part or (
+            part[0] == "[" and part[-1] == "]" and "] " not in part
+        ):
+            wrappables.append(part)
+        else:
+            wrappables.extend(USAGE_PART.findall(part))
+    return wrappables
+
+
+def wrap_usage_parts(
+    parts: List[str],
+    indent: str,
+    width: int,
+    prefix: Optional[str] = None,
+) -> List[str]:
+    """
+    Wrap usage parts in lines, like argparse does.
+
+    Parameters
+    ----------
+    parts : List[str]
+        Parts of the usage.
+    indent : str
+        Indentation of the lines.
+    width : int
+        Width limit.
+    prefix : Optional[str]
+        Prefix of the first line, that replaces its indentation, by default
+        None.
+
+    Returns
+    -------
+    List[str]
+        Usage lines.
+
+    """
+    lines: List[str] = []
+    line: List[str] = []
+    line_length = len(indent if prefix is None else prefix) - 1
+    for part in parts:
+        if line_length + 1 + len(part) > width and line:
+            lines.append(indent + " ".join(line))
+            line = []
+            line_length = len(indent) - 1
+        line.append(part)
+        line_length += len(part) + 1
+    if line:
+        lines.append(indent + " ".join(line))
+    if prefix is not None:
+        lines[0] = lines[0][len(indent) :]
+    return lines
+
+
+@functools.lru_cache(maxsize=FILLED_TEXTS_CACHE_SIZE)
+def fill_text(text: str, width: int, indent: str) -> str:
+    """
+    Format text to fit desired width, once for each recently filled text.
+
+    Only the last ``FILLED_TEXTS_CACHE_SIZE`` texts are kept, so long
+    running processes, like the daemon or the shell, use bounded memory.
+
+    Parameters
+    ----------
+    text : str
+        Text to be formatted.
+    width : int
+        Width limit.
+    indent : str
+        Indentation.
+
+    Returns
+    -------
+    str
+        Paragraphs filled to the width, respecting indentation.
+
+    """
+    import textwrap  # pylint: disable=import-outside-toplevel
+
+    return "\n\n".join(
+        textwrap.fill(
+            line,
+            width,
+            initial_indent=indent,
+            subsequent_indent=indent,
+        )
+        for line in text.split("\n\n")
+    )
+
+
+class CustomFormatter(argparse.HelpFormatter):
+    """Custom formatter for argparse's argument parser."""
+
+    invocations: Dict[argparse.Action, str]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Call super class init's."""
+        super().__init__(*args, **kwargs)
+        self.invocations = {}
+
+    def _format_usage(
+        self,
+        usage: Optional[str],
+        actions: Iterable[argparse.Action],
+        groups: Iterable[argparse._ArgumentGroup],
+        prefix: Optional[str],
+    ) -> str:
+        """
+        Format usage section, with CLY?!'s prefix.
+
+        It has argparse's layout, but each action's usage is formatted once
+        and split in wrappable parts on its own, in linear time. Custom
+        usages, mutually exclusive groups and metavars argparse would clean
+        up are formatted by argparse.
+
+        Parameters
+        ----------
+        usage : Optional[str]
+            usage.
+        actions : Iterable[argparse.Action]
+            argparse actions.
+        groups : Iterable[argparse._ArgumentGroup]
+            argparse groups.
+        prefix : Optional[str]
+            usage prefix.
+
+        Returns
+        -------
+        str
+            Formatted usage section.
+
+        """
+        actions = list(actions)
+        groups = list(groups)
+        optionals = self._get_usage_parts(
+            [action for action in actions if action.option_strings]
+        )
+        positionals = self._get_usage_parts(
+            [action for action in actions if not action.option_strings]
+        )
+        if (
+            usage is not None
+            or not actions
+            or groups
+            or optionals is None
+            or positionals is None
+        ):
+            return super()._format_usage(usage, actions, groups, USAGE_PREFIX)
+        prog = self._prog
+        usage = " ".join(
+            part for part in [prog, *optionals, *positionals] if part
+        )
+        text_width = self._width - self._current_indent
+        if len(USAGE_PREFIX) + len(usage) <= text_width:
+            return f"{USAGE_PREFIX}{usage}\n\n"
+        optional_parts = split_usage_parts(optionals)
+        positional_parts = split_usage_parts(positionals)
+        if len(USAGE_PREFIX) + len(prog) <= PROG_USAGE_RATIO * text_width:
+            indent = " " * (len(USAGE_PREFIX) + len(prog) + 1)
+            first_parts = optional_parts or positional_parts
+            lines = wrap_usage_parts(
+                [prog, *first_parts], indent, text_width, USAGE_PREFIX
+            )
+            if optional_parts:
+                lines.extend(
+                    wrap_usage_parts(positional_parts, indent, text_width)
+                )
+        else:
+            indent = " " * len(USAGE_PREFIX)
+            lines = wrap_usage_parts(
+                optional_parts + positional_parts, indent, text_width
+            )
+            if len(lines) > 1:
+                lines = [
+                    *wrap_usage_parts(optional_parts, indent, text_width),
+                    *wrap_usage_parts(positional_parts, indent, text_width),
+                ]
+            lines.insert(0, prog)
+        usage = "\n".join(lines)
+        return f"{USAGE_PREFIX}{usage}\n\n"
+
+    def _get_usage_parts(
+        self, actions: List[argparse.Action]
+    ) -> Optional[List[str]]:
+        """
+        Format usage of each action, like argparse does without groups.
+
+        Parameters
+        ----------
+        actions : List[argparse.Action]
+            argparse actions.
+
+        Returns
+        -------
+        Optional[List[str]]
+            Usage of each action that is not suppressed, or None if any would
+            be cleaned up by argparse, like empty metavars.
+
+        """
+        parts = []
+        for action in actions:
+            if action.help == argparse.SUPPRESS:
+                continue
+            if not action.option_strings:
+                part = self._format_args(
+                    action, self._get_default_metavar_for_positional(action)
+                )
+            elif action.nargs == 0:
+                format_usage = getattr(action, "format_usage", None)
+                part = (
+                    format_usage()
+                    if format_usage
+                    else action.option_strings[0]
+                )
+            else:
+                metavar = self._format_args(
+                    action, self._get_default_metavar_for_optional(action)
+                )
+                part = f"{action.option_strings[0]} {metavar}"
+            if action.option_strings and not action.required:
+                part = f"[{part}]"
+            if not is_clean_usage_part(part):
+                return None
+            parts.append(part)
+        return parts
+
+    def _format_action(self, action: argparse.Action) -> str:
+        """
+        Remove subparser's metavar when listing its parsers.
+
+        Parameters
+        ----------
+        action : argparse.Action
+            argparse action.
+
+        Returns
+        -------
+        str
+            subparser's section without metavar.
+
+        """
+        parts = super()._format_action(action)
+        if action.nargs == argparse.PARSER:
+            line_break = "\n"
+            parts = line_break.join(parts.split(line_break)[1:])
+        return parts
+
+    def _format_action_invocation(self, action: argparse.Action) -> str:
+        """
+        Add metavar only once to arguments, formatting each action once.
+
+        Parameters
+        ----------
+        action : argparse.Action
+            argparse action.
+
+        Returns
+        -------
+        str
+            How to use option with only one metavar.
+
+        """
+        invocation = self.invocations.get(action)
+        if invocation is not None:
+            return invocation
+        if not action.option_strings or action.nargs == 0:
+            invocation = super()._format_action_invocation(action)
+        else:
+            metavar = self._format_args(
+                action, self._get_default_metavar_for_optional(action)
+            )
+            comma = ", "
+            invocation = f"{comma.join(action.option_strings)} {metavar}"
+        self.invocations[action] = invocation
+        return invocation
+
+    def _expand_help(self, action: argparse.Action) -> str:
+        """
+        Expand format specifiers in action's help, like ``%(default)s``.
+
+        Parameters
+        ----------
+        action : argparse.Action
+            argparse action.
+
+        Returns
+        -------
+        str
+            Action's help, as it is if it has no format specifiers.
+
+        """
+        help_string = self._get_help_string(action) or ""
+        if "%" not in help_string:
+            return help_string
+        choices = get_choices(action)
+        if choices is not None:
+            import copy  # pylint: disable=import-outside-toplevel
+
+            action = copy.copy(action)
+            action.choices = [choices.summarize()]
+        return super()._expand_help(action)
+
+    def _metavar_formatter(
+        self, action: argparse.Action, default_metavar: str
+    ) -> Callable[[int], Tuple[str, ...]]:
+        """
+        Format action's metavar, summarizing CLY?!'s choices.
+
+        Parameters
+        ----------
+        action : argparse.Action
+            argparse action.
+        default_metavar : str
+            Metavar used if action has no metavar nor choices.
+
+        Returns
+        -------
+        Callable[[int], Tuple[str, ...]]
+            Function that returns the metavar for each of the action's values.
+
+        """
+        choices = get_choices(action)
+        if action.metavar is not None or choices is None:
+            return super()._metavar_formatter(action, default_metavar)
+        if default_metavar is None:
+            # argparse formats the metavar when the argument is added, only to
+            # check its size, so the choices are not loaded for it
+            return lambda tuple_size: (CHOICES_METAVAR,) * tuple_size
+
+        def format_metavar(tuple_size: int) -> Tuple[str, ...]:
+            metavar = f"{{{choices.summarize(separator=',')}}}"
+            return (metavar,) * tuple_size
+
+        return format_metavar
+
+    def _split_lines(self, text: str, width: int) -> List[str]:
+        """
+        Split action's help in lines that fit the width.
+
+        Parameters
+        ----------
+        text : str
+            Action's help.
+        width : int
+            Width limit.
+
+        Returns
+        -------
+        List[str]
+            Lines, wrapped by textwrap only if help does not fit in one.
+
+        """
+        text = self._whitespace_matcher.sub(" ", text).strip()
+        if text and len(text) <= width:
+            return [text]
+        return super()._split_lines(text, width)
+
+    def _fill_text(self, text: str, width: int, indent: str) -> str:
+        """
+        Format text to fit desired width.
+
+        Breaks text in paragraphs so it does not exceed the width limit,
+        respecting indentation.
+
+        Parameters
+        ----------
+        text : str
+            Text to be formatted.
+        width : int
+            Width limit.
+        indent : str
+            Indentation.
+
+        Returns
+        -------
+        str
+            Formatted text.
+
+        """
+        return fill_text(text, width, indent)
+
+    def iter_help(self) -> Iterator[str]:
+        """
+        Format help message item by item, like usage or each action.
+
+        The joined items are the same as ``format_help``'s, but each one is
+        formatted only when the previous ones were consumed, so it can be
+        printed as it is formatted.
+
+        Yields
+        ------
+        str
+            Formatted help message's chunk.
+
+        """
+        pending = ""
+        started = False
+        formatted = False
+        for part in self._iter_section_help(self._root_section):
+            formatted = True
+            text = self._long_break_matcher.sub("\n\n", pending + part)
+            if not started:
+                text = text.lstrip("\n")
+            body = text.rstrip("\n")
+            # Trailing line breaks are held, as the next part can merge them
+            pending = text[len(body) :]
+            if body:
+                started = True
+                yield body
+        if formatted:
+            yield "\n"
+
+    def _iter_section_help(
+        self, section: argparse.HelpFormatter._Section
+    ) -> Iterator[str]:
+        """
+        Format section item by item, like argparse's section ``format_help``.
+
+        Parameters
+        ----------
+        section : argparse.HelpFormatter._Section
+            Section to be formatted.
+
+        Yields
+        ------
+        str
+            Formatted section's item, preceded by its heading.
+
+        """
+        heading = ""
+        if section.heading not in (argparse.SUPPRESS, None):
+            heading = f"{' ' * self._current_indent}{section.heading}:\n"
+        if section.parent is not None:
+            self._indent()
+        started = False
+        try:
+            for func, args in section.items:
+                owner = getattr(func, "__self__", None)
+                if isinstance(owner, argparse.HelpFormatter._Section):
+                    parts: Iterable[str] = self._iter_section_help(owner)
+                else:
+                    parts = [func(*args)]
+                for part in parts:
+                    if not part or part is argparse.SUPPRESS:
+                        continue
+                    if not started:
+                        started = True
+                        yield f"\n{heading}"
+                    yield part
+        finally:
+            if section.parent is not None:
+                self._dedent()
+        if started:
+            yield "\n"
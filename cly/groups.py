@@ -0,0 +1,88 @@
+"""Groups of commands, only loaded when they are called."""
+
+import argparse
+from typing import TYPE_CHECKING
+
+from .loader import LazyCommand
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .config import ConfiguredParser
+
+
+def get_group(cli: "ConfiguredParser", name: str) -> "ConfiguredParser":
+    """
+    Get group, importing it if needed.
+
+    Parameters
+    ----------
+    cli : cly.config.ConfiguredParser
+        CLI the group belongs to.
+    name : str
+        Group's name.
+
+    Returns
+    -------
+    cly.config.ConfiguredParser
+        Group's parser configuration.
+
+    Raises
+    ------
+    TypeError
+        If the group's import path does not point to a ConfiguredParser.
+
+    """
+    # pylint: disable=import-outside-toplevel
+    from .config import ConfiguredParser
+
+    group = cli.groups[name]
+    if isinstance(group, LazyCommand):
+        resolved_group = group.resolve()
+        if not isinstance(resolved_group, ConfiguredParser):
+            raise TypeError(
+                f"{group.path!r} is not a ConfiguredParser, but a "
+                f"{type(resolved_group).__name__}."
+            )
+        group = cli.groups[name] = resolved_group
+    return group
+
+
+def get_prog(cli: "ConfiguredParser") -> str:
+    """
+    Get prefix of CLI's commands' usage.
+
+    Parameters
+    ----------
+    cli : cly.config.ConfiguredParser
+        CLI whose commands' usage is prefixed.
+
+    Returns
+    -------
+    str
+        Script name, followed by the groups' names, if any.
+
+    """
+    if cli.subparser:
+        return cli.subparser._prog_prefix
+    return cli.parser.prog
+
+
+def load_group(cli: "ConfiguredParser", name: str) -> argparse.ArgumentParser:
+    """
+    Load group and get its parser, to parse the group's arguments.
+
+    Parameters
+    ----------
+    cli : cly.config.ConfiguredParser
+        CLI the group belongs to.
+    name : str
+        Group's name.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Group's parser, with its prog set after the CLI's prog.
+
+    """
+    group = get_group(cli, name)
+    group.set_prog(f"{get_prog(cli)} {name}")
+    return group.parser
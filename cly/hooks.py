@@ -0,0 +1,267 @@
+"""Hooks called around the dispatch of CLY?! commands."""
+
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .binding import compile_binding
+from .loader import unwrap_command
+
+HOOK_EVENTS = ("before", "after", "error")
+INTERRUPTED_STATUS = 130
+
+
+def get_exit_status(code: Any) -> int:
+    """
+    Get exit status the same way Python does for ``SystemExit``.
+
+    Parameters
+    ----------
+    code : Any
+        ``SystemExit``'s code.
+
+    Returns
+    -------
+    int
+        Exit status: 0 if code is None, the code itself if it is an integer
+        and 1 otherwise.
+
+    """
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    return 1
+
+
+class DispatchEvent:
+    """Data of a command's dispatch, passed to hooks."""
+
+    event: str
+    command: str
+    kwargs: Dict[str, Any]
+    wall_time: float
+    cpu_time: float
+    exit_status: Optional[int]
+    error: Optional[BaseException]
+
+    def __init__(
+        self,
+        event: str,
+        command: str,
+        kwargs: Dict[str, Any],
+        wall_time: float = 0.0,
+        cpu_time: float = 0.0,
+        exit_status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Initialize dispatch event.
+
+        Parameters
+        ----------
+        event : str
+            One of ``before``, ``after`` or ``error``.
+        command : str
+            Name the command was called with.
+        kwargs : Dict[str, Any]
+            Key words arguments the command was called with.
+        wall_time : float, optional
+            Command's elapsed time, in seconds, by default 0.0 (command did
+            not run yet).
+        cpu_time : float, optional
+            Command's process CPU time, in seconds, by default 0.0 (command
+            did not run yet).
+        exit_status : Optional[int]
+            Script's exit status, by default None (command did not run yet).
+        error : Optional[BaseException]
+            Exception raised by the command, by default None
+
+        """
+        self.event = event
+        self.command = command
+        self.kwargs = kwargs
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.exit_status = exit_status
+        self.error = error
+
+    def __repr__(self) -> str:
+        """
+        Represent dispatch event by its event and command.
+
+        Returns
+        -------
+        str
+            Dispatch event representation.
+
+        """
+        return f"{type(self).__name__}({self.event!r}, {self.command!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get dispatch event's data.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Dispatch event's data, with the error represented by its type and
+            message.
+
+        """
+        return {
+            "event": self.event,
+            "command": self.command,
+            "kwargs": self.kwargs,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "exit_status": self.exit_status,
+            "error": (
+                f"{type(self.error).__name__}: {self.error}"
+                if self.error is not None
+                else None
+            ),
+        }
+
+
+Hook = Callable[[DispatchEvent], None]
+
+
+def get_command_kwargs(
+    command: Callable[..., Any], kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Get key words arguments the command is called with.
+
+    Parameters
+    ----------
+    command : Callable[..., Any]
+        Registered command, lazy or not.
+    kwargs : Dict[str, Any]
+        Arguments the script was called with, in argparse's namespace.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Only the key words arguments the command accepts.
+
+    """
+    return compile_binding(unwrap_command(command)).select(kwargs)
+
+
+def run_hooks(hooks: Dict[str, List[Hook]], event: DispatchEvent) -> None:
+    """
+    Call hooks registered for the event.
+
+    Parameters
+    ----------
+    hooks : Dict[str, List[Hook]]
+        Hooks registered for each event.
+    event : DispatchEvent
+        Dispatch event.
+
+    """
+    for hook in hooks.get(event.event, []):
+        hook(event)
+
+
+def call_with_hooks(
+    hooks: Dict[str, List[Hook]],
+    name: str,
+    command: Callable[..., Any],
+    kwargs: Dict[str, Any],
+    call: Callable[[], None],
+) -> None:
+    """
+    Call command, and the hooks registered around it.
+
+    Parameters
+    ----------
+    hooks : Dict[str, List[Hook]]
+        Hooks registered for each event.
+    name : str
+        Name the command was called with, prefixed by its groups' names.
+    command : Callable[..., Any]
+        Registered command, lazy or not.
+    kwargs : Dict[str, Any]
+        Arguments the script was called with, in argparse's namespace.
+    call : Callable[[], None]
+        Function that calls the command.
+
+    """
+    command_kwargs = get_command_kwargs(command, kwargs)
+    run_hooks(hooks, DispatchEvent("before", name, command_kwargs))
+    error: Optional[BaseException] = None
+    exit_status = 0
+    wall_time = time.perf_counter()
+    cpu_time = time.process_time()
+    try:
+        call()
+    except SystemExit as sys_exit:
+        exit_status = get_exit_status(sys_exit.code)
+        error = sys_exit if exit_status else None
+        raise
+    except KeyboardInterrupt as interrupt:
+        exit_status = INTERRUPTED_STATUS
+        error = interrupt
+        raise
+    except BaseException as exception:
+        exit_status = 1
+        error = exception
+        raise
+    finally:
+        wall_time = time.perf_counter() - wall_time
+        cpu_time = time.process_time() - cpu_time
+        for event in ("error", "after") if error else ("after",):
+            run_hooks(
+                hooks,
+                DispatchEvent(
+                    event,
+                    name,
+                    command_kwargs,
+                    wall_time,
+                    cpu_time,
+                    exit_status,
+                    error,
+                ),
+            )
+
+
+class JsonLinesSink:
+    """Hook that appends dispatch events to a JSON lines file."""
+
+    path: Path
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Initialize sink.
+
+        Parameters
+        ----------
+        path : Union[str, pathlib.Path]
+            Path of the JSON lines file. It is created if it does not exist.
+
+        """
+        self.path = Path(path)
+
+    def __call__(self, event: DispatchEvent) -> None:
+        """
+        Append dispatch event to file, with a timestamp.
+
+        Each event is written in a single call, so concurrent scripts do not
+        mix their lines. Values that are not JSON serializable are written as
+        their representation.
+
+        Parameters
+        ----------
+        event : DispatchEvent
+            Dispatch event.
+
+        """
+        import json  # pylint: disable=import-outside-toplevel
+
+        line = json.dumps(
+            {"timestamp": time.time(), **event.to_dict()}, default=repr
+        )
+        with open(self.path, mode="a", encoding="utf-8") as file:
+            file.write(f"{line}\n")
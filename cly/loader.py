@@ -0,0 +1,756 @@
+"""Lazy loading of commands and of their parsers."""
+
+import argparse
+import functools
+import importlib
+import inspect
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .docstring import (
+    get_help_from_docstring,
+    get_parsed_docstring,
+    parse_docstring,
+)
+
+PATH_SEPARATOR = ":"
+CONTAINER_METHODS = (
+    "add_argument",
+    "add_argument_group",
+    "add_mutually_exclusive_group",
+    "set_defaults",
+)
+RECORDED_RETURNS = {
+    "add_argument_group": CONTAINER_METHODS,
+    "add_mutually_exclusive_group": CONTAINER_METHODS,
+}
+
+if TYPE_CHECKING:  # pragma: no cover
+    import ast
+
+    from .config import ConfiguredParser
+
+
+def split_import_path(path: str) -> Tuple[str, str]:
+    """
+    Split import path in module and attribute names.
+
+    Parameters
+    ----------
+    path : str
+        Import path in the format ``package.module:attribute``.
+
+    Returns
+    -------
+    Tuple[str, str]
+        Module name and attribute name.
+
+    Raises
+    ------
+    ValueError
+        If path is not in the expected format.
+
+    """
+    module_name, separator, attribute = path.partition(PATH_SEPARATOR)
+    if not module_name or not separator or not attribute:
+        raise ValueError(
+            f"{path!r} is not a valid import path. Expected format is "
+            f"'package.module{PATH_SEPARATOR}attribute'."
+        )
+    return module_name, attribute
+
+
+def import_object(path: str) -> Any:
+    """
+    Import object from import path.
+
+    Parameters
+    ----------
+    path : str
+        Import path in the format ``package.module:attribute``.
+
+    Returns
+    -------
+    Any
+        Imported object.
+
+    """
+    module_name, attribute = split_import_path(path)
+    imported_object = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        imported_object = getattr(imported_object, name)
+    return imported_object
+
+
+class LazyCommand:
+    """Command only imported when it is called or inspected."""
+
+    path: str
+    decorator: Optional[Callable[[Callable[..., Any]], Callable[..., Any]]]
+    __name__: str
+
+    def __init__(
+        self,
+        path: str,
+        decorator: Optional[
+            Callable[[Callable[..., Any]], Callable[..., Any]]
+        ] = None,
+    ) -> None:
+        """
+        Initialize lazy command.
+
+        Parameters
+        ----------
+        path : str
+            Import path of the command, in the format
+            ``package.module:function``.
+        decorator : Optional[Callable]
+            Decorator applied to the command when it is called, by default
+            None
+
+        """
+        self.path = path
+        self.decorator = decorator
+        self.__name__ = split_import_path(path)[1].rsplit(".", 1)[-1]
+        self._command: Optional[Callable[..., Any]] = None
+        self._decorated_command: Optional[Callable[..., Any]] = None
+
+    def __repr__(self) -> str:
+        """
+        Represent lazy command by its import path.
+
+        Returns
+        -------
+        str
+            Lazy command representation.
+
+        """
+        return f"{type(self).__name__}({self.path!r})"
+
+    @property
+    def is_resolved(self) -> bool:
+        """
+        Check if command was already imported.
+
+        Returns
+        -------
+        bool
+            True if command was already imported; else, False.
+
+        """
+        return self._command is not None
+
+    def resolve(self) -> Callable[..., Any]:
+        """
+        Import command, only once.
+
+        Returns
+        -------
+        Callable[..., Any]
+            Imported command.
+
+        """
+        if self._command is None:
+            self._command = import_object(self.path)
+        return self._command
+
+    def __call__(self, **kwargs: Any) -> Any:
+        """
+        Import command and call it.
+
+        Parameters
+        ----------
+        **kwargs : Any
+            Key words arguments the command was called with.
+
+        Returns
+        -------
+        Any
+            Command's return.
+
+        """
+        if self._decorated_command is None:
+            command = self.resolve()
+            self._decorated_command = (
+                self.decorator(command) if self.decorator else command
+            )
+        return self._decorated_command(**kwargs)
+
+
+def unwrap_command(command: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Get the callable object that implements the command.
+
+    Parameters
+    ----------
+    command : Callable[..., Any]
+        Registered command, lazy or not.
+
+    Returns
+    -------
+    Callable[..., Any]
+        Imported command, if lazy; else, the command itself.
+
+    """
+    if isinstance(command, LazyCommand):
+        return command.resolve()
+    return command
+
+
+def get_command_target(command: Callable[..., Any]) -> str:
+    """
+    Get import path of the command.
+
+    Parameters
+    ----------
+    command : Callable[..., Any]
+        Registered command, lazy or not.
+
+    Returns
+    -------
+    str
+        Command's import path, in the format ``package.module:function``.
+
+    """
+    if isinstance(command, LazyCommand):
+        return command.path
+    return f"{command.__module__}{PATH_SEPARATOR}{command.__qualname__}"
+
+
+def get_command_source(command: Callable[..., Any]) -> str:
+    """
+    Get path of the file where the command is defined.
+
+    Parameters
+    ----------
+    command : Callable[..., Any]
+        Function that represents the command.
+
+    Returns
+    -------
+    str
+        Path of the command's source file, if found; else, empty string.
+
+    """
+    try:
+        return inspect.getfile(inspect.unwrap(command))
+    except TypeError:
+        return ""
+
+
+class StaticCommand:
+    """Command's data read from its source code, without importing it."""
+
+    source: str
+    docstring: str
+    params: List[str]
+
+    def __init__(self, source: str, docstring: str, params: List[str]) -> None:
+        """
+        Initialize static command.
+
+        Parameters
+        ----------
+        source : str
+            Path of the command's source file.
+        docstring : str
+            Command's cleaned docstring.
+        params : List[str]
+            Names of the command's parameters.
+
+        """
+        self.source = source
+        self.docstring = docstring
+        self.params = params
+
+
+def find_definition(
+    body: List["ast.stmt"], attribute: str
+) -> Optional[Union["ast.FunctionDef", "ast.AsyncFunctionDef"]]:
+    """
+    Find function's definition in module's syntax tree.
+
+    Parameters
+    ----------
+    body : List[ast.stmt]
+        Module's statements.
+    attribute : str
+        Function's name, with the names of the classes it is defined in,
+        like ``Class.method``.
+
+    Returns
+    -------
+    Optional[Union[ast.FunctionDef, ast.AsyncFunctionDef]]
+        Function's definition, if it is defined with ``def`` in the module;
+        else, None.
+
+    """
+    import ast  # pylint: disable=import-outside-toplevel
+
+    name, _, nested = attribute.partition(".")
+    definition = None
+    for statement in body:
+        if (
+            isinstance(
+                statement,
+                (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef),
+            )
+            and statement.name == name
+        ):
+            definition = statement
+    if isinstance(definition, ast.ClassDef) and nested:
+        return find_definition(definition.body, nested)
+    if isinstance(definition, ast.ClassDef) or nested:
+        return None
+    return definition
+
+
+@functools.lru_cache(maxsize=None)
+def read_static_command(path: str) -> Optional[StaticCommand]:
+    """
+    Read command's docstring and parameters from its source code, only once.
+
+    The command's module is located, but not imported (only its parent
+    packages are), so its dependencies are not imported either.
+
+    Parameters
+    ----------
+    path : str
+        Import path of the command, in the format ``package.module:function``.
+
+    Returns
+    -------
+    Optional[StaticCommand]
+        Command's data, if the command is defined with ``def`` in a Python
+        source file; else, None.
+
+    """
+    # pylint: disable=import-outside-toplevel
+    import ast
+    import tokenize
+    from importlib.util import find_spec
+
+    module_name, attribute = split_import_path(path)
+    try:
+        spec = find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    source = spec.origin if spec else None
+    if not source or not source.endswith(".py"):
+        return None
+    try:
+        with tokenize.open(source) as file:
+            tree = ast.parse(file.read(), filename=source)
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return None
+    definition = find_definition(tree.body, attribute)
+    if definition is None:
+        return None
+    arguments = definition.args
+    params = [
+        argument.arg
+        for argument in (
+            *getattr(arguments, "posonlyargs", []),
+            *arguments.args,
+            *([arguments.vararg] if arguments.vararg else []),
+            *arguments.kwonlyargs,
+            *([arguments.kwarg] if arguments.kwarg else []),
+        )
+    ]
+    return StaticCommand(source, ast.get_docstring(definition) or "", params)
+
+
+def get_params_help(command: Callable[..., Any]) -> Dict[str, str]:
+    """
+    Get command's parameters help from its docstring.
+
+    Parameters
+    ----------
+    command : Callable[..., Any]
+        Function that represents the command.
+
+    Returns
+    -------
+    Dict[str, str]
+        Help message of each of the command's parameters.
+
+    """
+    function = unwrap_command(command)
+    params_help = get_parsed_docstring(function).params
+    return {
+        param.name: params_help.get(param.name, "")
+        for param in inspect.signature(function).parameters.values()
+    }
+
+
+def get_static_params_help(command: StaticCommand) -> Dict[str, str]:
+    """
+    Get command's parameters help from its docstring, read statically.
+
+    Parameters
+    ----------
+    command : cly.loader.StaticCommand
+        Command's data read from its source code.
+
+    Returns
+    -------
+    Dict[str, str]
+        Help message of each of the command's parameters.
+
+    """
+    params_help = parse_docstring(command.docstring).params
+    return {name: params_help.get(name, "") for name in command.params}
+
+
+def get_static_command(
+    cli: "ConfiguredParser", command: Callable[..., Any]
+) -> Optional[StaticCommand]:
+    """
+    Read command's data from its source code, if ``static_help`` is set.
+
+    Parameters
+    ----------
+    cli : cly.config.ConfiguredParser
+        CLI the command belongs to.
+    command : Callable[..., Any]
+        Function that represents the command.
+
+    Returns
+    -------
+    Optional[cly.loader.StaticCommand]
+        Command's data, if command is lazy, not imported yet and its source
+        code could be read; else, None.
+
+    """
+    if (
+        not cli.options.static_help
+        or not isinstance(command, LazyCommand)
+        or command.is_resolved
+    ):
+        return None
+    return read_static_command(command.path)
+
+
+def get_command_entry(
+    cli: "ConfiguredParser", name: str, command: Callable[..., Any]
+) -> Dict[str, Any]:
+    """
+    Get command's resolved data, from the manifest cache if possible.
+
+    Parameters
+    ----------
+    cli : cly.config.ConfiguredParser
+        CLI the command belongs to.
+    name : str
+        Command's name.
+    command : Callable[..., Any]
+        Function that represents the command.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Command's resolved data.
+
+    """
+    target = get_command_target(command)
+    entry = cli.manifest.get_entry(name, target) if cli.manifest else None
+    if entry is None:
+        static_command = get_static_command(cli, command)
+        if static_command:
+            source = static_command.source
+            description = parse_docstring(static_command.docstring).description
+        else:
+            function = unwrap_command(command)
+            source = get_command_source(function)
+            description = get_help_from_docstring(function)
+        entry = {"description": description}
+        if cli.manifest:
+            entry = cli.manifest.set_entry(name, target, source, **entry)
+    return entry
+
+
+def resolve_params_help(
+    cli: "ConfiguredParser", command: Callable[..., Any]
+) -> Dict[str, str]:
+    """
+    Get command's parameters help, reading it statically if possible.
+
+    Parameters
+    ----------
+    cli : cly.config.ConfiguredParser
+        CLI the command belongs to.
+    command : Callable[..., Any]
+        Function that represents the command.
+
+    Returns
+    -------
+    Dict[str, str]
+        Help message of each of the command's parameters.
+
+    """
+    static_command = get_static_command(cli, command)
+    if static_command:
+        return get_static_params_help(static_command)
+    return get_params_help(command)
+
+
+def get_command_params_help(
+    cli: "ConfiguredParser", name: str, command: Callable[..., Any]
+) -> Dict[str, str]:
+    """
+    Get command's parameters help, from the manifest cache if possible.
+
+    Parameters
+    ----------
+    cli : cly.config.ConfiguredParser
+        CLI the command belongs to.
+    name : str
+        Command's name.
+    command : Callable[..., Any]
+        Function that represents the command.
+
+    Returns
+    -------
+    Dict[str, str]
+        Help message of each of the command's parameters.
+
+    """
+    if cli.manifest is None:
+        return resolve_params_help(cli, command)
+    entry = get_command_entry(cli, name, command)
+    if "params" not in entry:
+        cli.manifest.update_entry(
+            name, params=resolve_params_help(cli, command)
+        )
+    params_help: Dict[str, str] = entry["params"]
+    return params_help
+
+
+class RecordedCalls:
+    """
+    Method calls to an object, recorded to be replayed later.
+
+    Only the methods that configure parsers and their groups are recorded,
+    and setting an attribute, like an action's ``help``, is recorded as a
+    call to ``__setattr__``.
+    """
+
+    fields: Tuple[str, ...] = ("calls", "methods")
+    calls: List[Tuple[str, Tuple[Any, ...], Dict[str, Any], "RecordedCalls"]]
+    methods: Tuple[str, ...]
+
+    def __init__(self, methods: Tuple[str, ...] = CONTAINER_METHODS) -> None:
+        """
+        Initialize empty record.
+
+        Parameters
+        ----------
+        methods : Tuple[str, ...]
+            Names of the methods to record, by default ``CONTAINER_METHODS``
+            (the ones of parsers and their groups).
+
+        """
+        self.calls = []
+        self.methods = methods
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Record call of method, or get value of an attribute that was set.
+
+        Parameters
+        ----------
+        name : str
+            Method's or attribute's name.
+
+        Returns
+        -------
+        Any
+            Function that records the method's arguments and returns a record
+            for the calls to the method's return, or attribute's value.
+
+        Raises
+        ------
+        AttributeError
+            If name is not a recorded method nor a set attribute.
+
+        """
+        if name in self.fields:
+            raise AttributeError(name)
+        for method, args, _, _ in reversed(self.calls):
+            if method == "__setattr__" and args[0] == name:
+                return args[1]
+        if name not in self.methods:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+        def record(*args: Any, **kwargs: Any) -> RecordedCalls:
+            result = RecordedCalls(RECORDED_RETURNS.get(name, ()))
+            self.calls.append((name, args, kwargs, result))
+            return result
+
+        return record
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Record attribute's value, to be set when calls are replayed.
+
+        Parameters
+        ----------
+        name : str
+            Attribute's name.
+        value : Any
+            Attribute's value.
+
+        """
+        if name in self.fields:
+            super().__setattr__(name, value)
+            return
+        self.calls.append(
+            ("__setattr__", (name, value), {}, RecordedCalls(()))
+        )
+
+    def replay(self, target: Any) -> None:
+        """
+        Replay recorded calls in target object.
+
+        Parameters
+        ----------
+        target : Any
+            Object to call the recorded methods on.
+
+        """
+        for name, args, kwargs, result in self.calls:
+            result.replay(getattr(target, name)(*args, **kwargs))
+
+
+class DeferredParser(RecordedCalls):
+    """Command's parser only created when the command is called."""
+
+    fields = (*RecordedCalls.fields, "parser_class", "kwargs", "setup")
+    parser_class: Type[argparse.ArgumentParser]
+    kwargs: Dict[str, Any]
+    setup: Callable[[argparse.ArgumentParser], None]
+
+    def __init__(
+        self,
+        parser_class: Type[argparse.ArgumentParser],
+        kwargs: Dict[str, Any],
+        setup: Callable[[argparse.ArgumentParser], None],
+    ) -> None:
+        """
+        Initialize deferred parser.
+
+        Parameters
+        ----------
+        parser_class : Type[argparse.ArgumentParser]
+            Class of the parser.
+        kwargs : Dict[str, Any]
+            Key words arguments to create the parser with.
+        setup : Callable[[argparse.ArgumentParser], None]
+            Function to configure the parser, before replaying the recorded
+            calls.
+
+        """
+        super().__init__()
+        self.parser_class = parser_class
+        self.kwargs = kwargs
+        self.setup = setup
+
+    def build(self) -> argparse.ArgumentParser:
+        """
+        Create parser and replay recorded calls on it.
+
+        Returns
+        -------
+        argparse.ArgumentParser
+            Command's parser.
+
+        """
+        parser = self.parser_class(**self.kwargs)
+        self.setup(parser)
+        self.replay(parser)
+        return parser
+
+
+class DeferredGroup:
+    """Group's parser only loaded when the group is called."""
+
+    load: Callable[[], argparse.ArgumentParser]
+
+    def __init__(self, load: Callable[[], argparse.ArgumentParser]) -> None:
+        """
+        Initialize deferred group.
+
+        Parameters
+        ----------
+        load : Callable[[], argparse.ArgumentParser]
+            Function to load the group and get its parser.
+
+        """
+        self.load = load
+
+    def build(self) -> argparse.ArgumentParser:
+        """
+        Load group's parser.
+
+        Returns
+        -------
+        argparse.ArgumentParser
+            Group's parser.
+
+        """
+        return self.load()
+
+
+class ParserMap(Dict[str, Any]):
+    """Map of commands' names to parsers, creating deferred ones on access."""
+
+    def __getitem__(self, name: str) -> Any:
+        """
+        Get command's parser, creating it if it was deferred.
+
+        Parameters
+        ----------
+        name : str
+            Command's name.
+
+        Returns
+        -------
+        Any
+            Command's parser.
+
+        """
+        parser = super().__getitem__(name)
+        if isinstance(parser, (DeferredParser, DeferredGroup)):
+            parser = parser.build()
+            self[name] = parser
+        return parser
+
+    def is_built(self, name: str) -> bool:
+        """
+        Check if command's parser was already created.
+
+        Parameters
+        ----------
+        name : str
+            Command's name.
+
+        Returns
+        -------
+        bool
+            True if command's parser was created; else, False.
+
+        """
+        return not isinstance(
+            super().__getitem__(name), (DeferredParser, DeferredGroup)
+        )
@@ -0,0 +1,118 @@
+"""Output of CLY?! CLIs' help messages, streamed to stdout or a pager."""
+
+import contextlib
+import itertools
+import os
+import shutil
+import sys
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+PAGER_VARIABLE = "PAGER"
+DEFAULT_PAGER = "less"
+
+
+def run_pager(chunks: Iterable[str]) -> bool:
+    """
+    Write text to the pager in ``$PAGER``, by default ``less``.
+
+    The pager can be disabled by setting ``$PAGER`` to an empty string.
+
+    Parameters
+    ----------
+    chunks : Iterable[str]
+        Chunks of text, written as they are generated.
+
+    Returns
+    -------
+    bool
+        If the pager was run; else, no chunk was consumed.
+
+    """
+    # pylint: disable=import-outside-toplevel
+    import shlex
+    import subprocess  # nosec
+
+    command = shlex.split(os.environ.get(PAGER_VARIABLE, DEFAULT_PAGER))
+    if not command:
+        return False
+    try:
+        pager = subprocess.Popen(  # nosec
+            command, stdin=subprocess.PIPE, text=True
+        )
+    except OSError:
+        return False
+    assert pager.stdin is not None  # nosec
+    with contextlib.suppress(BrokenPipeError), pager.stdin:
+        for chunk in chunks:
+            pager.stdin.write(chunk)
+    while True:
+        try:
+            pager.wait()
+            return True
+        except KeyboardInterrupt:
+            # The pager handles interruptions itself, so it is waited for
+            continue
+
+
+def discard_output(file: TextIO) -> None:
+    """
+    Redirect file's descriptor to devnull, after its reader exited.
+
+    Python flushes stdout at exit, which would raise ``BrokenPipeError``
+    again, so pending output is discarded instead.
+
+    Parameters
+    ----------
+    file : TextIO
+        File whose reader exited.
+
+    """
+    try:
+        descriptor = file.fileno()
+    except (OSError, ValueError):
+        return
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    try:
+        os.dup2(devnull, descriptor)
+    finally:
+        os.close(devnull)
+
+
+def write_text(chunks: Iterable[str], file: Optional[TextIO] = None) -> None:
+    """
+    Write text as it is generated, paging it if it doesn't fit in terminal.
+
+    Text is only paged if ``file`` is a terminal and it is taller than it.
+    Only the chunks that fit in the terminal are buffered, so the first
+    lines are written as soon as they are generated, even for long text.
+    If the reader exits early, like ``head`` does, the rest is discarded.
+
+    Parameters
+    ----------
+    chunks : Iterable[str]
+        Chunks of text, like sections of a help message.
+    file : Optional[TextIO], optional
+        File to write to, by default None (stdout).
+
+    """
+    file = file or sys.stdout
+    remaining: Iterator[str] = iter(chunks)
+    try:
+        if file.isatty():
+            height = shutil.get_terminal_size().lines
+            screen: List[str] = []
+            lines = 0
+            for chunk in remaining:
+                screen.append(chunk)
+                lines += chunk.count("\n")
+                if lines >= height:
+                    file.flush()
+                    if run_pager(itertools.chain(screen, remaining)):
+                        return
+                    break
+            remaining = itertools.chain(screen, remaining)
+        for chunk in remaining:
+            file.write(chunk)
+        file.flush()
+    except BrokenPipeError:
+        discard_output(file)
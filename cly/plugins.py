@@ -0,0 +1,139 @@
+"""Discovery of commands registered by other packages, as entry points."""
+
+import importlib
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+from .cache import get_modification_time, read_json, write_json
+from .docstring import parse_docstring
+from .loader import PATH_SEPARATOR, read_static_command
+
+PLUGINS_FILE = "plugins.json"
+PLUGINS_FORMAT = 1
+EXTRAS_START = "["
+SITE_DIRECTORIES = ("site-packages", "dist-packages")
+
+
+def get_installation_key() -> List[List[Any]]:
+    """
+    Get key that changes when distributions are installed or uninstalled.
+
+    Installing or uninstalling a distribution adds or removes its metadata
+    folder in a site directory, like ``site-packages``, which changes the
+    directory's modification time. Other ``sys.path`` entries, like the
+    script's folder, are not part of the key, as creating any file in them
+    would change it.
+
+    Returns
+    -------
+    List[List[Any]]
+        Each site directory in ``sys.path`` with its modification time.
+
+    """
+    return [
+        [entry, get_modification_time(entry)]
+        for entry in sys.path
+        if os.path.basename(os.path.normpath(entry)) in SITE_DIRECTORIES
+    ]
+
+
+def find_entry_points(group: str) -> List[List[str]]:
+    """
+    Find entry points of group in installed distributions.
+
+    Parameters
+    ----------
+    group : str
+        Entry points group, like ``batcomputer.commands``.
+
+    Returns
+    -------
+    List[List[str]]
+        Name and import path of each entry point that points to an object.
+        If ``importlib.metadata`` is not available (Python 3.7), no entry
+        point is found.
+
+    """
+    try:
+        metadata: Any = importlib.import_module("importlib.metadata")
+    except ImportError:  # pragma: no cover
+        return []
+    entry_points: Any = metadata.entry_points()
+    group_entry_points = (
+        entry_points.select(group=group)
+        if hasattr(entry_points, "select")
+        else entry_points.get(group, [])
+    )
+    found: Dict[str, str] = {}
+    for entry_point in group_entry_points:
+        target = entry_point.value.split(EXTRAS_START, maxsplit=1)[0].strip()
+        if PATH_SEPARATOR in target:
+            found.setdefault(entry_point.name, target)
+    return [[name, target] for name, target in found.items()]
+
+
+def get_summary(target: str) -> str:
+    """
+    Get command's summary, without importing it.
+
+    Parameters
+    ----------
+    target : str
+        Command's import path.
+
+    Returns
+    -------
+    str
+        First line of the command's docstring, if its source code could be
+        read; else, empty string.
+
+    """
+    static_command = read_static_command(target)
+    if static_command is None:
+        return ""
+    return parse_docstring(static_command.docstring).summary
+
+
+def discover_plugins(
+    group: str, cache_dir: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """
+    Discover commands registered as entry points.
+
+    If ``cache_dir`` is passed, discovered commands are stored in an index
+    file, only refreshed when distributions are installed or uninstalled.
+
+    Parameters
+    ----------
+    group : str
+        Entry points group, like ``batcomputer.commands``.
+    cache_dir : Optional[str]
+        Folder to store the index file in, by default None (no index).
+
+    Returns
+    -------
+    List[Dict[str, str]]
+        Name, import path and summary of each command.
+
+    """
+    path = os.path.join(cache_dir, PLUGINS_FILE) if cache_dir else None
+    content = read_json(path) if path else {}
+    groups = (
+        content.get("groups", {})
+        if content.get("format") == PLUGINS_FORMAT
+        else {}
+    )
+    key = get_installation_key()
+    index = groups.get(group)
+    if index and index.get("key") == key:
+        plugins: List[Dict[str, str]] = index["plugins"]
+        return plugins
+    plugins = [
+        {"name": name, "target": target, "summary": get_summary(target)}
+        for name, target in find_entry_points(group)
+    ]
+    if path:
+        groups[group] = {"key": key, "plugins": plugins}
+        write_json(path, {"format": PLUGINS_FORMAT, "groups": groups})
+    return plugins
@@ -0,0 +1,282 @@
+"""Startup profiler of CLY?! CLIs."""
+
+import atexit
+import contextlib
+import functools
+import os
+import sys
+import time
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    cast,
+)
+
+from .arguments import pop_option
+
+PROFILE_OPTION = "--cly-profile-startup"
+PROFILE_VARIABLE = "CLY_PROFILE_STARTUP"
+STDERR_VALUES = ("", "1", "stderr")
+NANOSECONDS_IN_MILLISECOND = 1_000_000
+Function = TypeVar("Function", bound=Callable[..., Any])
+# importlib's bootstrap module, which the interpreter imports modules with
+BOOTSTRAP = sys.modules["_frozen_importlib"]
+
+
+class StartupProfiler:
+    """Record high-resolution timings of CLI's startup phases and imports."""
+
+    output: str
+    start: int
+    phases: Dict[str, List[int]]
+    imports: Dict[str, List[int]]
+
+    def __init__(self, output: str = "") -> None:
+        """
+        Initialize profiler.
+
+        Parameters
+        ----------
+        output : str, optional
+            Path of JSON file to write the report to, by default "" (report
+            is printed to stderr).
+
+        """
+        self.output = "" if output in STDERR_VALUES else output
+        self.start = time.perf_counter_ns()
+        self.phases = {}
+        self.imports = {}
+        self._import_stack: List[int] = []
+        self._original_find_and_load: Optional[Callable[..., Any]] = None
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Record time spent in phase.
+
+        Phases with the same name are accumulated.
+
+        Parameters
+        ----------
+        name : str
+            Phase's name.
+
+        Yields
+        ------
+        None
+            While phase runs.
+
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            timing = self.phases.setdefault(name, [0, 0])
+            timing[0] += time.perf_counter_ns() - start
+            timing[1] += 1
+
+    def _time_import(
+        self, name: str, function: Callable[..., Any], *args: Any
+    ) -> Any:
+        if name in sys.modules:
+            return function(*args)
+        self._import_stack.append(0)
+        start = time.perf_counter_ns()
+        try:
+            return function(*args)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            children = self._import_stack.pop()
+            if self._import_stack:
+                self._import_stack[-1] += elapsed
+            self.imports.setdefault(name, [elapsed, elapsed - children])
+
+    def track_imports(self) -> None:
+        """
+        Start recording modules' first import times.
+
+        Modules are first imported by importlib's ``_find_and_load``, either
+        by ``import`` statements, ``importlib.import_module`` or submodules of
+        ``from package import module``, so it is the function timed.
+
+        """
+        if self._original_find_and_load is not None:
+            return
+        original_find_and_load = self._original_find_and_load = (
+            BOOTSTRAP._find_and_load
+        )
+
+        def timed_find_and_load(name: str, *args: Any) -> Any:
+            return self._time_import(name, original_find_and_load, name, *args)
+
+        setattr(BOOTSTRAP, "_find_and_load", timed_find_and_load)
+
+    def untrack_imports(self) -> None:
+        """Stop recording modules' import times."""
+        if self._original_find_and_load is None:
+            return
+        setattr(BOOTSTRAP, "_find_and_load", self._original_find_and_load)
+        self._original_find_and_load = None
+
+    def get_report(self) -> Dict[str, Any]:
+        """
+        Get timings, sorted from slowest to fastest.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Total time, phases' times and imports' times, in nanoseconds.
+
+        """
+        return {
+            "total_ns": time.perf_counter_ns() - self.start,
+            "phases": [
+                {"name": name, "time_ns": timing[0], "calls": timing[1]}
+                for name, timing in sorted(
+                    self.phases.items(), key=lambda item: -item[1][0]
+                )
+            ],
+            "imports": [
+                {"name": name, "time_ns": timing[0], "self_ns": timing[1]}
+                for name, timing in sorted(
+                    self.imports.items(), key=lambda item: -item[1][1]
+                )
+            ],
+        }
+
+    def format_report(self) -> str:
+        """
+        Format report as text.
+
+        Returns
+        -------
+        str
+            Report with times in milliseconds.
+
+        """
+        report = self.get_report()
+        lines = ["CLY?! startup profile (milliseconds)", "", "Phases:"]
+        lines.extend(
+            f"{phase['time_ns'] / NANOSECONDS_IN_MILLISECOND:10.3f}  "
+            f"{phase['name']} ({phase['calls']}x)"
+            for phase in report["phases"]
+        )
+        lines.extend(["", "Imports (self, cumulative):"])
+        lines.extend(
+            f"{module['self_ns'] / NANOSECONDS_IN_MILLISECOND:10.3f}"
+            f"{module['time_ns'] / NANOSECONDS_IN_MILLISECOND:10.3f}  "
+            f"{module['name']}"
+            for module in report["imports"]
+        )
+        lines.extend(
+            [
+                "",
+                f"{report['total_ns'] / NANOSECONDS_IN_MILLISECOND:10.3f}  "
+                "total since profiler started",
+            ]
+        )
+        return "\n".join(lines)
+
+    def write_report(self) -> None:
+        """Print report to stderr, or write it to the JSON file."""
+        self.untrack_imports()
+        if not self.output:
+            print(self.format_report(), file=sys.stderr)
+            return
+        import json  # pylint: disable=import-outside-toplevel
+
+        with open(self.output, mode="w", encoding="utf-8") as file:
+            json.dump(self.get_report(), file, indent=2)
+
+
+PROFILER: Optional[StartupProfiler] = None
+
+
+def start_profiler(arguments: List[str]) -> List[str]:
+    """
+    Start profiler, if requested by option or environment variable.
+
+    If the CLI is not called, like when the script fails before calling it,
+    the report is written and the import hooks are removed at exit.
+
+    Parameters
+    ----------
+    arguments : List[str]
+        Arguments the script was called with.
+
+    Returns
+    -------
+    List[str]
+        Arguments without profiler's option.
+
+    """
+    global PROFILER  # pylint: disable=global-statement
+    output, arguments = pop_option(arguments, PROFILE_OPTION)
+    if output is None:
+        output = os.environ.get(PROFILE_VARIABLE)
+    if output is not None and PROFILER is None:
+        PROFILER = StartupProfiler(output)
+        PROFILER.track_imports()
+        atexit.register(stop_profiler)
+    return arguments
+
+
+def stop_profiler() -> None:
+    """Write profiler's report, if it was started."""
+    global PROFILER  # pylint: disable=global-statement
+    if PROFILER is not None:
+        PROFILER.write_report()
+        PROFILER = None
+
+
+def phase(name: str) -> ContextManager[None]:
+    """
+    Record time spent in phase, if profiler was started.
+
+    Parameters
+    ----------
+    name : str
+        Phase's name.
+
+    Returns
+    -------
+    ContextManager[None]
+        Context manager to wrap phase with.
+
+    """
+    if PROFILER is None:
+        return contextlib.nullcontext()
+    return PROFILER.phase(name)
+
+
+def profiled(name: str) -> Callable[[Function], Function]:
+    """
+    Record time spent in decorated function as a phase.
+
+    Parameters
+    ----------
+    name : str
+        Phase's name.
+
+    Returns
+    -------
+    Callable[[Function], Function]
+        Decorator.
+
+    """
+
+    def decorator(func: Function) -> Function:
+        @functools.wraps(func)
+        def wrap(*args: Any, **kwargs: Any) -> Any:
+            with phase(name):
+                return func(*args, **kwargs)
+
+        return cast(Function, wrap)
+
+    return decorator
@@ -0,0 +1,313 @@
+"""Interactive shell that runs a CLI's commands in-process."""
+
+import cmd
+import importlib
+import shlex
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from .batch import Runner
+from .completion import build_completion_table, get_candidates
+from .hooks import INTERRUPTED_STATUS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .config import ConfiguredParser
+
+HISTORY_FILE = "history"
+HISTORY_LENGTH = 1000
+SHELL_COMMANDS = ("exit", "help", "quit")
+COMPLETER_DELIMITERS = " \t\n"
+
+
+def import_readline() -> Any:
+    """
+    Import readline, that is not available on every platform.
+
+    Returns
+    -------
+    Any
+        readline module, or None if it is not available.
+
+    """
+    try:
+        return importlib.import_module("readline")
+    except ImportError:  # pragma: no cover
+        return None
+
+
+class CommandShell(cmd.Cmd):
+    """Shell that runs each line as the CLI's arguments."""
+
+    run: Runner
+    get_table: Callable[[], Dict[str, Any]]
+    history_path: Optional[str]
+    timing: bool
+    table: Optional[Dict[str, Any]]
+
+    def __init__(
+        self,
+        run: Runner,
+        get_table: Callable[[], Dict[str, Any]],
+        history_path: Optional[str] = None,
+        timing: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Create shell.
+
+        Parameters
+        ----------
+        run : Runner
+            Function that runs the CLI with arguments, returning exit status.
+        get_table : Callable[[], Dict[str, Any]]
+            Function that builds the CLI's completion table, only called
+            when a line is completed.
+        history_path : Optional[str]
+            File to keep the lines' history in, by default None (history is
+            only kept during the session).
+        timing : bool
+            If each command's wall time and exit status should be written to
+            stderr, by default True.
+        **kwargs : Any
+            ``cmd.Cmd`` arguments, like ``stdin`` and ``stdout``.
+
+        """
+        super().__init__(**kwargs)
+        self.run = run
+        self.get_table = get_table
+        self.history_path = history_path
+        self.timing = timing
+        self.table = None
+
+    def get_completions(self, text: str, line: str, begidx: int) -> List[str]:
+        """
+        Get candidates to complete the word being typed.
+
+        Parameters
+        ----------
+        text : str
+            Word being completed.
+        line : str
+            Typed line.
+        begidx : int
+            Index of the word being completed in the line.
+
+        Returns
+        -------
+        List[str]
+            Candidates, from the CLI's completion table.
+
+        """
+        if self.table is None:
+            self.table = self.get_table()
+        try:
+            words = shlex.split(line[:begidx])
+        except ValueError:
+            return []
+        return get_candidates(self.table, [*words, text])
+
+    def completenames(self, text: str, *args: Any) -> List[str]:
+        """
+        Complete the line's first word: a command or a shell's command.
+
+        Parameters
+        ----------
+        text : str
+            Word being completed.
+        *args : Any
+            Typed line, and begin and end indexes of the word in the line.
+
+        Returns
+        -------
+        List[str]
+            Candidates.
+
+        """
+        names = [name for name in SHELL_COMMANDS if name.startswith(text)]
+        return self.get_completions(text, args[0], args[1]) + names
+
+    def completedefault(self, *args: Any) -> List[str]:
+        """
+        Complete the CLI's arguments.
+
+        Parameters
+        ----------
+        *args : Any
+            Word being completed, typed line, and begin and end indexes of
+            the word in the line.
+
+        Returns
+        -------
+        List[str]
+            Candidates.
+
+        """
+        text, line, begidx, _ = args
+        return self.get_completions(text, line, begidx)
+
+    def complete_help(self, *args: Any) -> List[str]:
+        """
+        Complete the command to get help of.
+
+        Parameters
+        ----------
+        *args : Any
+            Word being completed, typed line, and begin and end indexes of
+            the word in the line.
+
+        Returns
+        -------
+        List[str]
+            Candidates.
+
+        """
+        text, line, begidx, _ = args
+        skipped = len(line.split(maxsplit=1)[0])
+        return self.get_completions(text, line[skipped:], begidx - skipped)
+
+    def emptyline(self) -> bool:
+        """
+        Do nothing, instead of repeating the last line.
+
+        Returns
+        -------
+        bool
+            False, so the shell goes on.
+
+        """
+        return False
+
+    def default(self, line: str) -> None:
+        """
+        Run the CLI with the line's arguments.
+
+        Parameters
+        ----------
+        line : str
+            Shell-quoted arguments.
+
+        """
+        try:
+            arguments = shlex.split(line)
+        except ValueError as error:
+            sys.stderr.write(f"Invalid line: {error}\n")
+            return
+        start = time.perf_counter()
+        try:
+            status = self.run(arguments)
+        except KeyboardInterrupt:
+            sys.stderr.write("KeyboardInterrupt\n")
+            status = INTERRUPTED_STATUS
+        elapsed = time.perf_counter() - start
+        if self.timing:
+            sys.stdout.flush()
+            sys.stderr.write(
+                f"[{elapsed * 1000:.1f} ms, exit status {status}]\n"
+            )
+
+    def do_help(self, arg: str) -> bool:
+        """
+        Show the CLI's help, or the help of a command.
+
+        Parameters
+        ----------
+        arg : str
+            Command's name, if any.
+
+        Returns
+        -------
+        bool
+            False, so the shell goes on.
+
+        """
+        self.default(f"{arg} --help")
+        return False
+
+    def do_exit(self, _: str) -> bool:
+        """
+        Exit the shell.
+
+        Returns
+        -------
+        bool
+            True, so the shell stops.
+
+        """
+        return True
+
+    do_quit = do_exit
+
+    def do_EOF(self, _: str) -> bool:  # pylint: disable=invalid-name
+        """
+        Exit the shell on end of file (Ctrl+D).
+
+        Returns
+        -------
+        bool
+            True, so the shell stops.
+
+        """
+        self.stdout.write("\n")
+        return True
+
+    def run_loop(self) -> None:
+        """Run the shell until it is exited, keeping lines' history."""
+        readline = import_readline() if self.use_rawinput else None
+        if readline:
+            readline.set_completer_delims(COMPLETER_DELIMITERS)
+        if readline and self.history_path:
+            readline.set_history_length(HISTORY_LENGTH)
+            try:
+                readline.read_history_file(self.history_path)
+            except OSError:
+                pass
+        try:
+            while True:
+                try:
+                    self.cmdloop()
+                    break
+                except KeyboardInterrupt:
+                    self.stdout.write("^C\n")
+                    self.intro = None
+        finally:
+            if readline and self.history_path:
+                readline.write_history_file(self.history_path)
+
+
+def run_shell(
+    cli: "ConfiguredParser", timing: bool = True, **kwargs: Any
+) -> None:
+    """
+    Run an interactive shell for the CLI, as set by ``--cly-shell``.
+
+    Parameters
+    ----------
+    cli : ConfiguredParser
+        CLI to run each line with.
+    timing : bool
+        If each command's wall time and exit status should be written to
+        stderr, by default True.
+    **kwargs : Any
+        ``cmd.Cmd`` arguments, like ``stdin`` and ``stdout``.
+
+    Raises
+    ------
+    SystemExit
+        When the shell is exited.
+
+    """
+    shell = CommandShell(
+        cli.run_arguments,
+        lambda: build_completion_table(cli.parser),
+        cli.get_cli_file_path(HISTORY_FILE),
+        timing,
+        **kwargs,
+    )
+    shell.prompt = f"{cli.name}> "
+    shell.intro = (
+        f"{cli.name} {cli.version}. Type help for the commands, or exit to "
+        "quit."
+    )
+    shell.run_loop()
+    raise SystemExit(0)
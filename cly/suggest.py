@@ -0,0 +1,173 @@
+"""Suggestions of commands' names for mistyped ones."""
+
+import heapq
+from typing import Dict, Iterable, List, Set, Tuple
+
+GRAM_SIZE = 3
+MAX_CANDIDATES = 20
+MAX_SUGGESTIONS = 3
+MAX_DISTANCE = 3
+
+
+def get_trigrams(word: str) -> Set[str]:
+    """
+    Get word's trigrams, padded so short words and their edges have some.
+
+    Parameters
+    ----------
+    word : str
+        Word to split.
+
+    Returns
+    -------
+    Set[str]
+        Word's trigrams.
+
+    """
+    padded = f"{' ' * (GRAM_SIZE - 1)}{word} "
+    return {
+        padded[index : index + GRAM_SIZE]
+        for index in range(len(padded) - GRAM_SIZE + 1)
+    }
+
+
+def get_distance(first: str, second: str) -> int:
+    """
+    Get edit distance between words, counting transpositions as one edit.
+
+    Parameters
+    ----------
+    first : str
+        First word.
+    second : str
+        Second word.
+
+    Returns
+    -------
+    int
+        Number of insertions, deletions, substitutions and transpositions of
+        adjacent characters to turn one word into the other.
+
+    """
+    previous: List[int] = []
+    current = list(range(len(second) + 1))
+    for row, first_char in enumerate(first, 1):
+        before, previous = previous, current
+        current = [row]
+        for column, second_char in enumerate(second, 1):
+            distance = min(
+                previous[column] + 1,
+                current[column - 1] + 1,
+                previous[column - 1] + (first_char != second_char),
+            )
+            if (
+                row > 1
+                and column > 1
+                and first_char == second[column - 2]
+                and first[row - 2] == second_char
+            ):
+                distance = min(distance, before[column - 2] + 1)
+            current.append(distance)
+    return current[-1]
+
+
+def get_max_distance(word: str) -> int:
+    """
+    Get maximum edit distance of word's suggestions.
+
+    Parameters
+    ----------
+    word : str
+        Mistyped word.
+
+    Returns
+    -------
+    int
+        One edit for each three characters, from one to ``MAX_DISTANCE``.
+
+    """
+    return min(MAX_DISTANCE, max(1, len(word) // 3))
+
+
+class SuggestionIndex:
+    """Trigram index of names, to find the closest ones to a mistyped one."""
+
+    names: List[str]
+    sizes: List[int]
+    postings: Dict[str, List[int]]
+
+    def __init__(self, names: Iterable[str]) -> None:
+        """
+        Index names by their trigrams.
+
+        Parameters
+        ----------
+        names : Iterable[str]
+            Names to suggest.
+
+        """
+        self.names = list(names)
+        self.sizes = []
+        self.postings = {}
+        for index, name in enumerate(self.names):
+            trigrams = get_trigrams(name)
+            self.sizes.append(len(trigrams))
+            for trigram in trigrams:
+                self.postings.setdefault(trigram, []).append(index)
+
+    def __len__(self) -> int:
+        """
+        Get number of indexed names.
+
+        Returns
+        -------
+        int
+            Number of indexed names.
+
+        """
+        return len(self.names)
+
+    def suggest(self, word: str, limit: int = MAX_SUGGESTIONS) -> List[str]:
+        """
+        Get the closest names to a mistyped word.
+
+        Only names sharing trigrams with the word are candidates, and only the
+        most similar ones, by the share of trigrams they have in common, are
+        compared with it, so the lookup doesn't compare the word with every
+        name.
+
+        Parameters
+        ----------
+        word : str
+            Mistyped word.
+        limit : int, optional
+            Maximum number of suggestions, by default ``MAX_SUGGESTIONS``.
+
+        Returns
+        -------
+        List[str]
+            Closest names, by edit distance and then by name.
+
+        """
+        trigrams = get_trigrams(word)
+        shared: Dict[int, int] = {}
+        for trigram in trigrams:
+            for index in self.postings.get(trigram, ()):
+                shared[index] = shared.get(index, 0) + 1
+
+        def get_similarity(index: int) -> Tuple[float, int]:
+            common = shared[index]
+            union = len(trigrams) + self.sizes[index] - common
+            return common / union, -index
+
+        candidates = heapq.nlargest(MAX_CANDIDATES, shared, key=get_similarity)
+        max_distance = get_max_distance(word)
+        suggestions = []
+        for index in candidates:
+            name = self.names[index]
+            if abs(len(name) - len(word)) > max_distance:
+                continue
+            distance = get_distance(word, name)
+            if distance <= max_distance:
+                suggestions.append((distance, name))
+        return [name for _, name in sorted(suggestions)[:limit]]
@@ -0,0 +1,148 @@
+"""Prefix trie of commands' names, to resolve abbreviated ones."""
+
+from typing import Dict, Iterable, List, Optional
+
+
+class TrieNode:
+    """Node of a prefix trie, with the number of names under it."""
+
+    __slots__ = ("children", "name", "count", "first")
+
+    children: Dict[str, "TrieNode"]
+    name: Optional[str]
+    count: int
+    first: str
+
+    def __init__(self) -> None:
+        """Initialize empty node."""
+        self.children = {}
+        self.name = None
+        self.count = 0
+        self.first = ""
+
+
+class PrefixTrie:
+    """Prefix trie of names, resolving unambiguous prefixes to their name."""
+
+    root: TrieNode
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """
+        Build trie of names.
+
+        Parameters
+        ----------
+        names : Iterable[str], optional
+            Names to add, by default ().
+
+        """
+        self.root = TrieNode()
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        """
+        Get number of names in trie.
+
+        Returns
+        -------
+        int
+            Number of names in trie.
+
+        """
+        return self.root.count
+
+    def add(self, name: str) -> None:
+        """
+        Add name to trie, counting it in each of its prefixes' nodes.
+
+        Parameters
+        ----------
+        name : str
+            Name to add.
+
+        """
+        node = self.find(name)
+        if node is not None and node.name is not None:
+            return
+        node = self.root
+        node.count += 1
+        node.first = node.first or name
+        for char in name:
+            node = node.children.setdefault(char, TrieNode())
+            node.count += 1
+            node.first = node.first or name
+        node.name = name
+
+    def find(self, prefix: str) -> Optional[TrieNode]:
+        """
+        Find prefix's node.
+
+        Parameters
+        ----------
+        prefix : str
+            Prefix of names.
+
+        Returns
+        -------
+        Optional[TrieNode]
+            Prefix's node, if any name starts with it.
+
+        """
+        node = self.root
+        for char in prefix:
+            child = node.children.get(char)
+            if child is None:
+                return None
+            node = child
+        return node
+
+    def resolve(self, prefix: str) -> Optional[str]:
+        """
+        Resolve prefix to the only name starting with it, in prefix's length.
+
+        A name is resolved to itself, even if it is a prefix of other names.
+
+        Parameters
+        ----------
+        prefix : str
+            Name or prefix of a name.
+
+        Returns
+        -------
+        Optional[str]
+            Resolved name, if prefix is a name or only one name starts with
+            it.
+
+        """
+        node = self.find(prefix)
+        if node is None:
+            return None
+        if node.name is not None:
+            return node.name
+        return node.first if node.count == 1 else None
+
+    def complete(self, prefix: str) -> List[str]:
+        """
+        Get all names starting with prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            Prefix of names.
+
+        Returns
+        -------
+        List[str]
+            Names starting with prefix, in alphabetical order.
+
+        """
+        node = self.find(prefix)
+        names = []
+        nodes = [node] if node is not None else []
+        while nodes:
+            node = nodes.pop()
+            if node.name is not None:
+                names.append(node.name)
+            nodes.extend(node.children.values())
+        return sorted(names)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark help formatting of parsers with many options.
+
+Compares CLY?!'s formatter with argparse's, for parsers with an increasing
+number of options, so it shows how both scale: usage sections against CLY?!'s
+formatter with argparse's usage formatting, and help messages against
+argparse's formatter.
+
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+# Run from a checkout, like ``scripts/benchmark_help.py``, without installing
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# pylint: disable=wrong-import-position
+from cly.config import USAGE_PREFIX, CustomFormatter  # noqa: E402
+
+OPTION_COUNTS = (10, 100, 1000, 5000)
+
+
+class ArgparseFormatter(CustomFormatter):
+    """CLY?!'s formatter, with argparse's usage formatting."""
+
+    def _format_usage(
+        self,
+        usage: Optional[str],
+        actions: Iterable[argparse.Action],
+        groups: Iterable[Any],
+        prefix: Optional[str],
+    ) -> str:
+        """
+        Format usage section with argparse.
+
+        Parameters
+        ----------
+        usage : Optional[str]
+            usage.
+        actions : Iterable[argparse.Action]
+            argparse actions.
+        groups : Iterable[Any]
+            argparse groups.
+        prefix : Optional[str]
+            usage prefix.
+
+        Returns
+        -------
+        str
+            Formatted usage section.
+
+        """
+        return argparse.HelpFormatter._format_usage(
+            self, usage, actions, groups, USAGE_PREFIX
+        )
+
+
+def create_parser(
+    options: int, formatter_class: Any
+) -> argparse.ArgumentParser:
+    """
+    Create parser with many options.
+
+    Parameters
+    ----------
+    options : int
+        Number of options.
+    formatter_class : Any
+        Parser's formatter class.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Parser.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="batcomputer",
+        description="Run Batcomputer analysis on selected areas.",
+        formatter_class=formatter_class,
+    )
+    for index in range(options):
+        parser.add_argument(
+            f"--option-{index}", metavar="VALUE", help=f"Option {index}."
+        )
+    parser.add_argument("aliases", nargs="+", help="Aliases.")
+    return parser
+
+
+def measure(options: int, formatter_class: Any, usage: bool) -> float:
+    """
+    Measure formatting time.
+
+    Parameters
+    ----------
+    options : int
+        Number of options.
+    formatter_class : Any
+        Parser's formatter class.
+    usage : bool
+        If only the usage section is formatted; else, the help message.
+
+    Returns
+    -------
+    float
+        Shortest time to format it, in milliseconds.
+
+    """
+    parser = create_parser(options, formatter_class)
+    format_text = parser.format_usage if usage else parser.format_help
+    return min(timeit.repeat(format_text, number=1, repeat=5)) * 1000
+
+
+def main() -> None:
+    """Print formatting times of both formatters for each option count."""
+    print(f"{'Options':>8} {'Section':>8} {'argparse':>12} {'CLY?!':>12}")
+    for options in OPTION_COUNTS:
+        for section, baseline, usage in (
+            ("usage", ArgparseFormatter, True),
+            ("help", argparse.HelpFormatter, False),
+        ):
+            argparse_time = measure(options, baseline, usage)
+            cly_time = measure(options, CustomFormatter, usage)
+            print(
+                f"{options:>8} {section:>8} {argparse_time:>9.2f} ms "
+                f"{cly_time:>9.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
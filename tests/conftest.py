@@ -0,0 +1,40 @@
+from typing import Any, Callable, Dict
+
+import pytest
+
+from cly import config
+
+from .batcomputer_cli.commands.list_aliases import list_aliases
+
+CLI_CONFIG = {
+    "name": "Batcomputer",
+    "description": "Run Batcomputer analysis on selected areas.",
+    "epilog": "Wayne Enterprises",
+    "version": "1.0.0",
+}
+IDENTIFY = "tests.batcomputer_cli.commands.identify:identify"
+CLIFactory = Callable[..., config.ConfiguredParser]
+
+
+@pytest.fixture(name="cli_config")
+def fixture_cli_config() -> Dict[str, str]:
+    return dict(CLI_CONFIG)
+
+
+@pytest.fixture(name="create_cli")
+def fixture_create_cli(cli_config: Dict[str, str]) -> CLIFactory:
+    def create_cli(
+        commands: bool = True, **options: Any
+    ) -> config.ConfiguredParser:
+        cli = config.ConfiguredParser(
+            cli_config, options=config.ParserOptions(**options)
+        )
+        if commands:
+            identify_command = cli.create_command(IDENTIFY, alias="id")
+            identify_command.add_argument(
+                dest="aliases", metavar="aliases", nargs="+"
+            )
+            cli.create_command(list_aliases, alias="ls")
+        return cli
+
+    return create_cli
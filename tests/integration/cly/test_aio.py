@@ -0,0 +1,81 @@
+import asyncio
+from typing import List, Optional
+
+from cly import config
+from cly.aio import LoopFactory, gather_limited, run_blocking
+from cly.hooks import DispatchEvent
+from cly.testing import run_cli
+
+from ...conftest import CLI_CONFIG
+
+
+async def poll(services: List[str]) -> None:
+    """Poll services concurrently."""
+
+    async def check(service: str) -> str:
+        await asyncio.sleep(0.01)
+        return await run_blocking(str.upper, service)
+
+    for status in await gather_limited(map(check, services), limit=2):
+        print(status)
+
+
+async def wait_forever() -> None:
+    """Wait until interrupted."""
+    asyncio.get_event_loop().call_soon(interrupt)
+    await asyncio.sleep(10)
+
+
+def interrupt() -> None:
+    raise KeyboardInterrupt
+
+
+def create_cli(
+    loop_factory: Optional[LoopFactory] = None,
+) -> config.ConfiguredParser:
+    cli = config.ConfiguredParser(
+        CLI_CONFIG, options=config.ParserOptions(loop_factory=loop_factory)
+    )
+    cli.create_command(poll).add_argument("services", nargs="+")
+    cli.create_command(wait_forever, alias="wait")
+    return cli
+
+
+def test_async_command_is_run() -> None:
+    exit_code, stdout, _ = run_cli(create_cli(), ["poll", "gcpd", "wayne"])
+    assert exit_code == 0
+    assert stdout == "GCPD\nWAYNE\n"
+
+
+def test_async_command_is_run_with_hooks() -> None:
+    events: List[DispatchEvent] = []
+    cli = create_cli()
+    cli.add_hook("after", events.append)
+    exit_code, _, _ = run_cli(cli, ["poll", "gcpd"])
+    assert exit_code == 0
+    assert events[0].wall_time >= 0.01
+
+
+def test_async_command_is_run_on_loop_from_factory() -> None:
+    loops: List[asyncio.AbstractEventLoop] = []
+
+    def new_event_loop() -> asyncio.AbstractEventLoop:
+        loops.append(asyncio.new_event_loop())
+        return loops[-1]
+
+    exit_code, _, _ = run_cli(
+        create_cli(loop_factory=new_event_loop), ["poll", "gcpd"]
+    )
+    assert exit_code == 0
+    assert len(loops) == 1
+    assert loops[0].is_closed()
+
+
+def test_interrupted_async_command() -> None:
+    events: List[DispatchEvent] = []
+    cli = create_cli()
+    cli.add_hook("error", events.append)
+    exit_code, _, stderr = run_cli(cli, ["wait"])
+    assert exit_code == 130
+    assert stderr == "KeyboardInterrupt\n"
+    assert events[0].exit_status == 130
@@ -0,0 +1,120 @@
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from cly import config
+from cly.testing import run_cli
+
+from ...conftest import CLI_CONFIG
+
+BATCH = """\
+hello --name Alfred
+["hello", "--name", "Bruce Wayne"]
+fail
+fly
+"""
+
+
+def hello(name: str) -> None:
+    """Say hello."""
+    print(f"Hello {name}")
+
+
+def fail() -> None:
+    """Fail."""
+    raise RuntimeError("Joker was here")
+
+
+def create_cli() -> config.ConfiguredParser:
+    cli = config.ConfiguredParser(CLI_CONFIG)
+    cli.create_command(hello).add_argument("--name", default="World")
+    cli.create_command(fail)
+    return cli
+
+
+@pytest.fixture(name="batch_file")
+def fixture_batch_file(tmp_path: Path) -> Path:
+    path = tmp_path / "batch.txt"
+    path.write_text(BATCH, encoding="utf-8")
+    return path
+
+
+def test_batch_runs_lines_in_order(batch_file: Path) -> None:
+    exit_code, stdout, stderr = run_cli(
+        create_cli(), [f"--cly-batch={batch_file}"]
+    )
+    assert exit_code == 1
+    assert stdout == "Hello Alfred\nHello Bruce Wayne\n"
+    assert "RuntimeError: Joker was here" in stderr
+    assert "invalid choice: 'fly'" in stderr
+
+
+def test_batch_file_after_space(batch_file: Path) -> None:
+    assert run_cli(create_cli(), ["--cly-batch", str(batch_file)]) == (
+        run_cli(create_cli(), [f"--cly-batch={batch_file}"])
+    )
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+@pytest.mark.parametrize("separator", ["=", " "])
+def test_batch_runs_lines_in_pool(
+    pool: str, separator: str, batch_file: Path
+) -> None:
+    options = {
+        "--cly-batch": str(batch_file),
+        "--cly-batch-jobs": "3",
+        "--cly-batch-pool": pool,
+        "--cly-batch-format": "json",
+    }
+    exit_code, stdout, _ = run_cli(
+        create_cli(),
+        [
+            argument
+            for option, value in options.items()
+            for argument in f"{option}{separator}{value}".split(separator)
+        ],
+    )
+    assert exit_code == 1
+    results = [json.loads(line) for line in stdout.splitlines()]
+    assert [result["status"] for result in results] == [0, 0, 1, 2]
+    assert [result["stdout"] for result in results[:2]] == [
+        "Hello Alfred\n",
+        "Hello Bruce Wayne\n",
+    ]
+
+
+def test_batch_without_failures(tmp_path: Path) -> None:
+    path = tmp_path / "batch.txt"
+    path.write_text("hello\nhello --name Robin\n", encoding="utf-8")
+    exit_code, stdout, _ = run_cli(create_cli(), [f"--cly-batch={path}"])
+    assert exit_code == 0
+    assert stdout == "Hello World\nHello Robin\n"
+
+
+@pytest.mark.parametrize(
+    "arguments, message",
+    [
+        (["--cly-batch-jobs=0"], "Invalid batch jobs 0"),
+        (["--cly-batch-jobs=many"], "invalid literal for int()"),
+        (["hello"], "unrecognized arguments: hello"),
+        (["--cly-batch-format=xml"], "Invalid batch format 'xml'"),
+    ],
+)
+def test_batch_with_invalid_options(
+    batch_file: Path, arguments: List[str], message: str
+) -> None:
+    exit_code, _, stderr = run_cli(
+        create_cli(), [f"--cly-batch={batch_file}", *arguments]
+    )
+    assert exit_code == 2
+    assert message in stderr
+
+
+def test_batch_with_missing_file(tmp_path: Path) -> None:
+    exit_code, _, stderr = run_cli(
+        create_cli(), [f"--cly-batch={tmp_path / 'missing.txt'}"]
+    )
+    assert exit_code == 2
+    assert "No such file or directory" in stderr
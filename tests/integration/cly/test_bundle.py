@@ -0,0 +1,99 @@
+import shutil
+import subprocess  # nosec
+import sys
+import zipfile
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from cly.bundle import main
+
+PACKAGE = Path(__file__).parents[2] / "batcomputer_cli"
+
+
+def run_bundle(
+    bundle: Path, *arguments: str
+) -> "subprocess.CompletedProcess[str]":
+    return subprocess.run(  # nosec
+        [sys.executable, str(bundle), *arguments],
+        capture_output=True,
+        check=False,
+        env={"XDG_CACHE_HOME": str(bundle.parent / "cache")},
+        text=True,
+    )
+
+
+def test_bundle_runs_cli_with_warm_caches(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    bundle = tmp_path / "batcomputer.pyz"
+    assert main([str(PACKAGE), f"--output={bundle}", "--runs=1"]) == 0
+    stdout = capsys.readouterr().out
+    assert f"Bundled {PACKAGE} into {bundle}.\n" in stdout
+    assert "Startup time of --help: " in stdout
+    assert " ms bundled, " in stdout
+    with zipfile.ZipFile(bundle) as archive:
+        names = archive.namelist()
+        help_cache = archive.read(".cly-cache/batcomputer/help.json")
+    assert "__main__.pyc" in names
+    assert "cly/config.pyc" in names
+    assert "batcomputer_cli/commands/identify.pyc" in names
+    assert ".cly-cache/batcomputer/manifest.json" in names
+    assert ".cly-cache/batcomputer/help.json" in names
+    result = run_bundle(bundle, "id", "joker")
+    assert (result.returncode, result.stderr) == (0, "")
+    assert result.stdout.startswith("Jack Napier A.K.A. Joker")
+    result = run_bundle(bundle, "--help")
+    assert result.returncode == 0
+    assert "[python|python3] batcomputer.pyz" in result.stdout
+    caches = list((tmp_path / "cache" / "cly").glob("batcomputer-*/*/*"))
+    assert sorted(path.name for path in caches) == [
+        "help.json",
+        "manifest.json",
+    ]
+    assert caches[0].with_name("help.json").read_bytes() == help_cache
+
+
+@pytest.mark.parametrize("arguments", [["--help"], ["id", "--help"]])
+def test_bundle_moved_uses_bundled_help(
+    tmp_path: Path, arguments: List[str]
+) -> None:
+    bundle = tmp_path / "build" / "batcomputer.pyz"
+    bundle.parent.mkdir()
+    assert main([str(PACKAGE), f"--output={bundle}", "--runs=0"]) == 0
+    with zipfile.ZipFile(bundle) as archive:
+        help_cache = archive.read(".cly-cache/batcomputer/help.json")
+    moved = tmp_path / "installed" / "batcomputer.pyz"
+    moved.parent.mkdir()
+    shutil.move(str(bundle), moved)
+    result = run_bundle(moved, *arguments)
+    assert (result.returncode, result.stderr) == (0, "")
+    assert "[python|python3] batcomputer.pyz" in result.stdout
+    caches = (tmp_path / "installed" / "cache" / "cly").glob("*/*/help.json")
+    assert [path.read_bytes() for path in caches] == [help_cache]
+
+
+def test_bundle_with_default_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    assert main([str(PACKAGE), "--runs=0"]) == 0
+    assert (tmp_path / "batcomputer_cli.pyz").exists()
+
+
+def test_bundle_with_invalid_package(tmp_path: Path) -> None:
+    with pytest.raises(SystemExit) as error:
+        main([str(tmp_path / "missing")])
+    assert error.value.code == 2
+
+
+def test_bundle_with_syntax_error(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    package = tmp_path / "broken"
+    package.mkdir()
+    (package / "__main__.py").write_text("CLI = (\n", encoding="utf-8")
+    with pytest.raises(SystemExit):
+        main([str(package), f"--output={tmp_path / 'broken.pyz'}"])
+    assert "SyntaxError" in capsys.readouterr().err
@@ -0,0 +1,134 @@
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from cly import loader
+from cly.cache import MANIFEST_FILE, print_command_help
+from cly.loader import LazyCommand
+from cly.testing import run_cli
+
+from ...batcomputer_cli.commands.list_aliases import list_aliases
+from ...conftest import IDENTIFY, CLIFactory
+
+
+def fail(*args: Any, **kwargs: Any) -> None:
+    raise AssertionError("Command should not be inspected")
+
+
+def test_manifest_is_created_on_cold_start(
+    tmp_path: Path, create_cli: CLIFactory, cli_config: Dict[str, str]
+) -> None:
+    cli = create_cli(cache_dir=tmp_path)
+    exit_code, stdout, _ = run_cli(cli, ["id", "--help"])
+    assert exit_code == 0
+    assert "One or more alias to be identified" in stdout
+    manifest = json.loads((tmp_path / MANIFEST_FILE).read_text("utf-8"))
+    assert manifest["version"] == cli_config["version"]
+    assert manifest["commands"]["id"]["target"] == IDENTIFY
+    assert manifest["commands"]["id"]["source"].endswith("identify.py")
+    assert manifest["commands"]["id"]["params"]["aliases"].startswith("One")
+    assert manifest["commands"]["ls"]["description"].startswith("List all")
+    assert "params" not in manifest["commands"]["ls"]
+
+
+def test_warm_start_does_not_inspect_commands(
+    tmp_path: Path, create_cli: CLIFactory
+) -> None:
+    run_cli(create_cli(cache_dir=tmp_path), ["id", "--help"])
+    with patch.object(loader, "get_help_from_docstring", fail):
+        with patch.object(loader, "get_params_help", fail):
+            cli = create_cli(cache_dir=tmp_path)
+            exit_code, stdout, stderr = run_cli(cli, ["id", "--help"])
+    assert not stderr
+    assert "Identify the person behind each alias." in stdout
+    assert "One or more alias to be identified" in stdout
+    assert exit_code == 0
+    assert isinstance(cli.commands, dict)
+    assert isinstance(cli.commands["id"], LazyCommand)
+    assert not cli.commands["id"].is_resolved
+
+
+def test_manifest_is_updated_on_new_version(
+    tmp_path: Path, create_cli: CLIFactory, cli_config: Dict[str, str]
+) -> None:
+    run_cli(create_cli(cache_dir=tmp_path), ["--version"])
+    cli_config["version"] = "2.0.0"
+    run_cli(create_cli(cache_dir=tmp_path), ["ls", "--help"])
+    manifest = json.loads((tmp_path / MANIFEST_FILE).read_text("utf-8"))
+    assert manifest["version"] == "2.0.0"
+    assert "params" in manifest["commands"]["ls"]
+
+
+def test_manifest_with_help_message(
+    tmp_path: Path, create_cli: CLIFactory
+) -> None:
+    cli = create_cli(commands=False, cache_dir=tmp_path)
+    cli.create_command(list_aliases, alias="ls", help_message="List.")
+    exit_code, stdout, _ = run_cli(cli, ["ls", "--help"])
+    assert exit_code == 0
+    assert "Use Oracle's help to get more data." not in stdout
+    manifest = json.loads((tmp_path / MANIFEST_FILE).read_text("utf-8"))
+    assert manifest["commands"]["ls"]["source"].endswith("list_aliases.py")
+
+
+@pytest.fixture(name="create_help_cached_cli")
+def fixture_create_help_cached_cli(create_cli: CLIFactory) -> CLIFactory:
+    return lambda cache_dir: create_cli(
+        cache_dir=cache_dir, lazy_parsers=True, cache_help=True
+    )
+
+
+def test_cache_help_requires_cache_dir(create_cli: CLIFactory) -> None:
+    with pytest.raises(ValueError):
+        create_cli(cache_help=True)
+
+
+@pytest.mark.parametrize("arguments", [[], ["-h"], ["id", "--help"]])
+def test_help_is_printed_from_cache(
+    arguments: List[str],
+    tmp_path: Path,
+    create_cli: CLIFactory,
+    create_help_cached_cli: CLIFactory,
+) -> None:
+    cold = run_cli(create_help_cached_cli(tmp_path), arguments)
+    assert cold == run_cli(create_cli(cache_dir=tmp_path), arguments)
+    with patch.object(argparse.ArgumentParser, "format_help", fail):
+        cli = create_help_cached_cli(tmp_path)
+        assert run_cli(cli, arguments) == cold
+    assert cli.subparser is not None
+    assert not cli.subparser.choices.is_built("id")
+
+
+def test_help_cache_is_invalidated_when_parser_changes(
+    tmp_path: Path, create_help_cached_cli: CLIFactory
+) -> None:
+    run_cli(create_help_cached_cli(tmp_path), ["ls", "--help"])
+    cli = create_help_cached_cli(tmp_path)
+    assert cli.subparser is not None
+    cli.subparser.choices["ls"].add_argument("-n", "--new", help="New.")
+    exit_code, stdout, _ = run_cli(cli, ["ls", "--help"])
+    assert exit_code == 0
+    assert "--new" in stdout
+
+
+def test_caches_are_set_by_environment(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, create_cli: CLIFactory
+) -> None:
+    monkeypatch.setenv("CLY_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("CLY_CACHE_HELP", "1")
+    cli = create_cli()
+    assert cli.cache_dir == str(tmp_path / "batcomputer")
+    run_cli(cli, ["--help"])
+    assert (tmp_path / "batcomputer" / MANIFEST_FILE).exists()
+    assert (tmp_path / "batcomputer" / "help.json").exists()
+    explicit = tmp_path / "explicit"
+    assert create_cli(cache_dir=explicit).cache_dir == str(explicit)
+
+
+def test_print_help_without_help_cache(create_cli: CLIFactory) -> None:
+    cli = create_cli(commands=False)
+    print_command_help(cli, "ls")
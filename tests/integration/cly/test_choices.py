@@ -0,0 +1,119 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from cly import config
+from cly.choices import Choices
+from cly.completion import main
+from cly.testing import run_cli
+
+from ...conftest import CLI_CONFIG
+
+AREAS = [f"area-{index:05}" for index in range(20000)]
+
+
+def scan(area: str, sector: str = "") -> None:
+    """Scan area."""
+    print(f"Scanning {area} {sector}".strip())
+
+
+class Loader:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> Iterator[str]:
+        self.calls += 1
+        yield from AREAS
+
+
+def create_cli(
+    choices: Choices, cache_dir: Path, fast_parser: bool = False
+) -> config.ConfiguredParser:
+    cli = config.ConfiguredParser(
+        CLI_CONFIG,
+        options=config.ParserOptions(
+            cache_dir=cache_dir, fast_parser=fast_parser
+        ),
+    )
+    command = cli.create_command(scan)
+    command.add_argument(dest="area", choices=choices)
+    command.add_argument(
+        "-s", "--sector", choices=choices, help="One of %(choices)s."
+    )
+    return cli
+
+
+@pytest.fixture(name="areas_file")
+def fixture_areas_file(tmp_path: Path) -> Path:
+    path = tmp_path / "areas.txt"
+    path.write_text("\n".join(AREAS), encoding="utf-8")
+    return path
+
+
+def test_help_summarizes_choices(tmp_path: Path) -> None:
+    loader = Loader()
+    cli = create_cli(Choices(loader), tmp_path)
+    exit_code, stdout, _ = run_cli(cli, ["scan", "--help"])
+    assert exit_code == 0
+    summary = "area-00000,area-00001,area-00002,area-00003,area-00004,..."
+    assert f"[-s {{{summary}}}]" in stdout
+    assert "One of area-00000, area-00001, area-00002" in stdout
+    assert "area-00004, ....\n" in stdout
+    assert "area-00005" not in stdout
+    assert loader.calls == 1
+
+
+def test_choices_are_not_loaded_by_creating_parser(tmp_path: Path) -> None:
+    loader = Loader()
+    cli = create_cli(Choices(loader), tmp_path)
+    assert loader.calls == 0
+    exit_code, _, _ = run_cli(cli, ["--version"])
+    assert exit_code == 0
+    assert loader.calls == 0
+
+
+def test_help_streams_choices_file(tmp_path: Path, areas_file: Path) -> None:
+    choices = Choices.from_file(areas_file)
+    cli = create_cli(choices, tmp_path)
+    exit_code, stdout, _ = run_cli(cli, ["scan", "--help"])
+    assert exit_code == 0
+    assert "area-00004, ....\n" in stdout
+    assert choices._values is None
+
+
+@pytest.mark.parametrize("fast_parser", [True, False])
+def test_choices_are_checked(tmp_path: Path, fast_parser: bool) -> None:
+    loader = Loader()
+    cli = create_cli(Choices(loader), tmp_path, fast_parser)
+    arguments = ["scan", "area-19999", "--sector=area-00042"]
+    assert run_cli(cli, arguments) == (
+        0,
+        "Scanning area-19999 area-00042\n",
+        "",
+    )
+    exit_code, _, stderr = run_cli(cli, ["scan", "batcave"])
+    assert exit_code == 2
+    assert stderr.endswith(
+        "error: argument area: invalid choice: 'batcave' (choose from "
+        "'area-00000', 'area-00001', 'area-00002', 'area-00003', "
+        "'area-00004', ...)\n"
+    )
+    assert loader.calls == 1
+
+
+def test_completion_reads_choices_file(
+    tmp_path: Path, areas_file: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    choices = Choices.from_file(areas_file)
+    cli = create_cli(choices, tmp_path / "cache")
+    exit_code, _, _ = run_cli(cli, ["--cly-completion=bash"])
+    assert exit_code == 0
+    assert choices._values is None
+    table_path = str(tmp_path / "cache" / "completion.json")
+    assert main([table_path, "2", "cli", "scan", "area-1999"]) == 0
+    assert capsys.readouterr().out == "".join(
+        f"area-1999{index}\n" for index in range(10)
+    )
+    assert main([table_path, "3", "cli", "scan", "-s", "area-0000"]) == 0
+    assert capsys.readouterr().out.count("\n") == 10
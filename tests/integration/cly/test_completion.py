@@ -0,0 +1,112 @@
+import json
+import os
+import subprocess  # nosec
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cly import config
+from cly.completion import main
+from cly.testing import run_cli
+
+from ...batcomputer_cli.commands.identify import identify
+from ...batcomputer_cli.commands.list_aliases import list_aliases
+from ...conftest import CLI_CONFIG
+
+
+def create_cli(cache_dir: Path) -> config.ConfiguredParser:
+    cli = config.ConfiguredParser(
+        CLI_CONFIG, options=config.ParserOptions(cache_dir=cache_dir)
+    )
+    cli.parser.add_argument("--level", choices=[1, 2, 3])
+    identify_command = cli.create_command(identify, alias="id")
+    identify_command.add_argument(
+        dest="aliases", nargs="+", choices=["joker", "penguin"]
+    )
+    cli.create_command(list_aliases, alias="ls")
+    database = config.ConfiguredParser(CLI_CONFIG)
+    database.create_command(list_aliases, alias="ls")
+    cli.create_group(database, "db")
+    return cli
+
+
+def complete(
+    table_path: Path, line: str, capsys: pytest.CaptureFixture[str]
+) -> str:
+    words = ["completion", *line.split(" ")]
+    assert main([str(table_path), str(len(words) - 1), *words]) == 0
+    return capsys.readouterr().out
+
+
+@pytest.mark.parametrize("shell", ["bash", "zsh", "fish"])
+def test_completion_script_is_printed(
+    shell: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    cli = create_cli(tmp_path)
+    exit_code, stdout, _ = run_cli(cli, [f"--cly-completion={shell}"])
+    assert exit_code == 0
+    assert str(tmp_path / "completion.json") in stdout
+    table_path = tmp_path / "completion.json"
+    assert json.loads(table_path.read_text(encoding="utf-8"))["format"] == 1
+    capsys.readouterr()
+    assert complete(table_path, "", capsys) == "id\nls\ndb\n"
+    assert complete(table_path, "--level ", capsys) == "1\n2\n3\n"
+    assert complete(table_path, "id j", capsys) == "joker\n"
+    assert complete(table_path, "db l", capsys) == "ls\n"
+    assert complete(table_path, "db ls --", capsys) == "--help\n"
+
+
+def test_completion_shell_is_read_from_environment(tmp_path: Path) -> None:
+    cli = create_cli(tmp_path)
+    with patch.dict(os.environ, {"SHELL": "/usr/bin/fish"}):
+        exit_code, stdout, _ = run_cli(cli, ["--cly-completion"])
+    assert exit_code == 0
+    assert "complete -c" in stdout
+
+
+def test_completion_table_is_written_next_to_script(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    cli = config.ConfiguredParser(CLI_CONFIG)
+    exit_code, stdout, _ = run_cli(cli, ["--cly-completion=bash"])
+    assert exit_code == 0
+    assert "complete -o default" in stdout
+    assert (tmp_path / ".file_name-completion.json").exists()
+
+
+def test_completion_with_invalid_shell(tmp_path: Path) -> None:
+    exit_code, _, stderr = run_cli(
+        create_cli(tmp_path), ["--cly-completion=csh"]
+    )
+    assert exit_code == 2
+    assert "Invalid shell 'csh'" in stderr
+    assert not (tmp_path / "completion.json").exists()
+
+
+def test_completion_does_not_import_argparse(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    run_cli(create_cli(tmp_path), ["--cly-completion=bash"])
+    script = Path(main.__code__.co_filename)
+    result = subprocess.run(  # nosec
+        [
+            sys.executable,
+            "-S",
+            "-E",
+            "-c",
+            "import runpy, sys; sys.argv = sys.argv[1:]; "
+            "runpy.run_path(sys.argv[0], run_name='__main__')",
+            str(script),
+            str(tmp_path / "completion.json"),
+            "1",
+            "completion",
+            "i",
+        ],
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+    assert result.stdout == "id\n"
@@ -1,7 +1,15 @@
+import os
+import subprocess  # nosec
+import sys
+from pathlib import Path
+from typing import List, Set
+
 import pytest
 
 from cly import config
 
+from ...batcomputer_cli.commands.identify import identify
+
 CLI_CONFIG = {
     "name": "Test",
     "description": "",
@@ -9,6 +17,54 @@ CLI_CONFIG = {
     "version": "test",
 }
 METAVAR = "STRING"
+PROJECT_ROOT = Path(__file__).parents[3]
+SCRIPT = f"""
+import sys
+
+from cly import config
+from tests.batcomputer_cli.commands.identify import identify
+
+CLI = config.ConfiguredParser({CLI_CONFIG!r})
+CLI.create_command(identify).add_argument(dest="aliases", nargs="+")
+try:
+    CLI()
+finally:
+    sys.stderr.write(" ".join(sys.modules))
+"""
+IMPORT_SCRIPT = """
+import sys
+
+from cly import config
+
+sys.stderr.write(" ".join(sys.modules))
+"""
+DEFERRED_MODULES = (
+    "cly.aio",
+    "cly.batch",
+    "cly.choices",
+    "cly.completion",
+    "cly.daemon",
+    "cly.external",
+    "cly.fastpath",
+    "cly.groups",
+    "cly.hooks",
+    "cly.pager",
+    "cly.plugins",
+    "cly.shell",
+    "cly.suggest",
+    "cly.trie",
+    "cmd",
+    "copy",
+    "hashlib",
+    "importlib.util",
+    "json",
+    "shlex",
+    "socket",
+    "tempfile",
+    "threading",
+    "traceback",
+)
+PATH_MODULES = ("ipaddress", "pathlib", "urllib.parse")
 
 CLI = config.ConfiguredParser(CLI_CONFIG)
 CLI.parser.add_argument(
@@ -26,3 +82,46 @@ def test_metavar_only_appears_once_in_help(
     output, error = capsys.readouterr()
     assert not error
     assert output.count(METAVAR) == 2  # and once in usage
+
+
+def test_prepare_command_sets_params_help() -> None:
+    cli = config.ConfiguredParser(CLI_CONFIG)
+    command = cli.create_command(identify, alias="id")
+    command.add_argument(dest="aliases", metavar="aliases", nargs="+")
+    cli.prepare_command("id")
+    assert command._actions[1].help == (
+        "One or more alias to be identified, separated by spaces."
+    )
+
+
+def get_imported_modules(script: str, arguments: List[str]) -> Set[str]:
+    environment = {
+        name: value
+        for name, value in os.environ.items()
+        if not name.startswith("CLY_")
+    }
+    result = subprocess.run(  # nosec
+        [sys.executable, "-c", script, *arguments],
+        check=True,
+        cwd=PROJECT_ROOT,
+        env={**environment, "PYTHONPATH": str(PROJECT_ROOT)},
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    return set(result.stderr.split())
+
+
+@pytest.mark.parametrize("arguments", [["--version"], ["identify", "joker"]])
+def test_plain_run_does_not_import_optional_modules(
+    arguments: List[str],
+) -> None:
+    modules = get_imported_modules(SCRIPT, arguments)
+    assert "cly.config" in modules
+    assert modules.isdisjoint(DEFERRED_MODULES)
+
+
+def test_config_does_not_import_pathlib() -> None:
+    modules = get_imported_modules(IMPORT_SCRIPT, [])
+    assert "cly.config" in modules
+    assert modules.isdisjoint(PATH_MODULES)
@@ -0,0 +1,157 @@
+import os
+import socket
+import subprocess  # nosec
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+
+from cly import config
+from cly.daemon import CLIENT_PATH, DaemonServer, run_client
+from cly.testing import run_cli
+
+from ...conftest import CLI_CONFIG
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Needs UNIX sockets"
+)
+SCRIPT = """
+from cly import config
+
+
+def hello(name: str = "World") -> None:
+    \"\"\"Say hello.\"\"\"
+    print(f"Hello {name}")
+
+
+CLI = config.ConfiguredParser(
+    {
+        "name": "Daemon",
+        "description": "Test resident daemon.",
+        "epilog": "",
+        "version": "1.0.0",
+    }
+)
+CLI.create_command(hello).add_argument("--name", default="World")
+CLI()
+"""
+PROJECT_ROOT = Path(__file__).parents[3]
+
+
+def hello(name: str = "World") -> None:
+    """Say hello."""
+    print(f"Hello {name}")
+
+
+def fail() -> None:
+    """Fail."""
+    raise RuntimeError("Joker was here")
+
+
+def create_cli(cache_dir: Path) -> config.ConfiguredParser:
+    cli = config.ConfiguredParser(
+        CLI_CONFIG, options=config.ParserOptions(cache_dir=cache_dir)
+    )
+    cli.create_command(hello).add_argument("--name", default="World")
+    cli.create_command(fail)
+    return cli
+
+
+def wait_for_socket(path: Path) -> None:
+    deadline = time.monotonic() + 30
+    while not path.is_socket():
+        assert time.monotonic() < deadline, "Daemon did not start"
+        time.sleep(0.05)
+
+
+def test_daemon_runs_commands(tmp_path: Path) -> None:
+    cli = create_cli(tmp_path)
+
+    def serve() -> None:
+        with pytest.raises(SystemExit):
+            cli.serve(idle_timeout=0.5)
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    wait_for_socket(tmp_path / "daemon.sock")
+    read_fd, write_fd = os.pipe()
+    fds = (0, write_fd, write_fd)
+    path = str(tmp_path / "daemon.sock")
+    assert run_client(path, ["cli", "hello", "--name", "Alfred"], fds) == 0
+    assert run_client(path, ["cli", "fail"], fds) == 1
+    assert run_client(path, ["cli", "fly"], fds) == 2
+    thread.join()
+    os.close(write_fd)
+    with os.fdopen(read_fd, encoding="utf-8") as file:
+        output = file.read()
+    assert output.startswith("Hello Alfred\n")
+    assert "RuntimeError: Joker was here" in output
+    assert "invalid choice: 'fly'" in output
+    assert (tmp_path / "manifest.json").exists()
+
+
+def test_serve_option(tmp_path: Path) -> None:
+    path = tmp_path / "batcomputer.sock"
+    cli = create_cli(tmp_path)
+    with patch.object(DaemonServer, "serve", return_value=False):
+        exit_code, _, stderr = run_cli(cli, [f"--cly-serve={path}", "hello"])
+    assert exit_code == 0
+    assert not cli.replace_process
+    assert f"Serving Batcomputer on {path}. Call it with:" in stderr
+    assert f"'-S' '-E' '{CLIENT_PATH}' '{path}'" in stderr
+
+
+def test_daemon_restarts_when_sources_change(tmp_path: Path) -> None:
+    calls: List[Any] = []
+    with patch.object(DaemonServer, "serve", return_value=True), patch(
+        "os.execv", lambda *args: calls.append(args)
+    ):
+        exit_code, _, stderr = run_cli(create_cli(tmp_path), ["--cly-serve"])
+    assert exit_code == 0
+    assert str(tmp_path / "daemon.sock") in stderr
+    assert calls == [
+        (sys.executable, [sys.executable, "file_name", "--cly-serve"])
+    ]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Needs UNIX sockets")
+def test_client_process_calls_daemon(tmp_path: Path) -> None:
+    script = tmp_path / "daemon_cli.py"
+    script.write_text(SCRIPT, encoding="utf-8")
+    socket_path = tmp_path / "daemon.sock"
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_ROOT)}
+    client = [
+        sys.executable,
+        "-S",
+        "-E",
+        CLIENT_PATH,
+        str(socket_path),
+        str(script),
+        "hello",
+        "--name",
+        "Alfred",
+    ]
+    server = subprocess.Popen(  # nosec
+        [sys.executable, str(script), f"--cly-serve={socket_path}"],
+        env=env,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_socket(socket_path)
+        result = subprocess.run(  # nosec
+            client, capture_output=True, check=False, env=env, text=True
+        )
+        assert (result.returncode, result.stdout) == (0, "Hello Alfred\n")
+        os.utime(script, (0, 0))
+        result = subprocess.run(  # nosec
+            client, capture_output=True, check=False, env=env, text=True
+        )
+        assert (result.returncode, result.stdout) == (0, "Hello Alfred\n")
+        assert server.poll() is None
+    finally:
+        server.terminate()
+        server.wait()
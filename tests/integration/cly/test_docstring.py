@@ -242,4 +242,36 @@ def test_param_help_priority(
     assert sys_exit.value.code == 0
 
 
-# TODO test get param help with description breaking lines
+def test_get_param_help_from_docstring_breaking_lines(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    function_to_test_docstring.__doc__ = """
+    Function to test docstring styles.
+
+    Parameters
+    ----------
+    param1 : str
+        A very detailed info,
+        breaking lines.
+
+    """
+    cli_config = {
+        "name": "Test",
+        "description": "",
+        "epilog": "",
+        "version": "test",
+    }
+    cli = config.ConfiguredParser(cli_config)
+    command = cli.create_command(function_to_test_docstring)
+    command.add_argument("-p", "--param1", action="store_true")
+    sys_mock = ["file_name", "function_to_test_docstring", "--help"]
+    with patch.object(sys, "argv", sys_mock):
+        with pytest.raises(SystemExit) as sys_exit:
+            cli()
+    output, error = capsys.readouterr()
+    assert not error
+    assert all(
+        word in output
+        for word in "A very detailed info, breaking lines.".split()
+    )
+    assert sys_exit.value.code == 0
@@ -0,0 +1,147 @@
+import io
+import os
+import stat
+import subprocess  # nosec
+import sys
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+
+from cly import config
+from cly.testing import run_cli
+
+from ...batcomputer_cli.commands.list_aliases import list_aliases
+from ...conftest import CLI_CONFIG
+
+SCRIPT = """
+from cly import config
+
+CLI = config.ConfiguredParser(
+    {
+        "name": "External",
+        "description": "Test external commands.",
+        "epilog": "",
+        "version": "1.0.0",
+    }
+)
+CLI.add_external_commands()
+CLI()
+"""
+PROJECT_ROOT = Path(__file__).parents[3]
+
+
+def fail(*args: Any) -> None:
+    raise AssertionError("Process should not be replaced")
+
+
+@pytest.fixture(name="bin_path")
+def fixture_bin_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    bin_path = tmp_path / "bin"
+    bin_path.mkdir()
+    for name in ("batcomputer-hello", "batcomputer-ls"):
+        path = bin_path / name
+        path.write_text('#!/bin/sh\necho "hello $*"\n', encoding="utf-8")
+        path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv("PATH", os.pathsep.join([str(bin_path), os.defpath]))
+    return bin_path
+
+
+def create_cli(cache_dir: Path) -> config.ConfiguredParser:
+    cli = config.ConfiguredParser(
+        CLI_CONFIG, options=config.ParserOptions(cache_dir=cache_dir)
+    )
+    cli.create_command(list_aliases, alias="ls")
+    cli.add_external_commands("batcomputer")
+    return cli
+
+
+def test_external_commands_are_listed(bin_path: Path, tmp_path: Path) -> None:
+    exit_code, stdout, _ = run_cli(create_cli(tmp_path), ["--help"])
+    assert exit_code == 0
+    assert "Run external command batcomputer-hello." in stdout
+    assert "batcomputer-ls" not in stdout
+
+
+def test_external_command_is_executed(bin_path: Path, tmp_path: Path) -> None:
+    calls: List[Any] = []
+
+    def execvp(*args: Any) -> None:
+        calls.append(args)
+        raise SystemExit(0)
+
+    cli = create_cli(tmp_path)
+    with patch("os.execvp", execvp):
+        exit_code, _, _ = run_cli(cli, ["hello", "--help", "-x", "Alfred"])
+    assert exit_code == 0
+    path = str(bin_path / "batcomputer-hello")
+    assert calls == [(path, [path, "--help", "-x", "Alfred"])]
+    assert (tmp_path / "external.json").exists()
+    assert (tmp_path / "manifest.json").exists()
+
+
+def test_external_command_runs_in_batch(
+    bin_path: Path, tmp_path: Path
+) -> None:
+    batch_file = tmp_path / "batch.txt"
+    batch_file.write_text("hello Alfred\nhello Bruce\n", encoding="utf-8")
+    cli = create_cli(tmp_path)
+    with patch("os.execvp", fail):
+        exit_code, stdout, _ = run_cli(cli, [f"--cly-batch={batch_file}"])
+    assert exit_code == 0
+    assert stdout == "hello Alfred\nhello Bruce\n"
+
+
+def test_external_command_runs_in_shell(
+    bin_path: Path, tmp_path: Path
+) -> None:
+    lines = "hello --help\nhello Alfred\nexit\n"
+    with patch("os.execvp", fail), patch.object(
+        sys, "stdin", io.StringIO(lines)
+    ):
+        exit_code, stdout, _ = run_cli(create_cli(tmp_path), ["--cly-shell"])
+    assert exit_code == 0
+    assert "hello --help\n" in stdout
+    assert "hello Alfred\n" in stdout
+
+
+def test_external_command_exit_status_in_process(
+    bin_path: Path, tmp_path: Path
+) -> None:
+    failing = bin_path / "batcomputer-fail"
+    failing.write_text(
+        "#!/bin/sh\necho failed >&2\nexit 3\n", encoding="utf-8"
+    )
+    failing.chmod(failing.stat().st_mode | stat.S_IXUSR)
+    cli = create_cli(tmp_path)
+    cli.replace_process = False
+    with patch("os.execvp", fail):
+        exit_code, _, stderr = run_cli(cli, ["fail"])
+    assert exit_code == 3
+    assert stderr == "failed\n"
+
+
+def test_external_command_parser_accepts_any_arguments(
+    bin_path: Path, tmp_path: Path
+) -> None:
+    cli = create_cli(tmp_path)
+    if cli.subparser:
+        parser = cli.subparser.choices["hello"]
+        namespace = parser.parse_args(["Alfred", "--help"])
+        assert namespace.arguments == ["Alfred", "--help"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Needs a shell script")
+def test_script_process_is_replaced(bin_path: Path, tmp_path: Path) -> None:
+    script = tmp_path / "batcomputer.py"
+    script.write_text(SCRIPT, encoding="utf-8")
+    result = subprocess.run(  # nosec
+        [sys.executable, str(script), "hello", "--help"],
+        capture_output=True,
+        check=False,
+        env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT)},
+        text=True,
+    )
+    assert result.returncode == 0
+    assert result.stdout == "hello --help\n"
@@ -0,0 +1,124 @@
+import sys
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from cly import config
+from cly.testing import run_cli
+
+from ...batcomputer_cli.commands.identify import identify
+from ...batcomputer_cli.commands.list_aliases import list_aliases
+from ...conftest import CLI_CONFIG
+
+DATABASE_CONFIG = {
+    "name": "Database",
+    "description": "Manage the database.",
+    "epilog": "",
+    "version": "1.0.0",
+}
+GROUP_MODULE = '''
+from cly import config
+
+
+def up(steps: int = 1) -> None:
+    """Apply migrations."""
+    print(f"Applying {steps} migrations")
+
+
+MIGRATE = config.ConfiguredParser(
+    {
+        "name": "Migrate",
+        "description": "Manage migrations.",
+        "epilog": "",
+        "version": "1.0.0",
+    },
+    options=config.ParserOptions(lazy_parsers=True),
+)
+MIGRATE.create_command(up).add_argument("-s", "--steps", type=int)
+'''
+FAST_ARGUMENTS = [
+    ["-o", "id", "joker", "riddler"],
+    ["id", "joker", "riddler"],
+    ["ls", "--oracle"],
+    ["db", "ls"],
+    ["db", "migrate", "up", "--steps", "2"],
+    ["db", "migrate", "up", "--steps=3"],
+]
+ARGUMENTS = [
+    *FAST_ARGUMENTS,
+    [],
+    ["--help"],
+    ["--version"],
+    ["id", "--help"],
+    ["id"],
+    ["id", "-k", "joker"],
+    ["riddler"],
+    ["db"],
+    ["db", "migrate", "up", "--steps", "two"],
+    ["db", "migrate", "up", "--st", "2"],
+]
+
+
+@pytest.fixture(autouse=True)
+def group_module(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[None]:
+    (tmp_path / "group_module.py").write_text(GROUP_MODULE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    sys.modules.pop("group_module", None)
+
+
+def create_cli(fast_parser: bool) -> config.ConfiguredParser:
+    database = config.ConfiguredParser(DATABASE_CONFIG)
+    database.create_group(
+        "group_module:MIGRATE", "migrate", help_message="Manage migrations."
+    )
+    database.create_command(list_aliases, alias="ls")
+    cli = config.ConfiguredParser(
+        CLI_CONFIG,
+        options=config.ParserOptions(
+            lazy_parsers=True, fast_parser=fast_parser
+        ),
+    )
+    cli.parser.add_argument(
+        "-o", "--oracle", action="store_true", help="Use Oracle."
+    )
+    identify_command = cli.create_command(identify, alias="id")
+    identify_command.add_argument(dest="aliases", metavar="aliases", nargs="+")
+    cli.create_command(list_aliases, alias="ls").add_argument(
+        "-o", "--oracle", action="store_true"
+    )
+    cli.create_group(database, "db")
+    return cli
+
+
+@pytest.mark.parametrize("arguments", ARGUMENTS)
+def test_fast_parser_has_same_behavior(arguments: List[str]) -> None:
+    assert run_cli(create_cli(True), arguments) == run_cli(
+        create_cli(False), arguments
+    )
+
+
+@pytest.mark.parametrize("arguments", FAST_ARGUMENTS)
+def test_fast_parser_parses_common_arguments(arguments: List[str]) -> None:
+    cli = create_cli(True)
+    assert cli.fast_parser is not None
+    namespace = cli.fast_parser.parse_args(arguments)
+    assert namespace == create_cli(False).parser.parse_args(arguments)
+
+
+def test_fast_parser_runs_arguments(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    cli = create_cli(True)
+    assert cli.run_arguments(["db", "migrate", "up", "-s", "4"]) == 0
+    assert cli.run_arguments(["db", "migrate", "up", "-s", "four"]) == 2
+    output = capsys.readouterr()
+    assert output.out == "Applying 4 migrations\n"
+    assert "invalid int value: 'four'" in output.err
+
+
+def test_fast_parser_is_disabled_by_default() -> None:
+    assert config.ConfiguredParser(CLI_CONFIG).fast_parser is None
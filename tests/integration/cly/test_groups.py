@@ -0,0 +1,186 @@
+import sys
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import pytest
+
+from cly import config
+from cly.groups import get_group, get_prog
+from cly.hooks import DispatchEvent
+from cly.loader import LazyCommand
+from cly.testing import run_cli
+
+from ...batcomputer_cli.commands.list_aliases import list_aliases
+from ...conftest import CLI_CONFIG
+
+DATABASE_CONFIG = {
+    "name": "Database",
+    "description": "Manage the database.\nMore details.",
+    "epilog": "",
+    "version": "1.0.0",
+}
+GROUP_MODULE = '''
+from cly import config
+from cly.groups import get_group, get_prog
+
+
+def up(steps: int = 1) -> None:
+    """
+    Apply migrations.
+
+    Parameters
+    ----------
+    steps : int, optional
+        How many migrations to apply, by default 1
+
+    """
+    print(f"Applying {steps} migrations")
+
+
+MIGRATE = config.ConfiguredParser(
+    {
+        "name": "Migrate",
+        "description": "Manage migrations.",
+        "epilog": "",
+        "version": "1.0.0",
+    },
+    options=config.ParserOptions(lazy_parsers=True),
+)
+up_command = MIGRATE.create_command(up)
+up_command.add_argument("-s", "--steps", type=int)
+NOT_A_PARSER = 1
+'''
+
+
+@pytest.fixture(autouse=True)
+def group_module(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[None]:
+    (tmp_path / "group_module.py").write_text(GROUP_MODULE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    sys.modules.pop("group_module", None)
+
+
+def create_cli(
+    cache_dir: Optional[Path] = None,
+) -> config.ConfiguredParser:
+    database = config.ConfiguredParser(
+        DATABASE_CONFIG, options=config.ParserOptions(cache_dir=cache_dir)
+    )
+    database.create_group(
+        "group_module:MIGRATE", "migrate", help_message="Manage migrations."
+    )
+    database.create_command(list_aliases, alias="ls")
+    cli = config.ConfiguredParser(CLI_CONFIG)
+    cli.create_group(database, "db")
+    cli.create_command(list_aliases, alias="ls")
+    return cli
+
+
+def get_database(cli: config.ConfiguredParser) -> config.ConfiguredParser:
+    return get_group(cli, "db")
+
+
+def test_help_does_not_load_groups() -> None:
+    cli = create_cli()
+    exit_code, stdout, stderr = run_cli(cli, ["--help"])
+    assert exit_code == 0
+    assert not stderr
+    assert "Manage the database." in stdout
+    assert "More details." not in stdout
+    assert not cli.subparser.choices.is_built("db")  # type: ignore
+    assert isinstance(get_database(cli).groups["migrate"], LazyCommand)
+    assert "group_module" not in sys.modules
+
+
+def test_group_help() -> None:
+    cli = create_cli()
+    exit_code, stdout, stderr = run_cli(cli, ["db", "--help"])
+    assert exit_code == 0
+    assert not stderr
+    assert f"{sys.argv[0]} db\n" in stdout
+    assert "Manage migrations." in stdout
+    assert "More details." in stdout
+    assert "group_module" not in sys.modules
+
+
+def test_nested_command_help() -> None:
+    cli = create_cli()
+    exit_code, stdout, stderr = run_cli(cli, ["db", "migrate", "up", "-h"])
+    assert exit_code == 0
+    assert not stderr
+    assert f"{sys.argv[0]} db migrate up\n" in stdout
+    assert "How many migrations to apply." in stdout
+
+
+def test_nested_command_is_called() -> None:
+    events: List[DispatchEvent] = []
+    cli = create_cli()
+    cli.add_hook("after", events.append)
+    exit_code, stdout, stderr = run_cli(
+        cli, ["db", "migrate", "up", "--steps", "2"]
+    )
+    assert exit_code == 0
+    assert not stderr
+    assert stdout == "Applying 2 migrations\n"
+    assert [event.command for event in events] == ["db migrate up"]
+    assert events[0].kwargs == {"steps": 2}
+
+
+def test_commands_with_same_name_in_groups() -> None:
+    cli = create_cli()
+    exit_code, stdout, _ = run_cli(cli, ["db", "ls"])
+    assert exit_code == 0
+    assert "Batman" in stdout
+    exit_code, stdout, _ = run_cli(cli, ["ls"])
+    assert exit_code == 0
+    assert "Batman" in stdout
+
+
+def test_group_without_command() -> None:
+    exit_code, _, stderr = run_cli(create_cli(), ["db"])
+    assert exit_code == 2
+    assert "the following arguments are required: command" in stderr
+
+
+def test_lazy_group_without_help_message_is_imported() -> None:
+    cli = config.ConfiguredParser(CLI_CONFIG)
+    cli.create_group("group_module:MIGRATE", "migrate")
+    assert "group_module" in sys.modules
+    exit_code, stdout, _ = run_cli(cli, ["--help"])
+    assert exit_code == 0
+    assert "Manage migrations." in stdout
+
+
+def test_lazy_group_that_is_not_a_parser() -> None:
+    cli = config.ConfiguredParser(CLI_CONFIG)
+    with pytest.raises(TypeError) as error:
+        cli.create_group("group_module:NOT_A_PARSER", "invalid")
+    assert "is not a ConfiguredParser, but a int" in str(error.value)
+
+
+def test_set_prog_of_loaded_groups() -> None:
+    cli = create_cli()
+    run_cli(cli, ["db", "migrate", "up"])
+    cli.set_prog("renamed")
+    migrate = get_group(get_database(cli), "migrate")
+    assert get_database(cli).parser.prog == "renamed db"
+    assert get_prog(migrate) == "renamed db migrate"
+    assert migrate.parser.prog == "renamed db migrate"
+    assert (migrate.subparser.choices["up"].prog) == (  # type: ignore
+        "renamed db migrate up"
+    )
+
+
+def test_set_prog_without_commands() -> None:
+    cli = config.ConfiguredParser(CLI_CONFIG)
+    cli.set_prog("renamed")
+    assert get_prog(cli) == "renamed"
+
+
+def test_caches_of_loaded_groups_are_saved(tmp_path: Path) -> None:
+    cli = create_cli(tmp_path)
+    exit_code, _, _ = run_cli(cli, ["db", "ls"])
+    assert exit_code == 0
+    assert (tmp_path / "manifest.json").exists()
@@ -0,0 +1,145 @@
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from cly import config
+from cly.hooks import INTERRUPTED_STATUS, DispatchEvent, JsonLinesSink
+from cly.testing import run_cli
+
+from ...batcomputer_cli.commands.list_aliases import list_aliases
+from ...conftest import CLIFactory
+
+
+def exit_with(status: int) -> None:
+    """
+    Exit with status.
+
+    Parameters
+    ----------
+    status : int
+        Exit status.
+
+    """
+    raise SystemExit(status)
+
+
+def fail(message: str) -> None:
+    """
+    Fail with message.
+
+    Parameters
+    ----------
+    message : str
+        Error message.
+
+    """
+    raise ValueError(message)
+
+
+def interrupt() -> None:
+    """Interrupt command, like pressing Ctrl+C."""
+    raise KeyboardInterrupt
+
+
+def add_hooks(
+    cli: config.ConfiguredParser, events: List[DispatchEvent]
+) -> config.ConfiguredParser:
+    for event in ("before", "after", "error"):
+        cli.add_hook(event, events.append)
+    exit_command = cli.create_command(exit_with, alias="exit")
+    exit_command.add_argument(dest="status", type=int)
+    fail_command = cli.create_command(fail)
+    fail_command.add_argument(dest="message")
+    cli.create_command(interrupt)
+    return cli
+
+
+def test_add_hook_with_invalid_event(create_cli: CLIFactory) -> None:
+    cli = create_cli(commands=False)
+    with pytest.raises(ValueError) as error:
+        cli.add_hook("during", print)
+    assert "Invalid hook event 'during'" in str(error.value)
+
+
+def test_hooks_of_successful_command(create_cli: CLIFactory) -> None:
+    events: List[DispatchEvent] = []
+    exit_code, stdout, _ = run_cli(
+        add_hooks(create_cli(), events), ["id", "Batman"]
+    )
+    assert exit_code == 0
+    assert "Bruce Wayne" in stdout
+    assert [event.event for event in events] == ["before", "after"]
+    assert events[0].kwargs == {"aliases": ["Batman"]}
+    assert events[0].exit_status is None
+    assert events[1].exit_status == 0
+    assert events[1].wall_time >= 0
+    assert events[1].cpu_time >= 0
+    assert events[1].error is None
+
+
+def test_hooks_of_command_that_exits_successfully(
+    create_cli: CLIFactory,
+) -> None:
+    events: List[DispatchEvent] = []
+    exit_code, _, _ = run_cli(add_hooks(create_cli(), events), ["exit", "0"])
+    assert exit_code == 0
+    assert [event.event for event in events] == ["before", "after"]
+
+
+def test_hooks_of_command_that_exits_with_error(
+    create_cli: CLIFactory,
+) -> None:
+    events: List[DispatchEvent] = []
+    exit_code, _, _ = run_cli(add_hooks(create_cli(), events), ["exit", "3"])
+    assert exit_code == 3
+    assert [event.event for event in events] == ["before", "error", "after"]
+    assert events[1].exit_status == 3
+    assert isinstance(events[1].error, SystemExit)
+
+
+def test_hooks_of_command_that_raises_exception(
+    create_cli: CLIFactory,
+) -> None:
+    events: List[DispatchEvent] = []
+    with pytest.raises(ValueError):
+        run_cli(add_hooks(create_cli(), events), ["fail", "Joker"])
+    assert [event.event for event in events] == ["before", "error", "after"]
+    assert events[2].exit_status == 1
+    assert str(events[2].error) == "Joker"
+
+
+def test_hooks_of_interrupted_command(create_cli: CLIFactory) -> None:
+    events: List[DispatchEvent] = []
+    with pytest.raises(KeyboardInterrupt):
+        run_cli(add_hooks(create_cli(), events), ["interrupt"])
+    assert [event.event for event in events] == ["before", "error", "after"]
+    assert events[2].exit_status == INTERRUPTED_STATUS
+    assert isinstance(events[2].error, KeyboardInterrupt)
+
+
+def test_hooks_are_not_called_when_command_is_not_called(
+    create_cli: CLIFactory,
+) -> None:
+    events: List[DispatchEvent] = []
+    exit_code, _, _ = run_cli(add_hooks(create_cli(), events), ["--help"])
+    assert exit_code == 0
+    assert not events
+
+
+def test_json_lines_sink(tmp_path: Path, create_cli: CLIFactory) -> None:
+    path = tmp_path / "events.jsonl"
+    cli = create_cli(commands=False)
+    cli.add_hook("after", JsonLinesSink(path))
+    cli.create_command(list_aliases, alias="ls")
+    for _ in range(2):
+        run_cli(cli, ["ls"])
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["command"] for line in lines] == ["ls", "ls"]
+
+
+def test_dispatch_command_without_commands(create_cli: CLIFactory) -> None:
+    cli = create_cli(commands=False)
+    with pytest.raises(KeyError):
+        cli.dispatch_command("ls", {})
@@ -0,0 +1,82 @@
+from typing import List
+
+import pytest
+
+from cly import config
+from cly.testing import run_cli
+
+from ...batcomputer_cli.commands.identify import identify
+from ...batcomputer_cli.commands.list_aliases import list_aliases
+from ...conftest import CLI_CONFIG
+
+ARGUMENTS = [
+    [],
+    ["--help"],
+    ["--version"],
+    ["id", "--help"],
+    ["ls", "-h"],
+    ["-o", "id", "joker", "riddler"],
+    ["ls", "--oracle"],
+    ["id"],
+    ["id", "-k", "joker"],
+    ["riddler"],
+]
+
+
+def create_cli(lazy_parsers: bool) -> config.ConfiguredParser:
+    cli = config.ConfiguredParser(
+        CLI_CONFIG, options=config.ParserOptions(lazy_parsers=lazy_parsers)
+    )
+    cli.parser.add_argument(
+        "-o", "--oracle", action="store_true", help="Use Oracle."
+    )
+    identify_command = cli.create_command(identify, alias="id")
+    action = identify_command.add_argument(
+        dest="aliases", metavar="aliases", nargs="+"
+    )
+    action.help = "Aliases to identify."
+    group = cli.create_command(list_aliases, alias="ls").add_argument_group(
+        "Oracle"
+    )
+    group.add_argument("-o", "--oracle", action="store_true")
+    return cli
+
+
+@pytest.mark.parametrize("arguments", ARGUMENTS)
+def test_lazy_parsers_have_same_behavior(arguments: List[str]) -> None:
+    assert run_cli(create_cli(True), arguments) == run_cli(
+        create_cli(False), arguments
+    )
+
+
+@pytest.mark.parametrize("arguments", [[], ["--version"], ["riddler"]])
+def test_lazy_parsers_are_not_built_without_command(
+    arguments: List[str],
+) -> None:
+    cli = create_cli(True)
+    run_cli(cli, arguments)
+    assert cli.subparser is not None
+    assert not cli.subparser.choices.is_built("id")
+    assert not cli.subparser.choices.is_built("ls")
+
+
+def test_lazy_parsers_only_build_called_command() -> None:
+    cli = create_cli(True)
+    exit_code, stdout, _ = run_cli(cli, ["id", "batman"])
+    assert exit_code == 0
+    assert "Bruce Wayne" in stdout
+    assert cli.subparser is not None
+    assert cli.subparser.choices.is_built("id")
+    assert not cli.subparser.choices.is_built("ls")
+
+
+def test_lazy_parsers_only_record_parser_methods() -> None:
+    cli = create_cli(True)
+    command = cli.create_command(identify, alias="who")
+    with pytest.raises(AttributeError):
+        getattr(command, "prog")
+    with pytest.raises(AttributeError):
+        command.parse_args(["batman"])
+    exit_code, stdout, _ = run_cli(cli, ["id", "--help"])
+    assert exit_code == 0
+    assert "Aliases to identify." in stdout
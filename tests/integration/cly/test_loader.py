@@ -0,0 +1,74 @@
+from typing import Dict, Tuple
+
+from cly import config
+from cly.loader import LazyCommand
+from cly.testing import run_cli
+
+from ...conftest import CLI_CONFIG
+
+COMMANDS = "tests.batcomputer_cli.commands"
+IDENTIFY_HELP = "Identify the person behind each alias."
+
+
+def create_cli() -> Tuple[config.ConfiguredParser, Dict[str, LazyCommand]]:
+    cli = config.ConfiguredParser(CLI_CONFIG)
+    cli.parser.add_argument("-o", "--oracle", action="store_true")
+    identify_command = cli.create_command(
+        f"{COMMANDS}.identify:identify", alias="id", help_message=IDENTIFY_HELP
+    )
+    identify_command.add_argument(dest="aliases", metavar="aliases", nargs="+")
+    cli.create_command(f"{COMMANDS}.list_aliases:list_aliases", alias="ls")
+    assert isinstance(cli.commands, dict)
+    commands = {
+        name: command
+        for name, command in cli.commands.items()
+        if isinstance(command, LazyCommand)
+    }
+    return cli, commands
+
+
+def test_lazy_command_with_help_message_is_not_imported() -> None:
+    cli, commands = create_cli()
+    exit_code, stdout, stderr = run_cli(cli, ["--version"])
+    assert not stderr
+    assert "Batcomputer version 1.0.0" in stdout
+    assert exit_code == 0
+    assert not commands["id"].is_resolved
+
+
+def test_lazy_command_without_help_message_is_imported() -> None:
+    cli, commands = create_cli()
+    exit_code, stdout, stderr = run_cli(cli, ["--help"])
+    assert not stderr
+    assert IDENTIFY_HELP in stdout
+    assert "List all aliases in Batcomputer." in stdout
+    assert exit_code == 0
+    assert not commands["id"].is_resolved
+    assert commands["ls"].is_resolved
+
+
+def test_lazy_command_is_imported_when_help_is_requested() -> None:
+    cli, commands = create_cli()
+    exit_code, stdout, stderr = run_cli(cli, ["id", "--help"])
+    assert not stderr
+    assert "One or more alias to be identified" in stdout
+    assert exit_code == 0
+    assert commands["id"].is_resolved
+
+
+def test_lazy_command_is_imported_when_called() -> None:
+    cli, commands = create_cli()
+    exit_code, stdout, stderr = run_cli(cli, ["-o", "id", "joker", "riddler"])
+    assert "Heath Ledger" in stdout
+    assert "Riddler not identified" in stderr
+    assert exit_code == 0
+    assert commands["id"].is_resolved
+
+
+def test_lazy_command_with_invalid_command_name() -> None:
+    cli, commands = create_cli()
+    exit_code, stdout, stderr = run_cli(cli, ["riddler"])
+    assert not stdout
+    assert "invalid choice" in stderr
+    assert exit_code == 2
+    assert not commands["id"].is_resolved
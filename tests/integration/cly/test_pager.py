@@ -0,0 +1,83 @@
+import io
+import os
+import shlex
+import subprocess  # nosec
+import sys
+from pathlib import Path
+
+import pytest
+
+from cly import config
+
+from ...conftest import CLI_CONFIG
+
+PROJECT_ROOT = Path(__file__).parents[3]
+SCRIPT = f"""
+from cly import config
+
+CLI = config.ConfiguredParser({CLI_CONFIG!r})
+for index in range(100):
+    CLI.parser.add_argument(f"--option-{{index}}", help=f"Option {{index}}.")
+CLI()
+"""
+
+
+class Terminal(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+
+@pytest.mark.parametrize("cache_help", ["1", "0"])
+def test_help_to_closed_pipe(tmp_path: Path, cache_help: str) -> None:
+    script = tmp_path / "batcomputer.py"
+    script.write_text(SCRIPT, encoding="utf-8")
+    reader, writer = os.pipe()
+    os.close(reader)
+    try:
+        result = subprocess.run(  # nosec
+            [sys.executable, str(script), "--help"],
+            check=False,
+            env={
+                **os.environ,
+                "PYTHONPATH": str(PROJECT_ROOT),
+                "CLY_CACHE_DIR": str(tmp_path / "cache"),
+                "CLY_CACHE_HELP": cache_help,
+            },
+            stdout=writer,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    finally:
+        os.close(writer)
+    assert (result.returncode, result.stderr) == (0, "")
+
+
+@pytest.mark.parametrize("cache_help", [True, False])
+def test_help_taller_than_terminal_is_paged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, cache_help: bool
+) -> None:
+    output = tmp_path / "paged.txt"
+    command = [
+        sys.executable,
+        "-c",
+        "import sys; open(sys.argv[1], 'w').write(sys.stdin.read())",
+        str(output),
+    ]
+    monkeypatch.setenv("PAGER", " ".join(map(shlex.quote, command)))
+    monkeypatch.setattr(
+        "shutil.get_terminal_size", lambda: os.terminal_size((80, 5))
+    )
+    monkeypatch.setattr(sys, "argv", ["batcomputer", "--help"])
+    stdout = Terminal()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    cli = config.ConfiguredParser(
+        CLI_CONFIG,
+        options=config.ParserOptions(
+            cache_dir=tmp_path / "cache", cache_help=cache_help
+        ),
+    )
+    with pytest.raises(SystemExit) as error:
+        cli()
+    assert error.value.code == 0
+    assert stdout.getvalue() == ""
+    assert output.read_text() == cli.parser.format_help()
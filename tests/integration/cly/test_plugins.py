@@ -0,0 +1,89 @@
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from cly import config
+from cly.testing import run_cli
+
+from ...batcomputer_cli.commands.list_aliases import list_aliases
+from ...conftest import CLI_CONFIG
+
+GROUP = "cly.integration_plugins"
+PLUGIN_MODULE = '''
+def hello(name: str) -> None:
+    """
+    Say hello.
+
+    Parameters
+    ----------
+    name : str
+        Who to say hello to.
+
+    """
+    print(f"Hello, {name}!")
+
+
+def undocumented() -> None:
+    print("Undocumented")
+'''
+
+
+@pytest.fixture(autouse=True)
+def plugins_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[None]:
+    dist_info = tmp_path / "fake_plugin-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: fake-plugin\nVersion: 1.0\n",
+        encoding="utf-8",
+    )
+    (dist_info / "entry_points.txt").write_text(
+        f"[{GROUP}]\nhello = integration_plugin:hello\n"
+        "ls = integration_plugin:hello\n"
+        "undocumented = integration_plugin.undocumented\n"
+        "nodoc = integration_plugin:undocumented\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "integration_plugin.py").write_text(
+        PLUGIN_MODULE, encoding="utf-8"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    sys.modules.pop("integration_plugin", None)
+
+
+def create_cli(cache_dir: Path) -> config.ConfiguredParser:
+    cli = config.ConfiguredParser(
+        CLI_CONFIG, options=config.ParserOptions(cache_dir=cache_dir)
+    )
+    cli.create_command(list_aliases, alias="ls")
+    cli.add_plugins(GROUP)
+    hello_command = (cli.subparser.choices or {})["hello"]  # type: ignore
+    hello_command.add_argument(dest="name")
+    return cli
+
+
+def test_plugins_are_listed_without_import(tmp_path: Path) -> None:
+    exit_code, stdout, stderr = run_cli(create_cli(tmp_path), ["--help"])
+    assert exit_code == 0
+    assert not stderr
+    assert "Say hello." in stdout
+    assert "integration_plugin:undocumented" in stdout
+    assert "List all aliases in Batcomputer." in stdout
+    assert "integration_plugin" not in sys.modules
+
+
+def test_plugin_is_imported_when_called(tmp_path: Path) -> None:
+    exit_code, stdout, _ = run_cli(create_cli(tmp_path), ["hello", "Alfred"])
+    assert exit_code == 0
+    assert stdout == "Hello, Alfred!\n"
+    assert "integration_plugin" in sys.modules
+
+
+def test_created_command_is_not_replaced_by_plugin(tmp_path: Path) -> None:
+    exit_code, stdout, _ = run_cli(create_cli(tmp_path), ["ls"])
+    assert exit_code == 0
+    assert "Batman" in stdout
@@ -0,0 +1,102 @@
+import importlib
+import json
+import os
+import subprocess  # nosec
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+import cly
+from cly import profiler
+from cly.profiler import PROFILE_OPTION, PROFILE_VARIABLE
+from cly.testing import run_cli
+
+from ...conftest import CLI_CONFIG, CLIFactory
+
+PROJECT_ROOT = Path(__file__).parents[3]
+SCRIPT = f"""
+from cly import config, profiler
+
+print(profiler.PROFILER is None)
+CLI = config.ConfiguredParser({CLI_CONFIG!r})
+print(profiler.PROFILER is None)
+"""
+
+
+@pytest.fixture(autouse=True)
+def reset_profiler(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.delenv(PROFILE_VARIABLE, raising=False)
+    yield
+    if profiler.PROFILER is not None:
+        profiler.PROFILER.untrack_imports()
+    profiler.PROFILER = None
+
+
+def test_option_is_removed_and_report_is_written(
+    tmp_path: Path, create_cli: CLIFactory
+) -> None:
+    output = tmp_path / "profile.json"
+    exit_code, stdout, stderr = run_cli(
+        create_cli(), ["ls", f"{PROFILE_OPTION}={output}"]
+    )
+    assert exit_code == 0
+    assert "Batman" in stdout
+    assert not stderr
+    report = json.loads(output.read_text(encoding="utf-8"))
+    phases = {phase["name"] for phase in report["phases"]}
+    assert {"parse_args", "prepare_command", "command"} <= phases
+    assert profiler.PROFILER is None
+
+
+def test_report_is_printed_to_stderr(
+    monkeypatch: pytest.MonkeyPatch, create_cli: CLIFactory
+) -> None:
+    monkeypatch.setenv(PROFILE_VARIABLE, "1")
+    profiler.start_profiler([])
+    exit_code, stdout, stderr = run_cli(create_cli(), ["--help"])
+    assert exit_code == 0
+    assert "Commands" in stdout
+    assert "create_command (2x)" in stderr
+    assert "create_parser (1x)" in stderr
+
+
+def test_only_option_shows_help(create_cli: CLIFactory) -> None:
+    exit_code, stdout, stderr = run_cli(create_cli(), [PROFILE_OPTION])
+    assert exit_code == 0
+    assert "Commands" in stdout
+    assert "Phases:" in stderr
+
+
+def test_profiler_starts_with_parser_not_on_import() -> None:
+    result = subprocess.run(  # nosec
+        [sys.executable, "-c", SCRIPT, PROFILE_OPTION],
+        check=True,
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert result.stdout == "True\nFalse\n"
+
+
+def test_variable_starts_profiler_on_package_import(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(PROFILE_VARIABLE, "1")
+    importlib.reload(cly)
+    assert profiler.PROFILER is not None
+
+
+def test_report_is_written_at_exit_if_cli_is_not_called(
+    tmp_path: Path,
+) -> None:
+    output = tmp_path / "profile.json"
+    subprocess.run(  # nosec
+        [sys.executable, "-c", SCRIPT],
+        check=True,
+        cwd=PROJECT_ROOT,
+        env={**os.environ, PROFILE_VARIABLE: str(output)},
+    )
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert "cly.config" in {module["name"] for module in report["imports"]}
@@ -0,0 +1,53 @@
+import io
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from cly import config
+from cly.completion import build_completion_table
+from cly.shell import CommandShell
+from cly.testing import run_cli
+
+from ...conftest import CLI_CONFIG
+
+
+def hello(name: str) -> None:
+    """Say hello."""
+    print(f"Hello {name}")
+
+
+def create_cli(cache_dir: Path) -> config.ConfiguredParser:
+    cli = config.ConfiguredParser(
+        CLI_CONFIG, options=config.ParserOptions(cache_dir=cache_dir)
+    )
+    cli.create_command(hello).add_argument("--name", default="World")
+    return cli
+
+
+def test_shell_runs_commands(tmp_path: Path) -> None:
+    lines = "hello --name Alfred\nfly\nhello\nexit\n"
+    with patch.object(sys, "stdin", io.StringIO(lines)):
+        exit_code, stdout, stderr = run_cli(
+            create_cli(tmp_path), ["--cly-shell"]
+        )
+    assert exit_code == 0
+    assert stdout.startswith(
+        "Batcomputer 1.0.0. Type help for the commands, or exit to quit.\n"
+    )
+    assert "Hello Alfred\n" in stdout
+    assert "Hello World\n" in stdout
+    assert "invalid choice: 'fly'" in stderr
+    assert stderr.count(" ms, exit status 0]\n") == 2
+    assert stderr.count(" ms, exit status 2]\n") == 1
+    assert (tmp_path / "history").exists()
+
+
+def test_shell_completes_from_commands_tree(tmp_path: Path) -> None:
+    cli = create_cli(tmp_path)
+    shell = CommandShell(
+        cli.run_arguments, lambda: build_completion_table(cli.parser)
+    )
+    assert shell.completedefault("--", "hello --", 6, 8) == [
+        "--help",
+        "--name",
+    ]
@@ -0,0 +1,102 @@
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from cly import config, loader
+from cly.loader import (
+    LazyCommand,
+    get_static_command,
+    read_static_command,
+)
+from cly.testing import run_cli
+
+from ...conftest import CLI_CONFIG
+
+HEAVY_MODULE = '''
+import not_installed_dependency
+
+
+def report(city, days=7):
+    """
+    Report crimes in a city.
+
+    Parameters
+    ----------
+    city : str
+        City to report crimes in.
+    days : int, optional
+        How many days to report, by default 7
+
+    """
+'''
+
+
+@pytest.fixture(autouse=True)
+def heavy_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "heavy_module.py").write_text(HEAVY_MODULE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    read_static_command.cache_clear()
+
+
+def create_cli(
+    cache_dir: Optional[Path] = None,
+) -> config.ConfiguredParser:
+    cli = config.ConfiguredParser(
+        CLI_CONFIG,
+        options=config.ParserOptions(cache_dir=cache_dir, static_help=True),
+    )
+    report_command = cli.create_command("heavy_module:report")
+    report_command.add_argument(dest="city")
+    report_command.add_argument("-d", "--days", type=int)
+    return cli
+
+
+def get_command(cli: config.ConfiguredParser) -> LazyCommand:
+    command = (cli.commands or {})["report"]
+    assert isinstance(command, LazyCommand)
+    return command
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_help_does_not_import_command(cached: bool, tmp_path: Path) -> None:
+    cli = create_cli(tmp_path / "cache" if cached else None)
+    exit_code, stdout, stderr = run_cli(cli, ["--help"])
+    assert exit_code == 0
+    assert not stderr
+    assert "Report crimes in a city." in stdout
+    exit_code, stdout, stderr = run_cli(cli, ["report", "--help"])
+    assert exit_code == 0
+    assert not stderr
+    assert "City to report crimes in." in stdout
+    assert "How many days to report." in stdout
+    assert not get_command(cli).is_resolved
+
+
+def test_command_is_imported_when_called() -> None:
+    cli = create_cli()
+    with pytest.raises(ModuleNotFoundError):
+        run_cli(cli, ["report", "Gotham"])
+
+
+def test_command_without_source_is_imported(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(loader, "read_static_command", lambda path: None)
+    with pytest.raises(ModuleNotFoundError):
+        create_cli()
+
+
+def test_resolved_command_is_not_read_statically() -> None:
+    cli = config.ConfiguredParser(
+        CLI_CONFIG, options=config.ParserOptions(static_help=True)
+    )
+    cli.create_command(
+        "tests.batcomputer_cli.commands.list_aliases:list_aliases",
+        alias="ls",
+        help_message="List aliases.",
+    )
+    exit_code, stdout, _ = run_cli(cli, ["ls"])
+    assert exit_code == 0
+    assert "Batman" in stdout
+    assert get_static_command(cli, (cli.commands or {})["ls"]) is None
@@ -0,0 +1,61 @@
+from cly import config
+from cly.testing import run_cli
+
+from ...batcomputer_cli.commands.identify import identify
+from ...batcomputer_cli.commands.list_aliases import list_aliases
+from ...conftest import CLI_CONFIG
+
+CAVES = ["arctic", "gotham", "metropolis", "paris", "tokyo"]
+
+
+def create_cli(caves: int = len(CAVES)) -> config.ConfiguredParser:
+    cli = config.ConfiguredParser(
+        CLI_CONFIG, options=config.ParserOptions(lazy_parsers=True)
+    )
+    cli.create_command(identify)
+    cli.create_command(list_aliases)
+    for cave in CAVES[:caves]:
+        for area in ("lab", "garage"):
+            cli.create_command(
+                list_aliases,
+                alias=f"{cave}-{area}",
+                help_message=f"List aliases in {cave}'s {area}.",
+            )
+    return cli
+
+
+def test_mistyped_command_suggests_closest_commands() -> None:
+    exit_code, _, stderr = run_cli(create_cli(), ["idnetify", "joker"])
+    assert exit_code == 2
+    assert stderr.endswith(
+        "error: argument command: invalid choice: 'idnetify' "
+        "(did you mean 'identify'?)\n"
+    )
+    _, _, stderr = run_cli(create_cli(), ["gotham-lap"])
+    assert "(did you mean 'gotham-lab'?)" in stderr
+
+
+def test_unknown_command_does_not_list_many_commands() -> None:
+    _, _, stderr = run_cli(create_cli(), ["batmobile"])
+    assert stderr.endswith(
+        "error: argument command: invalid choice: 'batmobile'\n"
+    )
+
+
+def test_unknown_command_lists_few_commands() -> None:
+    _, _, stderr = run_cli(create_cli(caves=1), ["batmobile"])
+    assert "(choose from 'identify', 'list_aliases', 'arctic-lab'" in stderr
+
+
+def test_suggestions_include_added_commands() -> None:
+    cli = create_cli()
+    run_cli(cli, ["paris-lap"])
+    assert cli.subparser is not None
+    suggestions = cli.subparser.suggestions
+    cli.create_command(list_aliases, alias="rome-lab", help_message="Rome.")
+    _, _, stderr = run_cli(cli, ["rome-lap"])
+    assert "(did you mean 'rome-lab'?)" in stderr
+    assert cli.subparser.suggestions is not suggestions
+    run_cli(cli, ["rome-lap"])
+    assert cli.subparser.suggestions is not None
+    assert len(cli.subparser.suggestions) == 13
@@ -0,0 +1,98 @@
+from typing import List
+
+import pytest
+
+from cly import config
+from cly.testing import run_cli
+
+from ...batcomputer_cli.commands.identify import identify
+from ...batcomputer_cli.commands.list_aliases import list_aliases
+from ...conftest import CLI_CONFIG
+
+DATABASE_CONFIG = {
+    "name": "Database",
+    "description": "Manage the database.",
+    "epilog": "",
+    "version": "1.0.0",
+}
+
+
+def create_cli(
+    command_prefixes: bool = True, fast_parser: bool = False
+) -> config.ConfiguredParser:
+    database = config.ConfiguredParser(
+        DATABASE_CONFIG,
+        options=config.ParserOptions(command_prefixes=command_prefixes),
+    )
+    database.create_command(list_aliases, alias="list")
+    cli = config.ConfiguredParser(
+        CLI_CONFIG,
+        options=config.ParserOptions(
+            lazy_parsers=True,
+            fast_parser=fast_parser,
+            command_prefixes=command_prefixes,
+        ),
+    )
+    cli.create_command(identify).add_argument(
+        dest="aliases", metavar="aliases", nargs="+"
+    )
+    cli.create_command(identify, alias="id").add_argument(
+        dest="aliases", metavar="aliases", nargs="+"
+    )
+    cli.create_command(list_aliases)
+    for index in range(12):
+        cli.create_command(list_aliases, alias=f"lab-{index:02}")
+    cli.create_group(database, "database")
+    return cli
+
+
+@pytest.mark.parametrize("fast_parser", [True, False])
+@pytest.mark.parametrize(
+    "arguments, expected",
+    [
+        (["ide", "joker"], ["identify", "joker"]),
+        (["id", "joker"], ["id", "joker"]),
+        (["li"], ["list_aliases"]),
+        (["data", "li"], ["database", "list"]),
+    ],
+)
+def test_prefix_calls_command(
+    arguments: List[str], expected: List[str], fast_parser: bool
+) -> None:
+    assert run_cli(create_cli(fast_parser=fast_parser), arguments) == run_cli(
+        create_cli(), expected
+    )
+
+
+def test_ambiguous_prefix_lists_candidates() -> None:
+    exit_code, _, stderr = run_cli(create_cli(), ["i", "joker"])
+    assert exit_code == 2
+    assert stderr.endswith(
+        "error: argument command: ambiguous choice: 'i' could match 'id', "
+        "'identify'\n"
+    )
+    _, _, stderr = run_cli(create_cli(), ["lab"])
+    assert (
+        "could match 'lab-00', 'lab-01', 'lab-02', 'lab-03', 'lab-04', "
+        "'lab-05', 'lab-06', 'lab-07', 'lab-08', 'lab-09' and 2 more\n"
+    ) in stderr
+
+
+def test_unknown_prefix_is_invalid_choice() -> None:
+    _, _, stderr = run_cli(create_cli(), ["batmobile"])
+    assert "invalid choice: 'batmobile'" in stderr
+
+
+def test_prefixes_are_disabled_by_default() -> None:
+    _, _, stderr = run_cli(create_cli(False), ["ide", "joker"])
+    assert "invalid choice: 'ide'" in stderr
+
+
+def test_prefixes_include_added_commands() -> None:
+    cli = create_cli()
+    run_cli(cli, ["li"])
+    cli.create_command(list_aliases, alias="lineup")
+    _, _, stderr = run_cli(cli, ["li"])
+    assert "could match 'lineup', 'list_aliases'" in stderr
+    assert cli.subparser is not None and cli.subparser.prefixes is not None
+    assert len(cli.subparser.prefixes) == 17
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+import pytest
+
+from cly.aio import gather_limited, run_blocking, run_coroutine
+
+
+async def add(first: int, second: int) -> int:
+    await asyncio.sleep(0)
+    return first + second
+
+
+def test_run_coroutine() -> None:
+    assert run_coroutine(add(1, 2)) == 3
+    with pytest.raises(RuntimeError):
+        asyncio.get_running_loop()
+
+
+def test_run_coroutine_cancels_pending_tasks() -> None:
+    cancelled: List[bool] = []
+
+    async def background() -> None:
+        try:
+            await asyncio.sleep(10)
+        finally:
+            cancelled.append(True)
+
+    async def command() -> None:
+        asyncio.ensure_future(background())
+        await asyncio.sleep(0)
+
+    run_coroutine(command())
+    assert cancelled == [True]
+
+
+def test_run_coroutine_with_loop_factory() -> None:
+    loops: List[asyncio.AbstractEventLoop] = []
+
+    def new_event_loop() -> asyncio.AbstractEventLoop:
+        loops.append(asyncio.new_event_loop())
+        return loops[-1]
+
+    async def get_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_event_loop()
+
+    assert run_coroutine(get_loop(), new_event_loop) is loops[0]
+    assert loops[0].is_closed()
+
+
+def interrupt() -> None:
+    raise KeyboardInterrupt
+
+
+def test_run_coroutine_cancels_interrupted_coroutine(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    cleaned: List[bool] = []
+
+    async def command() -> None:
+        asyncio.get_event_loop().call_soon(interrupt)
+        try:
+            await asyncio.sleep(10)
+        finally:
+            cleaned.append(True)
+
+    with pytest.raises(SystemExit) as sys_exit:
+        run_coroutine(command())
+    assert sys_exit.value.code == 130
+    assert cleaned == [True]
+    assert capsys.readouterr().err == "KeyboardInterrupt\n"
+
+
+def test_run_coroutine_with_interrupt_raised_by_coroutine() -> None:
+    async def command() -> None:
+        interrupt()
+
+    with pytest.raises(SystemExit) as sys_exit:
+        run_coroutine(command())
+    assert sys_exit.value.code == 130
+
+
+@pytest.mark.parametrize("limit", [None, 1, 2])
+def test_gather_limited(limit: int) -> None:
+    running: List[int] = [0]
+    peak: List[int] = [0]
+
+    async def double(number: int) -> int:
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await asyncio.sleep(0.01 * (3 - number))
+        running[0] -= 1
+        return number * 2
+
+    results = run_coroutine(
+        gather_limited((double(number) for number in range(3)), limit)
+    )
+    assert results == [0, 2, 4]
+    assert peak[0] == (limit or 3)
+
+
+def test_gather_limited_with_invalid_limit() -> None:
+    with pytest.raises(ValueError, match="Invalid limit 0"):
+        run_coroutine(gather_limited([], 0))
+
+
+def test_run_blocking() -> None:
+    def blocking(seconds: float, name: str = "") -> str:
+        time.sleep(seconds)
+        return (
+            f"{name} {threading.current_thread() is threading.main_thread()}"
+        )
+
+    async def command() -> List[str]:
+        return await gather_limited(
+            [
+                run_blocking(blocking, 0.01, name=str(index))
+                for index in range(4)
+            ]
+        )
+
+    assert run_coroutine(command()) == [f"{index} False" for index in range(4)]
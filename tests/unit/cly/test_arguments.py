@@ -0,0 +1,46 @@
+from typing import List, Optional
+
+import pytest
+
+from cly.arguments import pop_option
+
+OPTION = "--cly-option"
+
+
+@pytest.mark.parametrize(
+    "arguments,value,remaining",
+    [
+        ([], None, []),
+        (["command", "-h"], None, ["command", "-h"]),
+        ([OPTION, "command"], "", ["command"]),
+        (["command", f"{OPTION}=value"], "value", ["command"]),
+        ([f"{OPTION}=", "command"], "", ["command"]),
+        (["command", "--", OPTION], None, ["command", "--", OPTION]),
+        ([OPTION, "--", OPTION], "", ["--", OPTION]),
+        ([f"{OPTION}-other"], None, [f"{OPTION}-other"]),
+    ],
+)
+def test_pop_option(
+    arguments: List[str], value: Optional[str], remaining: List[str]
+) -> None:
+    assert pop_option(arguments, OPTION) == (value, remaining)
+
+
+@pytest.mark.parametrize(
+    "arguments,value,remaining",
+    [
+        ([OPTION, "value", "command"], "value", ["command"]),
+        ([OPTION, "-"], "-", []),
+        ([OPTION], "", []),
+        ([OPTION, "--other"], "", ["--other"]),
+        ([OPTION, "--", "value"], "", ["--", "value"]),
+        ([f"{OPTION}=value", "command"], "value", ["command"]),
+    ],
+)
+def test_pop_option_taking_value(
+    arguments: List[str], value: Optional[str], remaining: List[str]
+) -> None:
+    assert pop_option(arguments, OPTION, takes_value=True) == (
+        value,
+        remaining,
+    )
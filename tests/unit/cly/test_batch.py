@@ -0,0 +1,139 @@
+import io
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from cly.batch import (
+    ThreadLocalStream,
+    parse_batch_line,
+    run_batch,
+    run_batch_line,
+)
+
+BATCH = """
+# Identify villains
+identify joker
+["identify", "Two Face"]
+
+fail 'with quotes'
+identify "unclosed
+"""
+
+
+def get_worker() -> str:
+    return f"{os.getpid()}:{threading.get_ident()}"
+
+
+def runner(arguments: List[str]) -> int:
+    if arguments[0] == "fail":
+        sys.stderr.write(f"failed {arguments[1:]}\n")
+        return 3
+    print(f"{get_worker()} {arguments[1:]}")
+    return 0
+
+
+@pytest.fixture(name="batch_file")
+def fixture_batch_file(tmp_path: Path) -> str:
+    path = tmp_path / "batch.txt"
+    path.write_text(BATCH, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "line, arguments",
+    [
+        ("", None),
+        ("  # comment", None),
+        ("identify --name 'Alfred P.'", ["identify", "--name", "Alfred P."]),
+        (
+            '["identify", "--name", "Alfred P."]\n',
+            ["identify", "--name", "Alfred P."],
+        ),
+    ],
+)
+def test_parse_batch_line(line: str, arguments: Optional[List[str]]) -> None:
+    assert parse_batch_line(line) == arguments
+
+
+@pytest.mark.parametrize("line", ['["identify", 1]', '["identify"', "'"])
+def test_parse_invalid_batch_line(line: str) -> None:
+    with pytest.raises(ValueError):
+        parse_batch_line(line)
+
+
+def test_thread_local_stream() -> None:
+    stream = io.StringIO()
+    proxy = ThreadLocalStream(stream)
+    proxy.write("main ")
+    with proxy.capture() as captured:
+        thread = threading.Thread(target=lambda: proxy.write("thread "))
+        thread.start()
+        thread.join()
+        proxy.write("captured")
+        proxy.flush()
+        assert proxy.getvalue() == "captured"
+    assert proxy.getvalue() == "main thread "
+    assert captured.getvalue() == "captured"
+
+
+def test_run_batch(
+    batch_file: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert run_batch(runner, batch_file) == 1
+    stdout, stderr = capsys.readouterr()
+    worker = get_worker()
+    assert stdout == f"{worker} ['joker']\n{worker} ['Two Face']\n"
+    assert stderr == (
+        "failed ['with quotes']\n"
+        "Invalid batch line 7: No closing quotation\n"
+    )
+    assert not isinstance(sys.stdout, ThreadLocalStream)
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+def test_run_batch_in_pool(
+    pool: str, batch_file: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    stdout = io.StringIO()
+    with patch.object(sys, "stdout", stdout):
+        assert run_batch(runner, batch_file, 2, pool, "json") == 1
+    results = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert [result["line"] for result in results] == [3, 4, 6, 7]
+    assert [result["status"] for result in results] == [0, 0, 3, 2]
+    assert results[0]["arguments"] == ["identify", "joker"]
+    assert results[1]["stdout"].endswith(" ['Two Face']\n")
+    assert get_worker() not in results[1]["stdout"]
+    assert results[2]["stderr"] == "failed ['with quotes']\n"
+    assert results[3]["arguments"] == []
+
+
+def test_run_batch_from_stdin(capsys: pytest.CaptureFixture[str]) -> None:
+    with patch.object(sys, "stdin", io.StringIO("identify bane\n")):
+        assert run_batch(runner, "-") == 0
+    assert capsys.readouterr().out.endswith(" ['bane']\n")
+
+
+@pytest.mark.parametrize(
+    "jobs, pool, output_format, message",
+    [
+        (0, "thread", "text", "Invalid batch jobs 0"),
+        (1, "fiber", "text", "Invalid batch pool 'fiber'"),
+        (1, "thread", "xml", "Invalid batch format 'xml'"),
+    ],
+)
+def test_run_batch_with_invalid_options(
+    batch_file: str, jobs: int, pool: str, output_format: str, message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        run_batch(runner, batch_file, jobs, pool, output_format)
+
+
+def test_run_batch_line_outside_batch() -> None:
+    with pytest.raises(RuntimeError, match="only be run by run_batch"):
+        run_batch_line((1, "identify joker"))
@@ -0,0 +1,87 @@
+import inspect
+from typing import Any, Dict, List
+
+from cly.binding import BindingPlan, compile_binding
+from cly.config import decorate_kwargs
+
+NAMESPACE = {"commands": "cmd", "first": 1, "second": 2, "rest": [3, 4]}
+
+
+def keywords_command(first: int, second: int = 0) -> List[int]:
+    local = [first, second]
+    return local
+
+
+def keyword_only_command(first: int, *, second: int = 0) -> List[int]:
+    return [first, second]
+
+
+def var_positional_command(first: int, *rest: int) -> List[int]:
+    return [first, *rest]
+
+
+def var_keyword_command(first: int, **kwargs: Any) -> Dict[str, Any]:
+    return {"first": first, **kwargs}
+
+
+def test_keywords_command() -> None:
+    plan = compile_binding(keywords_command)
+    assert plan.bind(NAMESPACE) == ([], {"first": 1, "second": 2})
+    assert plan.call(keywords_command, {"first": 1}) == [1, 0]
+
+
+def test_local_variables_are_not_parameters() -> None:
+    assert decorate_kwargs(keywords_command)(first=1, local=5) == [1, 0]
+
+
+def test_keyword_only_command() -> None:
+    assert decorate_kwargs(keyword_only_command)(**NAMESPACE) == [1, 2]
+
+
+def test_var_positional_command() -> None:
+    plan = compile_binding(var_positional_command)
+    assert plan.bind(NAMESPACE) == ([1, 3, 4], {})
+    assert plan.select(NAMESPACE) == {"first": 1, "rest": [3, 4]}
+    assert plan.call(var_positional_command, NAMESPACE) == [1, 3, 4]
+
+
+def test_var_positional_command_without_positional_argument() -> None:
+    plan = compile_binding(var_positional_command)
+    assert plan.bind({"rest": [3, 4]}) == ([], {})
+
+
+def test_var_keyword_command() -> None:
+    assert decorate_kwargs(var_keyword_command)(**NAMESPACE) == {
+        "first": 1,
+        "second": 2,
+        "rest": [3, 4],
+    }
+
+
+def test_positional_only_parameters() -> None:
+    parameter = inspect.Parameter
+    plan = BindingPlan(
+        inspect.Signature(
+            [
+                parameter("first", parameter.POSITIONAL_ONLY),
+                parameter("second", parameter.POSITIONAL_OR_KEYWORD),
+            ]
+        )
+    )
+    assert plan.bind(NAMESPACE) == ([1], {"second": 2})
+    assert plan.select(NAMESPACE) == {"first": 1, "second": 2}
+
+
+def test_function_without_signature() -> None:
+    plan = compile_binding(next)
+    assert plan.var_keyword
+    assert plan.bind(NAMESPACE) == (
+        [],
+        {"first": 1, "second": 2, "rest": [3, 4]},
+    )
+
+
+def test_binding_is_compiled_once() -> None:
+    assert compile_binding(keywords_command) is compile_binding(
+        keywords_command
+    )
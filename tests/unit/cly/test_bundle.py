@@ -0,0 +1,95 @@
+import subprocess  # nosec
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from cly.bundle import (
+    compile_folder,
+    get_build_id,
+    get_command_paths,
+    get_environment,
+    parse_main,
+    write_shim,
+)
+
+TREE: Dict[str, Any] = {
+    "options": ["-h"],
+    "commands": {
+        "id": {"commands": {}},
+        "db": {"commands": {"migrate": {"commands": {"up": {}}}}},
+    },
+}
+SHIMMED_CLI = """
+import os
+
+
+class Parser:
+    def set_prog(self, prog):
+        self.prog = prog
+
+    def __call__(self):
+        print(self.prog, os.environ["CLY_CACHE_DIR"])
+
+
+CLI = Parser()
+"""
+
+
+def test_parse_main() -> None:
+    assert parse_main("batcomputer.__main__:CLI") == (
+        "batcomputer.__main__",
+        "CLI",
+    )
+
+
+@pytest.mark.parametrize("main", ["batcomputer", ":CLI", "batcomputer:C-L-I"])
+def test_parse_main_with_invalid_main(main: str) -> None:
+    with pytest.raises(ValueError):
+        parse_main(main)
+
+
+def test_get_build_id(tmp_path: Path) -> None:
+    (tmp_path / "module.py").write_text("CLI = 1\n", encoding="utf-8")
+    build = get_build_id(tmp_path, "batcomputer")
+    assert build.startswith("batcomputer-")
+    assert build == get_build_id(tmp_path, "batcomputer")
+    (tmp_path / "module.py").write_text("CLI = 2\n", encoding="utf-8")
+    assert build != get_build_id(tmp_path, "batcomputer")
+
+
+def test_get_command_paths() -> None:
+    assert list(get_command_paths(TREE)) == [
+        ["id"],
+        ["db"],
+        ["db", "migrate"],
+        ["db", "migrate", "up"],
+    ]
+
+
+def test_get_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CLY_CACHE_DIR", "/tmp/cave")
+    monkeypatch.setenv("COLUMNS", "120")
+    environment = get_environment(CLY_CACHE_HELP="1")
+    assert "CLY_CACHE_DIR" not in environment
+    assert "COLUMNS" not in environment
+    assert environment["CLY_CACHE_HELP"] == "1"
+
+
+def test_shim_runs_cli_from_bytecode(tmp_path: Path) -> None:
+    (tmp_path / "batcomputer.py").write_text(SHIMMED_CLI, encoding="utf-8")
+    write_shim(tmp_path, "batcomputer:CLI", "batcomputer-1", [])
+    compile_folder(tmp_path)
+    (tmp_path / "batcomputer.py").unlink()
+    result = subprocess.run(  # nosec
+        [sys.executable, str(tmp_path / "__main__.pyc")],
+        capture_output=True,
+        check=True,
+        cwd=tmp_path,
+        env={"XDG_CACHE_HOME": str(tmp_path)},
+        text=True,
+    )
+    assert result.stdout == (
+        f"__main__.pyc {tmp_path / 'cly' / 'batcomputer-1'}\n"
+    )
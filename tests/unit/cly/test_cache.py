@@ -0,0 +1,213 @@
+import argparse
+import functools
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from cly.cache import (
+    MANIFEST_FORMAT,
+    HelpCache,
+    Manifest,
+    describe,
+    get_default_cache_dir,
+    get_default_cache_help,
+    get_modification_time,
+    read_json,
+    write_json,
+)
+from cly.loader import DeferredParser
+
+INVALID_CONTENTS = ["", "not json", "[1, 2, 3]"]
+
+
+def test_read_json_without_file(tmp_path: Path) -> None:
+    assert read_json(str(tmp_path / "missing.json")) == {}
+
+
+@pytest.mark.parametrize("content", INVALID_CONTENTS)
+def test_read_json_with_invalid_content(content: str, tmp_path: Path) -> None:
+    path = tmp_path / "invalid.json"
+    path.write_text(content, encoding="utf-8")
+    assert read_json(str(path)) == {}
+
+
+def test_write_json(tmp_path: Path) -> None:
+    path = tmp_path / "folder" / "file.json"
+    write_json(str(path), {"key": ["value"]})
+    assert read_json(str(path)) == {"key": ["value"]}
+    assert os.listdir(path.parent) == ["file.json"]
+
+
+def test_write_json_ignores_errors(tmp_path: Path) -> None:
+    file = tmp_path / "file"
+    file.write_text("", encoding="utf-8")
+    write_json(str(file / "file.json"), {"key": "value"})
+    assert file.read_text(encoding="utf-8") == ""
+
+
+def test_get_modification_time(tmp_path: Path) -> None:
+    file = tmp_path / "file"
+    file.write_text("", encoding="utf-8")
+    assert get_modification_time(file.as_posix()) == file.stat().st_mtime_ns
+    assert get_modification_time((tmp_path / "missing").as_posix()) == -1
+
+
+def test_get_default_cache_dir(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("CLY_CACHE_DIR", raising=False)
+    assert get_default_cache_dir("Batcomputer") is None
+    monkeypatch.setenv("CLY_CACHE_DIR", "/tmp/cave")
+    assert get_default_cache_dir("Bat Computer!") == os.path.join(
+        "/tmp/cave", "bat-computer"
+    )
+
+
+@pytest.mark.parametrize("value, enabled", [("1", True), ("0", False)])
+def test_get_default_cache_help(
+    value: str, enabled: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("CLY_CACHE_HELP", value)
+    assert get_default_cache_help() == enabled
+
+
+def test_manifest_round_trip(tmp_path: Path) -> None:
+    source = tmp_path / "source.py"
+    source.write_text("", encoding="utf-8")
+    manifest = Manifest(str(tmp_path / "manifest.json"), "1.0.0")
+    manifest.set_entry("cmd", "module:cmd", source.as_posix(), summary="Hi")
+    manifest.update_entry("cmd", params={"param": "Param."})
+    manifest.save()
+    assert not manifest.changed
+    entry = Manifest(str(tmp_path / "manifest.json"), "1.0.0").get_entry(
+        "cmd", "module:cmd"
+    )
+    assert entry is not None
+    assert entry["summary"] == "Hi"
+    assert entry["params"] == {"param": "Param."}
+
+
+def test_manifest_is_not_saved_without_changes(tmp_path: Path) -> None:
+    Manifest(str(tmp_path / "manifest.json"), "1.0.0").save()
+    assert not (tmp_path / "manifest.json").exists()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        {"format": MANIFEST_FORMAT, "version": "0.0.1"},
+        {"format": MANIFEST_FORMAT + 1, "version": "1.0.0"},
+    ],
+)
+def test_manifest_is_discarded_for_other_versions(
+    content: dict,  # type: ignore[type-arg]
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "manifest.json"
+    write_json(
+        str(path), {**content, "commands": {"cmd": {"target": "m:cmd"}}}
+    )
+    assert not Manifest(str(path), "1.0.0").commands
+
+
+def test_manifest_entry_is_invalid_when_source_changes(tmp_path: Path) -> None:
+    source = tmp_path / "source.py"
+    source.write_text("", encoding="utf-8")
+    manifest = Manifest(str(tmp_path / "manifest.json"), "1.0.0")
+    manifest.set_entry("cmd", "module:cmd", source.as_posix())
+    assert manifest.get_entry("cmd", "module:cmd") is not None
+    assert manifest.get_entry("cmd", "module:other") is None
+    assert manifest.get_entry("other", "module:cmd") is None
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert manifest.get_entry("cmd", "module:cmd") is None
+
+
+# pylint: disable=unused-argument
+def function_to_describe(number: int, key: int) -> None:
+    """Just for tests."""
+
+
+class ObjectToDescribe:  # pylint: disable=too-few-public-methods
+    def __repr__(self) -> str:
+        return "ObjectToDescribe()"
+
+
+@pytest.mark.parametrize(
+    "value,description",
+    [
+        (None, None),
+        ("text", "text"),
+        ((1, 2.5, True), [1, 2.5, True]),
+        ({"key": [None]}, [["key", [None]]]),
+        (function_to_describe, f"{__name__}.function_to_describe"),
+        (
+            functools.partial(function_to_describe, 1, key=2),
+            [f"{__name__}.function_to_describe", [1], [["key", 2]]],
+        ),
+        (ObjectToDescribe(), "ObjectToDescribe()"),
+    ],
+)
+def test_describe(value: Any, description: Any) -> None:
+    assert describe(value) == description
+
+
+def test_describe_parsers() -> None:
+    parser = argparse.ArgumentParser(prog="prog", description="Description.")
+    parser.add_argument("-f", "--flag", action="store_true", help="Flag.")
+    subparser = parser.add_subparsers(dest="commands")
+    subparser.add_parser("cmd", help="Command.")
+    description = describe(parser)
+    assert description[:3] == ["prog", None, "Description."]
+    assert description[5][0][2] == [[["cmd", "Command."]]]
+    assert [
+        "argparse._StoreTrueAction",
+        ["-f", "--flag"],
+        "flag",
+        0,
+        True,
+        False,
+        None,
+        None,
+        False,
+        "Flag.",
+        None,
+    ] in description[5][1][2]
+    deferred = DeferredParser(argparse.ArgumentParser, {}, print)
+    deferred.add_argument_group("Group").add_argument("value")
+    assert describe(deferred) == [
+        [],
+        "builtins.print",
+        [
+            [
+                "add_argument_group",
+                ["Group"],
+                [],
+                [["add_argument", ["value"], [], []]],
+            ]
+        ],
+    ]
+
+
+def test_help_cache_round_trip(tmp_path: Path) -> None:
+    help_cache = HelpCache(str(tmp_path / "help.json"), "1.0.0")
+    assert help_cache.get("key") is None
+    help_cache.save()
+    assert not (tmp_path / "help.json").exists()
+    help_cache.set("key", "Help message.")
+    help_cache.save()
+    assert not help_cache.changed
+    assert HelpCache(str(tmp_path / "help.json"), "1.0.0").get("key") == (
+        "Help message."
+    )
+    assert HelpCache(str(tmp_path / "help.json"), "2.0.0").get("key") is None
+
+
+def test_help_cache_key_depends_on_terminal_width() -> None:
+    with patch.dict(os.environ, {"COLUMNS": "80"}):
+        key = HelpCache.get_key("cmd")
+        assert key == HelpCache.get_key("cmd")
+        assert key != HelpCache.get_key("other")
+    with patch.dict(os.environ, {"COLUMNS": "120"}):
+        assert key != HelpCache.get_key("cmd")
@@ -0,0 +1,87 @@
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from cly.choices import Choices
+
+REGIONS = ["ar", "br", "cl", "co", "mx", "pe", "uy"]
+
+
+class Loader:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> Iterator[str]:
+        self.calls += 1
+        yield from REGIONS
+
+
+def test_choices_from_values() -> None:
+    choices = Choices(REGIONS)
+    assert "br" in choices
+    assert "us" not in choices
+    assert list(choices) == REGIONS
+    assert len(choices) == len(REGIONS)
+
+
+def test_choices_from_function_are_loaded_once() -> None:
+    loader = Loader()
+    choices = Choices(loader)
+    assert loader.calls == 0
+    assert "br" in choices
+    assert "us" not in choices
+    assert len(choices) == len(REGIONS)
+    assert loader.calls == 1
+
+
+def test_summary_loads_function_values_once() -> None:
+    loader = Loader()
+    choices = Choices(loader)
+    assert choices.summarize() == "ar, br, cl, co, mx, ..."
+    assert choices.summarize(repr, ",") == "'ar','br','cl','co','mx',..."
+    assert repr(choices) == "Choices('ar', 'br', 'cl', 'co', 'mx', ...)"
+    assert len(choices) == len(REGIONS)
+    assert loader.calls == 1
+
+
+def test_summary_does_not_load_file_values(tmp_path: Path) -> None:
+    path = tmp_path / "regions.txt"
+    path.write_text("\n".join(REGIONS), encoding="utf-8")
+    choices = Choices.from_file(path)
+    assert choices.summarize() == "ar, br, cl, co, mx, ..."
+    assert choices.to_completion() == {"file": str(path)}
+    assert choices._values is None
+    assert "br" in choices
+    assert choices._values is not None
+
+
+@pytest.mark.parametrize(
+    "values, listed, summary",
+    [
+        (REGIONS[:5], 5, "ar, br, cl, co, mx"),
+        (REGIONS[:6], 5, "ar, br, cl, co, mx, ..."),
+        (REGIONS, 1, "ar, ..."),
+        ([], 5, ""),
+    ],
+)
+def test_summarize(values: List[str], listed: int, summary: str) -> None:
+    assert Choices(values, listed).summarize() == summary
+
+
+def test_choices_from_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "regions.txt").write_text(
+        "ar\n  br  \n\ncl\n", encoding="utf-8"
+    )
+    monkeypatch.chdir(tmp_path)
+    choices = Choices.from_file("regions.txt", listed=2)
+    assert choices.path == str(tmp_path / "regions.txt")
+    assert choices.summarize() == "ar, br, ..."
+    assert list(choices) == ["ar", "br", "cl"]
+    assert choices.to_completion() == {"file": str(tmp_path / "regions.txt")}
+
+
+def test_to_completion() -> None:
+    assert Choices(range(3)).to_completion() == ["0", "1", "2"]
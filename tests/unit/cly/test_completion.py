@@ -0,0 +1,134 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from cly.completion import (
+    COMPLETION_FORMAT,
+    get_candidates,
+    get_completion_script,
+    iter_values,
+    main,
+    quote,
+)
+
+TABLE: Dict[str, Any] = {
+    "options": ["-h", "--help", "-c", "--color"],
+    "values": {"-c": ["red", "green"], "--color": ["red", "green"]},
+    "commands": {
+        "identify": {
+            "options": ["-h", "--help"],
+            "values": {},
+            "commands": {},
+            "positionals": [["joker", "penguin"], []],
+        },
+        "id": {"options": [], "values": {}, "commands": {}, "positionals": []},
+    },
+    "positionals": [],
+}
+
+
+@pytest.mark.parametrize(
+    "words, candidates",
+    [
+        ([], ["identify", "id"]),
+        (["i"], ["identify", "id"]),
+        (["ide"], ["identify"]),
+        (["-"], ["-h", "--help", "-c", "--color"]),
+        (["--c"], ["--color"]),
+        (["--color", ""], ["red", "green"]),
+        (["-c", "g"], ["green"]),
+        (["--color=r"], ["--color=red"]),
+        (["--help="], []),
+        (["--color", "red", "id"], ["identify", "id"]),
+        (["identify", ""], ["joker", "penguin"]),
+        (["identify", "-"], ["-h", "--help"]),
+        (["identify", "joker", ""], []),
+        (["identify", "joker", "robin", ""], []),
+        (["--help", "identify", "p"], ["penguin"]),
+    ],
+)
+def test_get_candidates(words: List[str], candidates: List[str]) -> None:
+    assert get_candidates(TABLE, words) == candidates
+
+
+def test_iter_values_reads_file(tmp_path: Path) -> None:
+    (tmp_path / "villains.txt").write_text(
+        "joker\n\n  penguin \n", encoding="utf-8"
+    )
+    values = {"file": str(tmp_path / "villains.txt")}
+    assert list(iter_values(values)) == ["joker", "penguin"]
+    assert list(iter_values(["robin"])) == ["robin"]
+    assert list(iter_values({"file": str(tmp_path / "missing.txt")})) == []
+
+
+@pytest.mark.parametrize(
+    "words, candidates",
+    [
+        (["--villain", "p"], ["penguin"]),
+        (["--villain=j"], ["--villain=joker"]),
+        ([""], ["identify", "riddler"]),
+        (["r"], ["riddler"]),
+    ],
+)
+def test_get_candidates_from_file(
+    tmp_path: Path, words: List[str], candidates: List[str]
+) -> None:
+    (tmp_path / "villains.txt").write_text(
+        "joker\npenguin\n", encoding="utf-8"
+    )
+    (tmp_path / "riddles.txt").write_text("riddler\n", encoding="utf-8")
+    table = {
+        "options": ["--villain"],
+        "values": {"--villain": {"file": str(tmp_path / "villains.txt")}},
+        "commands": {"identify": TABLE["commands"]["identify"]},
+        "positionals": [{"file": str(tmp_path / "riddles.txt")}],
+    }
+    assert get_candidates(table, words) == candidates
+
+
+@pytest.mark.parametrize("shell", ["bash", "zsh", "fish"])
+def test_get_completion_script(shell: str) -> None:
+    script = get_completion_script(shell, "bat-cli.py", "/tmp/table.json")
+    assert "_cly_complete_bat_cli_py" in script
+    assert "'bat-cli.py'" in script
+    assert "completion.py' '/tmp/table.json'" in script
+
+
+def test_get_completion_script_with_invalid_shell() -> None:
+    with pytest.raises(ValueError, match="Invalid shell 'csh'"):
+        get_completion_script("csh", "batcomputer", "table.json")
+
+
+def test_quote() -> None:
+    assert quote("Alfred's") == "'Alfred'\\''s'"
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "completion.json"
+    path.write_text(
+        json.dumps({"format": COMPLETION_FORMAT, "tree": TABLE}),
+        encoding="utf-8",
+    )
+    assert main([str(path), "2", "batcomputer", "identify", "j"]) == 0
+    assert capsys.readouterr().out == "joker\n"
+    assert main([str(path), "1", "batcomputer"]) == 0
+    assert capsys.readouterr().out == "identify\nid\n"
+
+
+@pytest.mark.parametrize(
+    "content", [None, "{", json.dumps({"format": 0, "tree": TABLE})]
+)
+def test_main_with_invalid_table(tmp_path: Path, content: Any) -> None:
+    path = tmp_path / "completion.json"
+    if content is not None:
+        path.write_text(content, encoding="utf-8")
+    assert main([str(path), "1", "batcomputer", ""]) == 1
+
+
+@pytest.mark.parametrize(
+    "arguments", [[], ["table.json"], ["table.json", "x"]]
+)
+def test_main_with_invalid_arguments(arguments: List[str]) -> None:
+    assert main(arguments) == 1
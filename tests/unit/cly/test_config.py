@@ -1,3 +1,4 @@
+import argparse
 import sys
 from collections import namedtuple
 from contextlib import nullcontext
@@ -11,6 +12,7 @@ from cly.config import (
     MAJOR_VERSION,
     MINOR_VERSION,
     check_python_minimum_version,
+    set_params_help,
 )
 
 PARAMETER = [True, False]
@@ -63,3 +65,15 @@ def test_check_python_minimum_version_with_invalid_version(
     )
     assert sys_exit.type == SystemExit
     assert sys_exit.value.code == 1
+
+
+def test_set_params_help() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--first")
+    parser.add_argument("--second", help="Second help.")
+    parser.add_argument("--third", dest="first")
+    params_help = {"first": "First help.", "second": "Docstring help."}
+    set_params_help(parser, params_help)
+    helps = [action.help for action in parser._actions[1:]]
+    assert helps == ["First help.", "Second help.", None]
+    assert params_help == {"first": "First help.", "second": "Docstring help."}
@@ -0,0 +1,169 @@
+import json
+import os
+import socket
+import sys
+import threading
+import types
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from cly.daemon import (
+    DaemonServer,
+    get_sources_key,
+    main,
+    receive_all,
+    run_client,
+)
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Needs UNIX sockets"
+)
+
+
+def handle() -> int:
+    os.write(1, f"{sys.argv} {os.getcwd()}\n".encode("utf-8"))
+    os.write(2, os.environ.get("BATMAN", "").encode("utf-8"))
+    return 3
+
+
+def start_server(
+    server: DaemonServer,
+) -> Tuple[threading.Thread, List[bool]]:
+    results: List[bool] = []
+    thread = threading.Thread(target=lambda: results.append(server.serve()))
+    thread.start()
+    while not Path(server.path).is_socket():
+        thread.join(0.01)
+    return thread, results
+
+
+@pytest.fixture(name="pipes")
+def fixture_pipes() -> Iterator[List[int]]:
+    fds: List[int] = []
+    for _ in range(3):
+        fds.extend(os.pipe())
+    yield fds
+    for fd in fds:
+        os.close(fd)
+
+
+def read(fd: int) -> str:
+    return os.read(fd, 4096).decode("utf-8")
+
+
+def test_server_runs_requests_with_client_state(
+    tmp_path: Path, pipes: List[int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    server = DaemonServer(str(tmp_path / "daemon.sock"), handle, 0.5)
+    thread, results = start_server(server)
+    monkeypatch.setenv("BATMAN", "Bruce")
+    monkeypatch.chdir(tmp_path)
+    argv, cwd = sys.argv, os.getcwd()
+    stdin, stdout, stderr = pipes[0], pipes[3], pipes[5]
+    assert run_client(server.path, ["script", "ls"], (stdin, stdout, stderr))
+    assert read(pipes[2]) == f"['script', 'ls'] {tmp_path}\n"
+    assert read(pipes[4]) == "Bruce"
+    monkeypatch.setenv("BATMAN", "Alfred")
+    assert run_client(server.path, ["script"], (stdin, stdout, stderr)) == 3
+    assert read(pipes[4]) == "Alfred"
+    thread.join()
+    assert results == [False]
+    assert not os.path.exists(server.path)
+    assert (sys.argv, os.getcwd()) == (argv, cwd)
+
+
+def test_server_restarts_when_sources_change(
+    tmp_path: Path, pipes: List[int]
+) -> None:
+    server = DaemonServer(str(tmp_path / "daemon.sock"), handle, 5)
+    server.sources = {str(tmp_path / "removed.py"): 0.0}
+    thread, results = start_server(server)
+    assert run_client(server.path, ["script"], pipes[:3]) is None
+    thread.join()
+    assert results == [True]
+
+
+def test_server_without_standard_streams(tmp_path: Path) -> None:
+    (tmp_path / "daemon.sock").write_text("stale", encoding="utf-8")
+    server = DaemonServer(str(tmp_path / "daemon.sock"), handle, 0.5)
+    thread, _ = start_server(server)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(server.path)
+        connection.sendall(json.dumps({"argv": ["script"]}).encode("utf-8"))
+        connection.shutdown(socket.SHUT_WR)
+        assert json.loads(receive_all(connection)) == {"status": 1}
+    thread.join()
+
+
+def test_sources_changed(tmp_path: Path) -> None:
+    path = tmp_path / "module.py"
+    path.write_text("", encoding="utf-8")
+    server = DaemonServer(str(tmp_path / "daemon.sock"), handle)
+    assert __file__ in server.sources
+    server.sources = {str(path): path.stat().st_mtime}
+    assert not server.sources_changed()
+    os.utime(path, (0, 0))
+    assert server.sources_changed()
+
+
+def test_get_sources_key_skips_missing_files(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = types.ModuleType("missing_module")
+    module.__file__ = "/missing/module.py"
+    monkeypatch.setitem(sys.modules, "missing_module", module)
+    assert module.__file__ not in get_sources_key()
+
+
+def serve_once(path: str, reply: bytes) -> threading.Thread:
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+
+    def accept() -> None:
+        connection, _ = server.accept()
+        with connection, server:
+            receive_all(connection)
+            connection.sendall(reply)
+
+    thread = threading.Thread(target=accept)
+    thread.start()
+    return thread
+
+
+@pytest.mark.parametrize("reply, status", [(b"{", 1), (b"{}", None)])
+def test_run_client_with_invalid_reply(
+    tmp_path: Path, pipes: List[int], reply: bytes, status: Any
+) -> None:
+    path = str(tmp_path / "daemon.sock")
+    thread = serve_once(path, reply)
+    assert run_client(path, ["script"], pipes[:3]) == status
+    thread.join()
+
+
+def test_run_client_without_server(tmp_path: Path) -> None:
+    assert run_client(str(tmp_path / "daemon.sock"), ["script"]) is None
+
+
+def test_main_without_arguments(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["daemon.sock"]) == 2
+    assert "Usage: daemon.py SOCKET SCRIPT" in capsys.readouterr().err
+
+
+def test_main_runs_script_without_server(tmp_path: Path) -> None:
+    calls: List[Any] = []
+    execv: Callable[..., None] = lambda *args: calls.append(args)
+    with patch("os.execv", execv):
+        main([str(tmp_path / "daemon.sock"), "script.py", "ls"])
+    assert calls == [(sys.executable, [sys.executable, "script.py", "ls"])]
+
+
+def test_main_returns_status(tmp_path: Path) -> None:
+    path = str(tmp_path / "daemon.sock")
+    thread = serve_once(path, b'{"status": 4}')
+    with patch("os.execv", side_effect=AssertionError("Not called")):
+        assert main([path, "script.py"]) == 4
+    thread.join()
@@ -1,3 +1,4 @@
+import inspect
 from typing import Optional
 
 import pytest
@@ -5,6 +6,8 @@ import pytest
 from cly.docstring import (
     get_help_from_docstring,
     get_param_help_from_docstring,
+    get_parsed_docstring,
+    parse_docstring,
 )
 
 
@@ -118,3 +121,74 @@ def test_get_param_help_from_docstring_with_no_style() -> None:
         get_param_help_from_docstring("param", function_to_test_docstring)
         == ""
     )
+
+
+MULTI_LINE_PARAMS = {
+    "param1": "A very detailed description, in more than one line.",
+    "param2": "A small one.",
+    "param3": "A description with default value.",
+}
+MULTI_LINE_DOCSTRINGS = {
+    "NUMPY": """
+    Function to test docstring styles.
+
+    Parameters
+    ----------
+    param1 : str
+        A very detailed description,
+        in more than one line.
+    param2, param3 : int
+        A small one
+
+    """,
+    "GOOGLE": """
+    Function to test docstring styles.
+
+    Args:
+        param1 (str): A very detailed description,
+            in more than one line.
+        param2 (int): A small one
+        param3 (Optional[str], optional): A description with default value.
+            Defaults to None.
+    Returns:
+        str: Return information.
+
+    """,
+    "SPHINX": """
+    Function to test docstring styles.
+
+    :param param1: A very detailed description,
+        in more than one line.
+    :type param1: str
+    :param param2: A small one
+
+    :param int param3: A description with default value, defaults to None
+    """,
+}
+
+
+@pytest.mark.parametrize("style", MULTI_LINE_DOCSTRINGS)
+def test_parse_docstring_with_multi_line_descriptions(style: str) -> None:
+    parsed = parse_docstring(inspect.cleandoc(MULTI_LINE_DOCSTRINGS[style]))
+    assert parsed.style == style
+    assert parsed.summary == "Function to test docstring styles."
+    assert parsed.description == "Function to test docstring styles.\n\n"
+    expected = dict(MULTI_LINE_PARAMS)
+    if style == "NUMPY":
+        expected["param3"] = expected["param2"]
+    assert parsed.params == expected
+
+
+def test_parse_docstring_is_cached() -> None:
+    docstring = inspect.cleandoc(DOCSTRINGS["NUMPY"])
+    assert parse_docstring(docstring) is parse_docstring(docstring)
+    function_to_test_docstring.__doc__ = DOCSTRINGS["NUMPY"]
+    assert get_parsed_docstring(function_to_test_docstring) is (
+        parse_docstring(docstring)
+    )
+
+
+def test_parse_empty_docstring() -> None:
+    parsed = parse_docstring("")
+    assert (parsed.summary, parsed.description, parsed.style) == ("", "", "")
+    assert not parsed.params
@@ -0,0 +1,97 @@
+import json
+import os
+import stat
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from cly.external import (
+    EXTERNAL_FILE,
+    discover_external_commands,
+    exec_external_command,
+    find_external_commands,
+    get_path_directories,
+)
+
+PREFIX = "batcomputer"
+
+
+def create_executable(
+    directory: Path, name: str, executable: bool = True
+) -> str:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_text("#!/bin/sh\necho external\n", encoding="utf-8")
+    if executable:
+        path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+def fail(*args: Any) -> Dict[str, str]:
+    raise AssertionError("PATH should not be scanned")
+
+
+def test_get_path_directories(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PATH", os.pathsep.join(["/first", "", "/second"]))
+    assert get_path_directories() == ["/first", "/second"]
+
+
+def test_find_external_commands(tmp_path: Path) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    hello = create_executable(first, f"{PREFIX}-hello")
+    create_executable(first, f"{PREFIX}-not-executable", executable=False)
+    create_executable(first, f"{PREFIX}-")
+    create_executable(first, "other-command")
+    (first / f"{PREFIX}-directory").mkdir()
+    create_executable(second, f"{PREFIX}-hello")
+    bye = create_executable(second, f"{PREFIX}-bye")
+    directories = [str(first), str(tmp_path / "missing"), str(second)]
+    assert find_external_commands(PREFIX, directories) == {
+        "hello": hello,
+        "bye": bye,
+    }
+
+
+def test_discover_external_commands_without_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    hello = create_executable(tmp_path, f"{PREFIX}-hello")
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert discover_external_commands(PREFIX) == {"hello": hello}
+
+
+def test_discover_external_commands_with_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    bin_path = tmp_path / "bin"
+    cache_dir = tmp_path / "cache"
+    hello = create_executable(bin_path, f"{PREFIX}-hello")
+    monkeypatch.setenv("PATH", str(bin_path))
+    assert discover_external_commands(PREFIX, str(cache_dir)) == {
+        "hello": hello
+    }
+    index = json.loads((cache_dir / EXTERNAL_FILE).read_text(encoding="utf-8"))
+    assert index["commands"] == {"hello": hello}
+    with patch("cly.external.find_external_commands", fail):
+        assert discover_external_commands(PREFIX, str(cache_dir)) == {
+            "hello": hello
+        }
+    bye = create_executable(bin_path, f"{PREFIX}-bye")
+    status = bin_path.stat()
+    os.utime(bin_path, ns=(status.st_atime_ns, status.st_mtime_ns + 1000))
+    assert discover_external_commands(PREFIX, str(cache_dir)) == {
+        "hello": hello,
+        "bye": bye,
+    }
+
+
+def test_exec_external_command() -> None:
+    calls: List[Any] = []
+    with patch("os.execvp", lambda *args: calls.append(args)):
+        exec_external_command("/bin/batcomputer-hello", ["--help"])
+    assert calls == [
+        ("/bin/batcomputer-hello", ["/bin/batcomputer-hello", "--help"])
+    ]
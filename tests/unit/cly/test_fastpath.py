@@ -0,0 +1,182 @@
+import argparse
+import itertools
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from cly.fastpath import FastParser, is_option, is_supported
+
+OPTIONS = [
+    [],
+    ["-v"],
+    ["--verbose", "--quiet"],
+    ["--level", "5"],
+    ["--level=7"],
+    ["--mode", "night"],
+    ["--const", "--path", "/tmp/cave"],
+    ["--level", "5", "--level", "6"],
+    ["--lev", "5"],
+    ["--level", "five"],
+    ["--level", "-1"],
+    ["--level"],
+    ["--mode", "noon"],
+    ["--verbose=yes"],
+    ["-vx"],
+    ["--unknown"],
+    ["--"],
+    ["--help"],
+    ["--version"],
+]
+COMMANDS = [
+    [],
+    ["identify", "joker", "Jack"],
+    ["identify", "joker", "Jack", "Napier", "--ratio", "2"],
+    ["identify", "--ratio=1.5", "joker", "Jack"],
+    ["identify", "-", "Jack"],
+    ["identify", "joker"],
+    ["identify", "joker", "--ratio", "1", "Jack"],
+    ["identify", "joker", "Jack", "--", "-v"],
+    ["track", "--target", "joker"],
+    ["track"],
+    ["count", "1", "2", "3", "4"],
+    ["count", "1", "2"],
+    ["count", "x", "2", "3"],
+    ["tag", "--tag", "a"],
+    ["fly"],
+]
+FAST_ARGUMENTS = [
+    [],
+    ["--level=7", "--mode", "night"],
+    ["-v", "identify", "joker", "Jack", "Napier", "--ratio", "2"],
+    ["track", "--target", "joker"],
+    ["count", "1", "2", "3", "4"],
+]
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="batman")
+    parser.add_argument("--verbose", "-v", action="store_true")
+    parser.add_argument("--quiet", action="store_false")
+    parser.add_argument("--level", type=int, default="3")
+    parser.add_argument("--mode", choices=["day", "night"], default="day")
+    parser.add_argument("--const", action="store_const", const=42)
+    parser.add_argument("--path", type=Path)
+    parser.add_argument("--version", action="version", version="1.0.0")
+    parser.set_defaults(handler="batman")
+    subparsers = parser.add_subparsers(dest="commands")
+    identify = subparsers.add_parser("identify")
+    identify.add_argument("villain")
+    identify.add_argument("aliases", nargs="+")
+    identify.add_argument("--ratio", type=float, default=0.5)
+    track = subparsers.add_parser("track")
+    track.add_argument("--target", required=True)
+    count = subparsers.add_parser("count")
+    count.add_argument("first", type=int)
+    count.add_argument("middle", nargs="+", type=int)
+    count.add_argument("last", type=int)
+    tag = subparsers.add_parser("tag")
+    tag.add_argument("--tag", action="append")
+    return parser
+
+
+def parse_args(
+    parser: argparse.ArgumentParser, arguments: List[str]
+) -> Optional[argparse.Namespace]:
+    try:
+        return parser.parse_args(arguments)
+    except SystemExit:
+        return None
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        [*options, *command]
+        for options, command in itertools.product(OPTIONS, COMMANDS)
+    ],
+)
+def test_fast_parser_matches_argparse(
+    arguments: List[str], capsys: pytest.CaptureFixture[str]
+) -> None:
+    parser = create_parser()
+    namespace = FastParser(parser).parse_args(arguments)
+    expected = parse_args(parser, arguments)
+    capsys.readouterr()
+    if expected is None:
+        assert namespace is None
+    elif namespace is not None:
+        assert vars(namespace) == vars(expected)
+
+
+@pytest.mark.parametrize("arguments", FAST_ARGUMENTS)
+def test_fast_parser_handles_common_arguments(arguments: List[str]) -> None:
+    parser = create_parser()
+    namespace = FastParser(parser).parse_args(arguments)
+    assert namespace == parser.parse_args(arguments)
+
+
+def test_fast_parser_converts_string_defaults() -> None:
+    namespace = FastParser(create_parser()).parse_args([])
+    assert namespace == argparse.Namespace(
+        verbose=False,
+        quiet=True,
+        level=3,
+        mode="day",
+        const=None,
+        path=None,
+        handler="batman",
+        commands=None,
+    )
+
+
+def test_fast_parser_compiles_parser_again_when_it_changes() -> None:
+    parser = argparse.ArgumentParser()
+    fast_parser = FastParser(parser)
+    assert fast_parser.parse_args(["--name", "Alfred"]) is None
+    parser.add_argument("--name")
+    assert fast_parser.parse_args(["--name", "Alfred"]) == argparse.Namespace(
+        name="Alfred"
+    )
+    assert fast_parser.get_plan(parser) is fast_parser.get_plan(parser)
+
+
+def test_fast_parser_falls_back_for_unsupported_parsers() -> None:
+    exclusive = argparse.ArgumentParser()
+    exclusive.add_mutually_exclusive_group().add_argument("--name")
+    from_file = argparse.ArgumentParser(fromfile_prefix_chars="@")
+    prefix = argparse.ArgumentParser(prefix_chars="+")
+    positionals = argparse.ArgumentParser()
+    positionals.add_argument("name")
+    positionals.add_subparsers().add_parser("identify")
+    ambiguous = argparse.ArgumentParser()
+    ambiguous.add_argument("first", nargs="+")
+    ambiguous.add_argument("second", nargs="+")
+    for parser in (exclusive, from_file, prefix, positionals, ambiguous):
+        assert FastParser(parser).parse_args(["a", "b"]) is None
+
+
+@pytest.mark.parametrize(
+    "kwargs, supported",
+    [
+        ({}, True),
+        ({"type": int}, True),
+        ({"type": str.upper}, False),
+        ({"type": argparse.FileType()}, False),
+        ({"nargs": "?"}, False),
+        ({"nargs": "+"}, False),
+        ({"action": "count"}, False),
+        ({"action": "store_true"}, True),
+    ],
+)
+def test_is_supported(kwargs: Dict[str, Any], supported: bool) -> None:
+    action = argparse.ArgumentParser().add_argument("--name", **kwargs)
+    assert is_supported(action) == supported
+
+
+@pytest.mark.parametrize(
+    "argument, option",
+    [("--name", True), ("-n", True), ("-", False), ("name", False)],
+)
+def test_is_option(argument: str, option: bool) -> None:
+    assert is_option(argument) == option
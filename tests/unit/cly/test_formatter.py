@@ -0,0 +1,176 @@
+import argparse
+import functools
+from typing import Any, Callable, Iterable, Optional
+
+import pytest
+
+from cly.config import CustomParser
+from cly.formatter import (
+    FILLED_TEXTS_CACHE_SIZE,
+    USAGE_PREFIX,
+    CustomFormatter,
+    fill_text,
+)
+
+WIDTHS = [20, 40, 80, 200]
+
+
+class ArgparseFormatter(CustomFormatter):
+    """CLY?!'s formatter, with argparse's usage formatting."""
+
+    def _format_usage(
+        self,
+        usage: Optional[str],
+        actions: Iterable[argparse.Action],
+        groups: Iterable[Any],
+        prefix: Optional[str],
+    ) -> str:
+        return argparse.HelpFormatter._format_usage(
+            self, usage, actions, groups, USAGE_PREFIX
+        )
+
+
+def create_options_parser(**kwargs: Any) -> argparse.ArgumentParser:
+    parser = CustomParser(**kwargs)
+    for index in range(30):
+        parser.add_argument(f"--option-{index}", help=f"Option {index}.")
+    parser.add_argument("-f", "--flag", action="store_true")
+    parser.add_argument("-c", "--count", action="count")
+    parser.add_argument("--required", required=True)
+    parser.add_argument("--optional", nargs="?")
+    parser.add_argument("--many", nargs="*", metavar="ITEM")
+    parser.add_argument("--pair", nargs=2, metavar=("KEY", "VALUE"))
+    parser.add_argument("--choice", choices=["joker", "riddler"])
+    parser.add_argument("--hidden", help=argparse.SUPPRESS)
+    parser.add_argument("--spaced", metavar="A B", help="Default %(default)s.")
+    parser.add_argument("--nested", nargs="?", metavar="[A] B")
+    if hasattr(argparse, "BooleanOptionalAction"):
+        parser.add_argument("--cave", action=argparse.BooleanOptionalAction)
+    parser.add_argument("name")
+    parser.add_argument("aliases", nargs="+")
+    parser.add_argument("extra", nargs="*")
+    parser.add_argument("last", nargs="?")
+    return parser
+
+
+def create_positionals_parser(**kwargs: Any) -> argparse.ArgumentParser:
+    parser = CustomParser(add_help=False, **kwargs)
+    for index in range(20):
+        parser.add_argument(f"positional_{index}")
+    return parser
+
+
+def create_commands_parser(**kwargs: Any) -> argparse.ArgumentParser:
+    parser = CustomParser(**kwargs)
+    parser.add_argument("-o", "--oracle", action="store_true")
+    parser.add_subparsers(dest="commands").add_parser("identify")
+    return parser
+
+
+def create_exclusive_parser(**kwargs: Any) -> argparse.ArgumentParser:
+    parser = create_options_parser(**kwargs)
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--day", action="store_true")
+    group.add_argument("--night", action="store_true")
+    return parser
+
+
+def create_unsafe_parser(**kwargs: Any) -> argparse.ArgumentParser:
+    parser = create_options_parser(**kwargs)
+    parser.add_argument("--empty", metavar="")
+    return parser
+
+
+def create_empty_parser(**kwargs: Any) -> argparse.ArgumentParser:
+    return CustomParser(add_help=False, **kwargs)
+
+
+def create_groups_parser(**kwargs: Any) -> argparse.ArgumentParser:
+    parser = create_commands_parser(
+        description="Run Batcomputer analysis.\n\n\n\nOn selected areas.",
+        epilog="Wayne Enterprises",
+        **kwargs,
+    )
+    group = parser.add_argument_group("Cave", "Batcave's options.")
+    group.add_argument("--lights", action="store_true", help="Turn on.")
+    parser.add_argument_group("Hidden").add_argument(
+        "--secret", help=argparse.SUPPRESS
+    )
+    parser.add_argument_group("Empty", "No options.")
+    return parser
+
+
+@pytest.mark.parametrize("width", WIDTHS)
+@pytest.mark.parametrize("prog", ["batman", "batcomputer" * 6])
+@pytest.mark.parametrize(
+    "create_parser",
+    [
+        create_options_parser,
+        create_positionals_parser,
+        create_commands_parser,
+        create_exclusive_parser,
+        create_unsafe_parser,
+        create_empty_parser,
+        functools.partial(create_options_parser, usage="%(prog)s [options]"),
+    ],
+)
+def test_usage_has_argparse_layout(
+    create_parser: Callable[..., argparse.ArgumentParser],
+    prog: str,
+    width: int,
+) -> None:
+    parser = create_parser(
+        prog=prog,
+        formatter_class=functools.partial(CustomFormatter, width=width),
+    )
+    expected = create_parser(
+        prog=prog,
+        formatter_class=functools.partial(ArgparseFormatter, width=width),
+    )
+    assert parser.format_help() == expected.format_help()
+
+
+@pytest.mark.parametrize("width", WIDTHS)
+@pytest.mark.parametrize(
+    "formatter_class", [CustomFormatter, argparse.HelpFormatter]
+)
+@pytest.mark.parametrize(
+    "create_parser",
+    [
+        create_options_parser,
+        create_commands_parser,
+        create_groups_parser,
+        create_empty_parser,
+    ],
+)
+def test_streamed_help_is_formatted_help(
+    create_parser: Callable[..., CustomParser],
+    formatter_class: Any,
+    width: int,
+) -> None:
+    parser = create_parser(
+        prog="batman",
+        formatter_class=functools.partial(formatter_class, width=width),
+    )
+    chunks = list(parser.iter_help())
+    assert "".join(chunks) == parser.format_help()
+    if formatter_class is CustomFormatter and parser._actions:
+        assert chunks[0].startswith(f"{USAGE_PREFIX}batman")
+        assert len(chunks) > 2
+
+
+def test_fill_text_is_memoized() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run Batcomputer analysis.",
+        formatter_class=CustomFormatter,
+    )
+    parser.format_help()
+    hits = fill_text.cache_info().hits
+    parser.format_help()
+    assert fill_text.cache_info().hits == hits + 1
+
+
+def test_fill_text_cache_is_bounded() -> None:
+    for index in range(FILLED_TEXTS_CACHE_SIZE + 1):
+        fill_text(f"Batcomputer {index}", 80, "")
+    assert fill_text.cache_info().currsize == FILLED_TEXTS_CACHE_SIZE
@@ -0,0 +1,50 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cly.hooks import DispatchEvent, JsonLinesSink, get_exit_status
+
+
+@pytest.mark.parametrize(
+    "code,exit_status", [(None, 0), (0, 0), (2, 2), ("Error message", 1)]
+)
+def test_get_exit_status(code: Any, exit_status: int) -> None:
+    assert get_exit_status(code) == exit_status
+
+
+def test_dispatch_event_before_command_runs() -> None:
+    event = DispatchEvent("before", "id", {"aliases": ["Batman"]})
+    assert repr(event) == "DispatchEvent('before', 'id')"
+    assert event.to_dict() == {
+        "event": "before",
+        "command": "id",
+        "kwargs": {"aliases": ["Batman"]},
+        "wall_time": 0.0,
+        "cpu_time": 0.0,
+        "exit_status": None,
+        "error": None,
+    }
+
+
+def test_dispatch_event_with_error() -> None:
+    event = DispatchEvent(
+        "error", "id", {}, 0.5, 0.25, 1, ValueError("Invalid alias")
+    )
+    assert event.to_dict()["error"] == "ValueError: Invalid alias"
+
+
+def test_json_lines_sink(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    sink = JsonLinesSink(str(path))
+    sink(DispatchEvent("before", "id", {"path": tmp_path}))
+    sink(DispatchEvent("after", "id", {}, 0.5, 0.25, 0))
+    lines = [
+        json.loads(line)
+        for line in path.read_text(encoding="utf-8").splitlines()
+    ]
+    assert [line["event"] for line in lines] == ["before", "after"]
+    assert lines[0]["kwargs"] == {"path": repr(tmp_path)}
+    assert lines[1]["wall_time"] == 0.5
+    assert "timestamp" in lines[0]
@@ -0,0 +1,254 @@
+import argparse
+import copy
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from cly.loader import (
+    DeferredParser,
+    LazyCommand,
+    ParserMap,
+    RecordedCalls,
+    get_command_source,
+    get_command_target,
+    import_object,
+    read_static_command,
+    split_import_path,
+    unwrap_command,
+)
+
+from ...batcomputer_cli.database import get_alias_data
+
+DATABASE = "tests.batcomputer_cli.database"
+INVALID_PATHS = ["", "module", "module:", ":attribute", "module.attribute"]
+
+
+@pytest.mark.parametrize("path", INVALID_PATHS)
+def test_split_import_path_with_invalid_path(path: str) -> None:
+    with pytest.raises(ValueError) as error:
+        split_import_path(path)
+    assert "is not a valid import path" in str(error.value)
+
+
+def test_split_import_path() -> None:
+    assert split_import_path(f"{DATABASE}:get_alias_data") == (
+        DATABASE,
+        "get_alias_data",
+    )
+
+
+def test_import_object() -> None:
+    assert import_object(f"{DATABASE}:get_alias_data") is get_alias_data
+
+
+def test_import_object_with_nested_attribute() -> None:
+    assert import_object(f"{DATABASE}:CHARACTERS.get") is not None
+
+
+def test_lazy_command_is_not_resolved_when_created() -> None:
+    command = LazyCommand(f"{DATABASE}:get_alias_data")
+    assert command.__name__ == "get_alias_data"
+    assert repr(command) == f"LazyCommand('{DATABASE}:get_alias_data')"
+    assert not command.is_resolved
+
+
+def test_lazy_command_resolve() -> None:
+    command = LazyCommand(f"{DATABASE}:get_alias_data")
+    assert command.resolve() is get_alias_data
+    assert command.is_resolved
+    assert unwrap_command(command) is get_alias_data
+
+
+def test_lazy_command_call_without_decorator() -> None:
+    command = LazyCommand(f"{DATABASE}:get_alias_data")
+    assert command(alias="joker") == get_alias_data("joker")
+
+
+def test_lazy_command_call_with_decorator() -> None:
+    calls: List[Callable[..., Any]] = []
+
+    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+        calls.append(function)
+        return function
+
+    command = LazyCommand(f"{DATABASE}:get_alias_data", decorator=decorator)
+    command(alias="joker")
+    command(alias="batman")
+    assert calls == [get_alias_data]
+
+
+def test_unwrap_command_with_function() -> None:
+    assert unwrap_command(get_alias_data) is get_alias_data
+
+
+def test_get_command_target() -> None:
+    assert get_command_target(get_alias_data) == f"{DATABASE}:get_alias_data"
+    assert (
+        get_command_target(LazyCommand(f"{DATABASE}:CHARACTERS.get"))
+        == f"{DATABASE}:CHARACTERS.get"
+    )
+
+
+def test_get_command_source() -> None:
+    assert get_command_source(get_alias_data).endswith("database.py")
+    assert get_command_source(len) == ""
+
+
+def test_recorded_calls_replay() -> None:
+    recorded = RecordedCalls()
+    group = recorded.add_argument_group("Group")
+    group.add_argument("--flag", action="store_true")
+    recorded.set_defaults(value=1)
+    parser = argparse.ArgumentParser()
+    recorded.replay(parser)
+    assert parser.parse_args(["--flag"]) == argparse.Namespace(
+        flag=True, value=1
+    )
+    assert parser._action_groups[-1].title == "Group"
+
+
+def test_recorded_calls_private_attribute() -> None:
+    with pytest.raises(AttributeError):
+        getattr(RecordedCalls(), "_private")
+
+
+@pytest.mark.parametrize("name", ["prog", "parse_args", "help", "completer"])
+def test_recorded_calls_unknown_attribute(name: str) -> None:
+    recorded = RecordedCalls()
+    action = recorded.add_argument("--flag")
+    with pytest.raises(AttributeError):
+        getattr(recorded, name)
+    with pytest.raises(AttributeError):
+        getattr(action, name)
+    with pytest.raises(AttributeError):
+        action.add_argument("--other")
+
+
+def test_recorded_calls_replay_attributes() -> None:
+    recorded = RecordedCalls()
+    action = recorded.add_argument("--flag", help="Flag.")
+    action.help = "Replaced flag."
+    assert action.help == "Replaced flag."
+    recorded.description = "Description."
+    parser = argparse.ArgumentParser()
+    recorded.replay(parser)
+    assert parser._actions[-1].help == "Replaced flag."
+    assert parser.description == "Description."
+    assert copy.copy(recorded).calls == recorded.calls
+
+
+def test_deferred_parser_build() -> None:
+    def setup(parser: argparse.ArgumentParser) -> None:
+        parser.description = "Description."
+
+    deferred = DeferredParser(argparse.ArgumentParser, {"prog": "cmd"}, setup)
+    deferred.add_argument("value")
+    parser = deferred.build()
+    assert parser.prog == "cmd"
+    assert parser.description == "Description."
+    assert parser.parse_args(["1"]).value == "1"
+
+
+def test_parser_map_builds_deferred_parser_once() -> None:
+    builds: List[argparse.ArgumentParser] = []
+
+    def setup(parser: argparse.ArgumentParser) -> None:
+        builds.append(parser)
+
+    parsers = ParserMap()
+    parsers["cmd"] = DeferredParser(argparse.ArgumentParser, {}, setup)
+    assert "cmd" in parsers
+    assert not parsers.is_built("cmd")
+    assert parsers["cmd"] is parsers["cmd"]
+    assert parsers.is_built("cmd")
+    assert builds == [parsers["cmd"]]
+
+
+STATIC_MODULE = '''
+import not_installed_dependency
+
+
+def command(first, *rest, second=None, **kwargs):
+    """
+    Run command.
+
+    Parameters
+    ----------
+    first : str
+        First parameter.
+
+    """
+
+
+async def async_command():
+    """Run async command."""
+
+
+class Commands:
+    def method(self):
+        """Run method."""
+
+    class Nested:
+        pass
+
+
+assigned = command
+'''
+
+
+@pytest.fixture(name="static_module")
+def fixture_static_module(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> str:
+    (tmp_path / "static_module.py").write_text(STATIC_MODULE, encoding="utf-8")
+    (tmp_path / "invalid_module.py").write_text("def (", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    read_static_command.cache_clear()
+    return "static_module"
+
+
+def test_read_static_command(static_module: str) -> None:
+    command = read_static_command(f"{static_module}:command")
+    assert command is not None
+    assert command.source.endswith("static_module.py")
+    assert command.docstring.startswith("Run command.\n\nParameters")
+    assert command.params == ["first", "rest", "second", "kwargs"]
+    assert read_static_command(f"{static_module}:command") is command
+
+
+@pytest.mark.parametrize(
+    "attribute,docstring",
+    [
+        ("async_command", "Run async command."),
+        ("Commands.method", "Run method."),
+        ("Commands", None),
+        ("Commands.Nested", None),
+        ("Commands.missing", None),
+        ("assigned", None),
+        ("command.attribute", None),
+    ],
+)
+def test_read_static_command_definitions(
+    static_module: str, attribute: str, docstring: Optional[str]
+) -> None:
+    command = read_static_command(f"{static_module}:{attribute}")
+    assert (command and command.docstring) == docstring
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["invalid_module:command", "missing_module:command", "sys:exit"],
+)
+def test_read_static_command_without_source(
+    static_module: str, path: str
+) -> None:
+    assert read_static_command(path) is None
+
+
+def test_read_static_command_when_module_cannot_be_found(
+    static_module: str,
+) -> None:
+    with patch("importlib.util.find_spec", side_effect=ValueError):
+        assert read_static_command(f"{static_module}:command") is None
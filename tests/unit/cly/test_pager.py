@@ -0,0 +1,125 @@
+import io
+import os
+import shlex
+import sys
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from cly.pager import discard_output, run_pager, write_text
+
+CHUNKS = ["Usage:\n  batcomputer", " [-h]\n\n", "Options:\n", "  -h\n"]
+TEXT = "".join(CHUNKS)
+
+
+class Terminal(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+
+class ClosedPipe(io.StringIO):
+    def __init__(self, descriptor: int) -> None:
+        super().__init__()
+        self.descriptor = descriptor
+
+    def write(self, text: str) -> int:
+        raise BrokenPipeError
+
+    def fileno(self) -> int:
+        return self.descriptor
+
+
+class InterruptedPager:
+    stdin = io.StringIO()
+
+    def __init__(self, command: List[str], **kwargs: Any) -> None:
+        self.waits = 0
+
+    def wait(self) -> int:
+        self.waits += 1
+        if self.waits == 1:
+            raise KeyboardInterrupt
+        return 0
+
+
+def set_pager(
+    monkeypatch: pytest.MonkeyPatch, source: str, *arguments: str
+) -> None:
+    command = [sys.executable, "-c", source, *arguments]
+    monkeypatch.setenv("PAGER", " ".join(map(shlex.quote, command)))
+
+
+def set_terminal_height(monkeypatch: pytest.MonkeyPatch, height: int) -> None:
+    monkeypatch.setattr(
+        "shutil.get_terminal_size", lambda: os.terminal_size((80, height))
+    )
+
+
+def test_write_text_streams_chunks() -> None:
+    file = io.StringIO()
+    write_text(iter(CHUNKS), file)
+    assert file.getvalue() == TEXT
+
+
+def test_write_text_to_stdout(capsys: pytest.CaptureFixture[str]) -> None:
+    write_text(CHUNKS)
+    assert capsys.readouterr().out == TEXT
+
+
+def test_write_text_fitting_terminal(monkeypatch: pytest.MonkeyPatch) -> None:
+    set_terminal_height(monkeypatch, 24)
+    monkeypatch.setenv("PAGER", "missing-pager")
+    file = Terminal()
+    write_text(CHUNKS, file)
+    assert file.getvalue() == TEXT
+
+
+def test_write_text_taller_than_terminal(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    output = tmp_path / "paged.txt"
+    set_pager(
+        monkeypatch,
+        "import sys; open(sys.argv[1], 'w').write(sys.stdin.read())",
+        str(output),
+    )
+    set_terminal_height(monkeypatch, 3)
+    file = Terminal()
+    write_text(CHUNKS, file)
+    assert file.getvalue() == ""
+    assert output.read_text() == TEXT
+
+
+@pytest.mark.parametrize("command", ["", "missing-pager"])
+def test_write_text_without_pager(
+    monkeypatch: pytest.MonkeyPatch, command: str
+) -> None:
+    monkeypatch.setenv("PAGER", command)
+    set_terminal_height(monkeypatch, 3)
+    file = Terminal()
+    write_text(CHUNKS, file)
+    assert file.getvalue() == TEXT
+
+
+def test_run_pager_exiting_early(monkeypatch: pytest.MonkeyPatch) -> None:
+    set_pager(monkeypatch, "import sys; sys.stdin.readline()")
+    assert run_pager("Gotham\n" * 1000 for _ in range(100))
+
+
+def test_run_pager_waits_after_interruption(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("subprocess.Popen", InterruptedPager)
+    assert run_pager(CHUNKS)
+
+
+def test_write_text_to_closed_pipe(tmp_path: Path) -> None:
+    with open(tmp_path / "output.txt", "w", encoding="utf-8") as output:
+        write_text(CHUNKS, ClosedPipe(output.fileno()))
+        output.write("Gotham")
+    assert (tmp_path / "output.txt").read_text() == ""
+
+
+def test_discard_output_without_descriptor() -> None:
+    discard_output(io.StringIO())
@@ -0,0 +1,137 @@
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+from unittest.mock import patch
+
+import pytest
+
+from cly.loader import read_static_command
+from cly.plugins import (
+    PLUGINS_FILE,
+    discover_plugins,
+    find_entry_points,
+    get_installation_key,
+    get_summary,
+)
+
+GROUP = "cly.test_plugins"
+ENTRY_POINTS = f"""
+[{GROUP}]
+hello = plugin_module:hello
+extra = plugin_module:hello [extra]
+hello = plugin_module:duplicated
+module = plugin_module
+
+[other.group]
+other = plugin_module:hello
+"""
+PLUGIN_MODULE = '''
+import not_installed_dependency
+
+
+def hello():
+    """
+    Say hello.
+
+    More details.
+    """
+'''
+
+
+@pytest.fixture(name="plugins_path")
+def fixture_plugins_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Path]:
+    plugins_path = tmp_path / "site-packages"
+    dist_info = plugins_path / "fake_plugin-1.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: fake-plugin\nVersion: 1.0\n",
+        encoding="utf-8",
+    )
+    (dist_info / "entry_points.txt").write_text(ENTRY_POINTS, encoding="utf-8")
+    (plugins_path / "plugin_module.py").write_text(
+        PLUGIN_MODULE, encoding="utf-8"
+    )
+    monkeypatch.syspath_prepend(str(plugins_path))
+    read_static_command.cache_clear()
+    yield plugins_path
+    sys.modules.pop("plugin_module", None)
+
+
+def fail(*args: Any) -> List[List[str]]:
+    raise AssertionError("Entry points should not be scanned")
+
+
+def test_get_installation_key(
+    plugins_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.syspath_prepend(str(tmp_path))
+    key = get_installation_key()
+    assert key[0] == [str(plugins_path), plugins_path.stat().st_mtime_ns]
+    assert str(tmp_path) not in [entry for entry, _ in key]
+
+
+def test_find_entry_points(plugins_path: Path) -> None:
+    assert find_entry_points(GROUP) == [
+        ["hello", "plugin_module:hello"],
+        ["extra", "plugin_module:hello"],
+    ]
+    assert find_entry_points("missing.group") == []
+
+
+def test_find_entry_points_with_old_metadata_api(plugins_path: Path) -> None:
+    entry_points: Dict[str, List[Any]] = {GROUP: [], "other.group": []}
+    with patch("importlib.metadata.entry_points", return_value=entry_points):
+        assert find_entry_points(GROUP) == []
+
+
+def test_get_summary(plugins_path: Path) -> None:
+    assert get_summary("plugin_module:hello") == "Say hello."
+    assert get_summary("plugin_module:missing") == ""
+    assert "plugin_module" not in sys.modules
+
+
+def test_discover_plugins_without_cache(plugins_path: Path) -> None:
+    plugins = discover_plugins(GROUP)
+    assert plugins[0] == {
+        "name": "hello",
+        "target": "plugin_module:hello",
+        "summary": "Say hello.",
+    }
+
+
+def test_discover_plugins_with_index(
+    plugins_path: Path, tmp_path: Path
+) -> None:
+    cache_dir = tmp_path / "cache"
+    plugins = discover_plugins(GROUP, str(cache_dir))
+    index = json.loads((cache_dir / PLUGINS_FILE).read_text(encoding="utf-8"))
+    assert index["groups"][GROUP]["plugins"] == plugins
+    with patch("cly.plugins.find_entry_points", fail):
+        assert discover_plugins(GROUP, str(cache_dir)) == plugins
+    assert discover_plugins("other.group", str(cache_dir)) == [
+        {
+            "name": "other",
+            "target": "plugin_module:hello",
+            "summary": "Say hello.",
+        }
+    ]
+    index = json.loads((cache_dir / PLUGINS_FILE).read_text(encoding="utf-8"))
+    assert set(index["groups"]) == {GROUP, "other.group"}
+
+
+def test_index_is_refreshed_when_distributions_change(
+    plugins_path: Path, tmp_path: Path
+) -> None:
+    cache_dir = tmp_path / "cache"
+    discover_plugins(GROUP, str(cache_dir))
+    (
+        plugins_path / "fake_plugin-1.0.dist-info" / "entry_points.txt"
+    ).write_text(f"[{GROUP}]\nbye = plugin_module:hello\n", encoding="utf-8")
+    stat = plugins_path.stat()
+    os.utime(plugins_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    plugins = discover_plugins(GROUP, str(cache_dir))
+    assert [plugin["name"] for plugin in plugins] == ["bye"]
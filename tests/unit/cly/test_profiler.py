@@ -0,0 +1,144 @@
+import importlib
+import json
+import sys
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from cly import profiler
+from cly.profiler import (
+    BOOTSTRAP,
+    PROFILE_OPTION,
+    PROFILE_VARIABLE,
+    StartupProfiler,
+    phase,
+    profiled,
+    start_profiler,
+    stop_profiler,
+)
+
+MODULE = "tests.batcomputer_cli.commands.identify"
+
+
+@pytest.fixture(autouse=True)
+def reset_profiler(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.delenv(PROFILE_VARIABLE, raising=False)
+    yield
+    if profiler.PROFILER is not None:
+        profiler.PROFILER.untrack_imports()
+    profiler.PROFILER = None
+
+
+def test_phases_are_accumulated() -> None:
+    startup_profiler = StartupProfiler()
+    with startup_profiler.phase("parse_args"):
+        pass
+    with pytest.raises(ValueError):
+        with startup_profiler.phase("parse_args"):
+            raise ValueError()
+    assert startup_profiler.phases["parse_args"][1] == 2
+
+
+def test_imports_are_tracked_only_once() -> None:
+    find_and_load = BOOTSTRAP._find_and_load
+    startup_profiler = StartupProfiler()
+    startup_profiler.track_imports()
+    startup_profiler.track_imports()
+    with patch.dict(sys.modules):
+        sys.modules.pop(MODULE, None)
+        importlib.import_module(MODULE)
+        importlib.import_module(MODULE)
+    startup_profiler.untrack_imports()
+    startup_profiler.untrack_imports()
+    assert MODULE in startup_profiler.imports
+    assert BOOTSTRAP._find_and_load is find_and_load
+    elapsed, self_elapsed = startup_profiler.imports[MODULE]
+    assert 0 <= self_elapsed <= elapsed
+
+
+def test_relative_imports_are_resolved() -> None:
+    startup_profiler = StartupProfiler()
+    startup_profiler.track_imports()
+    with patch.dict(sys.modules):
+        sys.modules.pop("tests.batcomputer_cli.database", None)
+        sys.modules.pop(MODULE, None)
+        importlib.import_module(MODULE)
+    startup_profiler.untrack_imports()
+    assert "tests.batcomputer_cli.database" in startup_profiler.imports
+
+
+def test_submodules_imported_from_package_are_tracked() -> None:
+    startup_profiler = StartupProfiler()
+    startup_profiler.track_imports()
+    package = MODULE.rpartition(".")[0]
+    with patch.dict(sys.modules):
+        sys.modules.pop(package, None)
+        sys.modules.pop(MODULE, None)
+        from tests.batcomputer_cli.commands import (  # noqa: F401
+            identify,
+        )
+    startup_profiler.untrack_imports()
+    assert {package, MODULE} <= set(startup_profiler.imports)
+
+
+def test_report_is_sorted() -> None:
+    startup_profiler = StartupProfiler()
+    startup_profiler.phases = {"fast": [1, 1], "slow": [10, 2]}
+    startup_profiler.imports = {"fast": [20, 1], "slow": [10, 5]}
+    report = startup_profiler.get_report()
+    assert [item["name"] for item in report["phases"]] == ["slow", "fast"]
+    assert [item["name"] for item in report["imports"]] == ["slow", "fast"]
+    text = startup_profiler.format_report()
+    assert "slow (2x)" in text
+    assert text.index("slow (2x)") < text.index("fast (1x)")
+
+
+def test_report_is_printed_to_stderr(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    startup_profiler = StartupProfiler("1")
+    startup_profiler.write_report()
+    assert "CLY?! startup profile" in capsys.readouterr().err
+
+
+def test_report_is_written_to_file(tmp_path: Path) -> None:
+    output = tmp_path / "profile.json"
+    startup_profiler = StartupProfiler(str(output))
+    startup_profiler.write_report()
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert set(report) == {"total_ns", "phases", "imports"}
+
+
+def test_profiler_is_not_started_by_default() -> None:
+    assert start_profiler(["command"]) == ["command"]
+    assert profiler.PROFILER is None
+    with phase("parse_args"):
+        pass
+    stop_profiler()
+
+
+def test_profiler_is_started_by_option(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    assert start_profiler([PROFILE_OPTION, "command"]) == ["command"]
+    assert profiler.PROFILER is not None
+    assert profiled("parse_args")(lambda: 1)() == 1
+    assert profiler.PROFILER.phases["parse_args"][1] == 1
+    stop_profiler()
+    assert profiler.PROFILER is None
+    assert "parse_args (1x)" in capsys.readouterr().err
+
+
+def test_profiler_is_started_by_environment_variable(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    output = tmp_path / "profile.json"
+    monkeypatch.setenv(PROFILE_VARIABLE, str(output))
+    start_profiler(["command"])
+    startup_profiler = profiler.PROFILER
+    start_profiler([f"{PROFILE_OPTION}=other.json"])
+    assert profiler.PROFILER is startup_profiler
+    stop_profiler()
+    assert output.exists()
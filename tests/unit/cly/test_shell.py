@@ -0,0 +1,126 @@
+import io
+from pathlib import Path
+from typing import Any, Dict, List, cast
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cly.shell import CommandShell
+
+TABLE: Dict[str, Any] = {
+    "options": ["-h", "--help"],
+    "values": {},
+    "commands": {
+        "identify": {
+            "options": ["-h", "--help", "--name"],
+            "values": {"--name": []},
+            "commands": {},
+            "positionals": [["joker", "penguin"]],
+        },
+        "id": {"options": [], "values": {}, "commands": {}, "positionals": []},
+    },
+    "positionals": [],
+}
+
+
+class Runner:
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+
+    def __call__(self, arguments: List[str]) -> int:
+        self.calls.append(arguments)
+        if arguments == ["interrupt"]:
+            raise KeyboardInterrupt
+        return 0 if arguments[0] == "identify" else 2
+
+
+def create_shell(lines: str, runner: Runner, **kwargs: Any) -> CommandShell:
+    return CommandShell(
+        runner,
+        lambda: TABLE,
+        stdin=io.StringIO(lines),
+        stdout=io.StringIO(),
+        **kwargs,
+    )
+
+
+def get_output(shell: CommandShell) -> str:
+    return cast(io.StringIO, shell.stdout).getvalue()
+
+
+def test_shell_runs_lines(capsys: pytest.CaptureFixture[str]) -> None:
+    runner = Runner()
+    lines = "identify 'Two Face'\n\nfly\n'unclosed\ninterrupt\nhelp\n"
+    shell = create_shell(lines + "help identify\nexit\nidentify\n", runner)
+    shell.use_rawinput = False
+    shell.run_loop()
+    assert runner.calls == [
+        ["identify", "Two Face"],
+        ["fly"],
+        ["interrupt"],
+        ["--help"],
+        ["identify", "--help"],
+    ]
+    stderr = capsys.readouterr().err
+    assert "Invalid line: No closing quotation\n" in stderr
+    assert "KeyboardInterrupt\n" in stderr
+    assert stderr.count(" ms, exit status 0]\n") == 2
+    assert stderr.count(" ms, exit status 2]\n") == 2
+    assert stderr.count(" ms, exit status 130]\n") == 1
+
+
+def test_shell_without_timing(capsys: pytest.CaptureFixture[str]) -> None:
+    shell = create_shell("identify\n", Runner(), timing=False)
+    shell.use_rawinput = False
+    shell.run_loop()
+    assert get_output(shell).endswith("(Cmd) \n")
+    assert capsys.readouterr().err == ""
+
+
+def test_shell_goes_on_after_interrupt() -> None:
+    shell = create_shell("", Runner())
+    shell.use_rawinput = False
+    with patch.object(
+        shell.stdin, "readline", side_effect=[KeyboardInterrupt, "exit\n"]
+    ):
+        shell.intro = "Intro"
+        shell.run_loop()
+    assert get_output(shell) == "Intro\n(Cmd) ^C\n(Cmd) "
+
+
+@pytest.mark.parametrize(
+    "method, text, line, candidates",
+    [
+        ("completenames", "i", "i", ["identify", "id"]),
+        ("completenames", "e", "e", ["exit"]),
+        ("completedefault", "j", "identify j", ["joker"]),
+        ("completedefault", "--n", "identify --n", ["--name"]),
+        ("completedefault", "j", "identify 'j", []),
+        ("complete_help", "ide", "help ide", ["identify"]),
+        ("complete_help", "", "? ", ["identify", "id"]),
+    ],
+)
+def test_shell_completion(
+    method: str, text: str, line: str, candidates: List[str]
+) -> None:
+    shell = create_shell("", Runner())
+    begidx = len(line) - len(text)
+    complete = getattr(shell, method)
+    assert complete(text, line, begidx, len(line)) == candidates
+
+
+@pytest.mark.parametrize("history_exists", [True, False])
+def test_shell_keeps_history(tmp_path: Path, history_exists: bool) -> None:
+    readline = MagicMock()
+    if not history_exists:
+        readline.read_history_file.side_effect = OSError
+    history_path = str(tmp_path / "history")
+    shell = create_shell("", Runner(), history_path=history_path)
+    with patch("cly.shell.import_readline", return_value=readline), patch(
+        "builtins.input", side_effect=["identify", EOFError]
+    ):
+        shell.run_loop()
+    readline.set_completer_delims.assert_called_once_with(" \t\n")
+    readline.read_history_file.assert_called_once_with(history_path)
+    readline.write_history_file.assert_called_once_with(history_path)
+    assert get_output(shell) == "\n"
@@ -0,0 +1,81 @@
+from typing import List
+
+import pytest
+
+from cly.suggest import (
+    MAX_CANDIDATES,
+    SuggestionIndex,
+    get_distance,
+    get_max_distance,
+    get_trigrams,
+)
+
+NAMES = ["identify", "list-aliases", "migrate", "id", "ls", "idle"]
+
+
+def test_get_trigrams() -> None:
+    assert get_trigrams("id") == {"  i", " id", "id "}
+    assert get_trigrams("") == {"   "}
+
+
+@pytest.mark.parametrize(
+    "first, second, distance",
+    [
+        ("identify", "identify", 0),
+        ("idnetify", "identify", 1),
+        ("identfy", "identify", 1),
+        ("identifyy", "identify", 1),
+        ("kitten", "sitting", 3),
+        ("", "ls", 2),
+        ("ls", "", 2),
+    ],
+)
+def test_get_distance(first: str, second: str, distance: int) -> None:
+    assert get_distance(first, second) == distance
+
+
+@pytest.mark.parametrize(
+    "word, distance", [("", 1), ("ls", 1), ("identify", 2), ("x" * 30, 3)]
+)
+def test_get_max_distance(word: str, distance: int) -> None:
+    assert get_max_distance(word) == distance
+
+
+@pytest.mark.parametrize(
+    "word, suggestions",
+    [
+        ("idnetify", ["identify"]),
+        ("list-alias", ["list-aliases"]),
+        ("lss", ["ls"]),
+        ("idl", ["id", "idle"]),
+        ("batmobile", []),
+    ],
+)
+def test_suggest(word: str, suggestions: List[str]) -> None:
+    index = SuggestionIndex(NAMES)
+    assert len(index) == len(NAMES)
+    assert index.suggest(word) == suggestions
+
+
+def test_suggest_with_limit() -> None:
+    assert SuggestionIndex(NAMES).suggest("idl", limit=1) == ["id"]
+
+
+@pytest.mark.parametrize(
+    "word, suggestion",
+    [
+        ("migrat", "migrate"),
+        ("migrate-1000", "migrate-000"),
+        ("migrrate-042", "migrate-042"),
+    ],
+)
+def test_suggest_compares_only_most_similar_names(
+    word: str, suggestion: str
+) -> None:
+    names = [f"migrate-{index:03}" for index in range(MAX_CANDIDATES * 5)]
+    suggestions = SuggestionIndex([*names, "migrate"]).suggest(word)
+    assert suggestions[0] == suggestion
+    assert all(
+        get_distance(word, name) <= get_max_distance(word)
+        for name in suggestions
+    )
@@ -0,0 +1,44 @@
+from typing import List, Optional
+
+import pytest
+
+from cly.trie import PrefixTrie
+
+NAMES = ["identify", "id", "idle", "list_aliases"]
+
+
+def test_prefix_trie_counts_names_once() -> None:
+    trie = PrefixTrie(NAMES)
+    trie.add("idle")
+    assert len(trie) == len(NAMES)
+    assert len(PrefixTrie()) == 0
+
+
+@pytest.mark.parametrize(
+    "prefix, name",
+    [
+        ("ide", "identify"),
+        ("identify", "identify"),
+        ("id", "id"),
+        ("idl", "idle"),
+        ("l", "list_aliases"),
+        ("i", None),
+        ("identifyy", None),
+        ("batmobile", None),
+    ],
+)
+def test_resolve(prefix: str, name: Optional[str]) -> None:
+    assert PrefixTrie(NAMES).resolve(prefix) == name
+
+
+@pytest.mark.parametrize(
+    "prefix, names",
+    [
+        ("i", ["id", "identify", "idle"]),
+        ("ide", ["identify"]),
+        ("", ["id", "identify", "idle", "list_aliases"]),
+        ("batmobile", []),
+    ],
+)
+def test_complete(prefix: str, names: List[str]) -> None:
+    assert PrefixTrie(NAMES).complete(prefix) == names